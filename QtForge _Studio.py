@@ -4,14 +4,15 @@ A professional Qt application for embedding external Python-Qt modules at runtim
 Complete with auto-reload functionality and detachable renderer.
 """
 
+import                                  time
+_STARTED = time.perf_counter()          # startup probe reference point
+
 import                                  sys
 import                                  os
-import                                  psutil
-import                                  configparser
 from pathlib                    import Path
-from typing                     import Optional, Any
+from typing                     import Optional, Any, TYPE_CHECKING
 from PyQt6.QtCore               import (Qt, QTimer, QSettings, 
-                                        QFileSystemWatcher, QDateTime, pyqtSlot)
+                                        QFileSystemWatcher, pyqtSlot)
 from PyQt6.QtWidgets            import (
                                         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                         QPushButton, QLabel, QFrame, QFileDialog, QMenu,
@@ -20,25 +21,50 @@ from PyQt6.QtGui                import (QFont, QIcon, QAction)
 
 # custom classes
 from libs.Detachablerenderer    import DetachableRenderer
-from libs.Sourcevalidator       import SourceValidator
 from libs.Safewidgetwrapper     import SafeWidgetWrapper
 from libs.stylesheetModefier    import StylesheetModifier
 from libs.Errorlogview          import ErrorLogView
 from libs.Databasconnector      import DatabaseConnector
 from libs.Globalenentfilter     import GlobalEventFilter
+from libs.Sourceindex           import SourceIndex, SourceIndexer
+from libs.Quicklauncher         import QuickLauncher
+from libs.Sourcemanifest        import SourceManifest, ManifestError, find_manifest
+from libs.Resourcemonitor       import ResourceMonitor
+from libs.Leakdetector          import LeakDetector
+
+# Not needed for the first frame: the validator stack (pyflakes, dependency
+# checker) and psutil are imported on first use
+if TYPE_CHECKING:
+    from libs.Sourcevalidator   import SourceValidator
 
 # ----------------- Main Application -----------------
 class MainWindow(QMainWindow):
-    def __init__(self):
+    LEAK_CHECK_DELAY_MS = 1000  # after a swap, before checking the previous source is gone
+
+    def __init__(self, restore: Optional[str] = None):
+        """
+        restore: how to reopen the last source on launch - "prewarm"
+        (validate and import it while the window is built), "sequential"
+        (load it after the window is shown) or "off". Defaults to the
+        "session/restore_last" setting: off, or sequential when enabled.
+        Pre-warm is opt-in (--restore-last=prewarm): it gains 0-16% at
+        best and runs the source's module code before the window exists.
+        """
         super().__init__()
         self.current_source: Optional[Path] = None
+        self.current_manifest: Optional[SourceManifest] = None
         self.current_module: Optional[Any] = None
-        self.validator_thread: Optional[SourceValidator] = None
+        self.validator_thread: Optional["SourceValidator"] = None
         self.hosted_widget: Optional[QWidget] = None
         self.raw_widget: Optional[QWidget] = None
 
-        self.styleSheet_mod = StylesheetModifier("src/styles.qss", self)
-        self.styleSheet_mod.apply_stylesheet()
+        self.settings = QSettings("QtForge_Studio", "HostApp")
+
+        # Applied in scopes by attach() once the UI exists but before it is
+        # shown, so the first polish already uses the final sheets
+        self.styleSheet_mod = StylesheetModifier(
+            "src/styles.qss", themes_path="src/themes.ini",
+            theme=self.settings.value("ui/theme", None, type=str))
 
         self.file_watcher = QFileSystemWatcher()
         self.last_modification: dict[str, float] = {}
@@ -52,30 +78,54 @@ class MainWindow(QMainWindow):
 
         self.db = DatabaseConnector()
         self.db.create_tables_if_not_exist()
+        self.db.get_recent_paths(10)  # warm the recent cache for the menu
+
+        self.source_index = SourceIndex(self.db)
+        self.source_indexer: Optional[SourceIndexer] = None
+        self.quick_launcher: Optional[QuickLauncher] = None
+
+        self.resource_monitor = ResourceMonitor(parent=self)
+        self.resource_panel = None  # built on first use (View -> Resource Monitor)
+        self.leak_detector = LeakDetector()
+        self.leak_detector.add_root(self, "MainWindow")
+        self.process_host = None  # libs.Processhost.ProcessHost, created in isolated mode
+
+        # The last source is validated and imported in the background while
+        # the window is built; the validator's queued signals are delivered
+        # once the event loop runs, so the UI exists by then
+        if restore is None:
+            restore = "sequential" if self.settings.value("session/restore_last", False, type=bool) else "off"
+        prewarmed = self.prewarm_last_source() if restore == "prewarm" else None
 
         self.setup_window()
         self.setup_ui()
+        self.styleSheet_mod.attach(self)
+        self.styleSheet_mod.watch()
         self.setup_connections()
-        self.apply_main_stylesheet()
+        self.start_source_indexing()
+
+        if prewarmed is not None:
+            self.set_current_source(prewarmed)
+            self.set_validating_ui("Restoring last session...")
+        elif restore == "sequential":
+            QTimer.singleShot(0, self.restore_last_source)
 
     # ----------------- Window / UI -----------------
     def setup_window(self):
         self.setWindowIcon(QIcon("img/QtForge Studio.png"))
         self.setWindowTitle("QtForge Studio")
         self.setGeometry(100, 100, 1400, 900)
-        self.settings = QSettings("QtForge_Studio", "HostApp")
         if self.settings.contains("window/geometry"):
             self.restoreGeometry(self.settings.value("window/geometry"))
         if self.settings.contains("window/state"):
             self.restoreState(self.settings.value("window/state"))
 
-    def apply_main_stylesheet(self):
-        self.styleSheet_mod.apply_stylesheet()
-
     def setup_ui(self):
         self.btn_select = QPushButton("📂 Open")
         self.btn_reload = QPushButton("🔄 Reload")
         self.btn_reload.setEnabled(False)
+        self.btn_select.setObjectName("BtnSelect")
+        self.btn_reload.setObjectName("BtnReload")
 
         central_widget = QWidget()
         central_widget.setObjectName("CentralWidget")
@@ -84,7 +134,7 @@ class MainWindow(QMainWindow):
         main_layout.setSpacing(15)
         main_layout.setContentsMargins(15, 15, 15, 15)
 
-        self.renderer = DetachableRenderer(self)
+        self.renderer = DetachableRenderer(parent=self, stylesheet_mod=self.styleSheet_mod)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.renderer)
 
         control_panel = self.create_control_panel()
@@ -105,6 +155,16 @@ class MainWindow(QMainWindow):
         open_action.triggered.connect(self.select_source_folder)
         file_menu.addAction(open_action)
 
+        # --- Quick open (fuzzy search over workspace index) ---
+        quick_open_action = QAction("&Quick Open...", self)
+        quick_open_action.setShortcut("Ctrl+P")
+        quick_open_action.triggered.connect(self.show_quick_launcher)
+        file_menu.addAction(quick_open_action)
+
+        add_root_action = QAction("Add &Workspace Root...", self)
+        add_root_action.triggered.connect(self.add_workspace_root)
+        file_menu.addAction(add_root_action)
+
         # --- Recent files submenu ---
         self.recent_menu = QMenu("&Open Recent", self)
         file_menu.addMenu(self.recent_menu)
@@ -137,7 +197,15 @@ class MainWindow(QMainWindow):
         detach_renderer_action.triggered.connect(self.toggle_detach_renderer)
         reset_layout_action = QAction("&Reset Layout", self)
         reset_layout_action.triggered.connect(self.reset_layout)
-        view_menu.addActions([toggle_renderer_action, detach_renderer_action, reset_layout_action])
+        resource_action = QAction("Resource &Monitor", self)
+        resource_action.setShortcut("Ctrl+M")
+        resource_action.triggered.connect(self.toggle_resource_panel)
+        repaints_action = QAction("Show Re&paints", self)
+        repaints_action.setCheckable(True)
+        repaints_action.setShortcut("Ctrl+Shift+R")
+        repaints_action.toggled.connect(self.renderer.show_repaints)
+        view_menu.addActions([toggle_renderer_action, detach_renderer_action, reset_layout_action, resource_action,
+                              repaints_action])
 
         # ----------------- Settings Menu -----------------
         settings_menu = menubar.addMenu("&Settings")
@@ -146,6 +214,18 @@ class MainWindow(QMainWindow):
         theme_action.triggered.connect(self.toggle_theme)
         settings_menu.addAction(theme_action)
 
+        isolated_action = QAction("Run Sources in Separate &Process", self)
+        isolated_action.setCheckable(True)
+        isolated_action.setChecked(self.isolated)
+        isolated_action.toggled.connect(self.set_isolated)
+        settings_menu.addAction(isolated_action)
+
+        restore_action = QAction("&Reopen Last Source on Launch", self)
+        restore_action.setCheckable(True)
+        restore_action.setChecked(self.settings.value("session/restore_last", False, type=bool))
+        restore_action.toggled.connect(lambda checked: self.settings.setValue("session/restore_last", checked))
+        settings_menu.addAction(restore_action)
+
 
     # ----------------- Populate Recent Menu -----------------
     def populate_recent_menu(self):
@@ -201,20 +281,37 @@ class MainWindow(QMainWindow):
         status_bar.addWidget(self.watcher_status_label)
         self.memory_label = QLabel("")
         status_bar.addPermanentWidget(self.memory_label)
-        timer = QTimer()
-        timer.timeout.connect(self.update_memory_usage)
-        timer.start(5000)
-        self.update_memory_usage()
 
-    def update_memory_usage(self):
-        try:
-            mem = psutil.Process().memory_info().rss / 1024 / 1024
-            self.memory_label.setText(f"🧠 {mem:.1f} MB")
-        except ImportError:
+        # Sampling runs on the monitor thread; Qt object counts need the GUI
+        # thread. Both start after the window is up (the thread imports psutil)
+        self.resource_monitor.sample_added.connect(self.update_memory_usage)
+        self.qt_count_timer = QTimer(self)
+        self.qt_count_timer.setInterval(2000)
+        self.qt_count_timer.timeout.connect(self.resource_monitor.update_qt_counts)
+        QTimer.singleShot(1000, self.start_resource_monitor)
+
+    def start_resource_monitor(self):
+        self.resource_monitor.update_qt_counts()
+        self.qt_count_timer.start()
+        self.resource_monitor.start()
+
+    def update_memory_usage(self, sample):
+        if sample.rss_mb:
+            self.memory_label.setText(f"🧠 {sample.rss_mb:.1f} MB · {sample.cpu_percent:.0f}% CPU")
+        else:
             self.memory_label.setText("🧠 N/A")
 
+    def toggle_resource_panel(self):
+        if self.resource_panel is None:
+            from libs.Resourcepanel import ResourcePanel
+            self.resource_panel = ResourcePanel(self.resource_monitor, self)
+            self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.resource_panel)
+            return
+        self.resource_panel.setVisible(not self.resource_panel.isVisible())
+
     def create_control_panel(self) -> QFrame:
         control_panel = QFrame()
+        control_panel.setObjectName("ControlPanel")
         layout = QVBoxLayout(control_panel)
         layout.setSpacing(12)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -223,12 +320,12 @@ class MainWindow(QMainWindow):
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         f = QFont(); f.setPointSize(16); f.setBold(True)
         title.setFont(f)
-        title.setStyleSheet("color: #ffffff; padding: 10px;")
+        title.setObjectName("PanelTitle")
         layout.addWidget(title)
 
         desc = QLabel("Load and host external Python-Qt applications dynamically")
         desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        desc.setStyleSheet("color: #cbd5e0; padding-bottom: 15px;")
+        desc.setObjectName("PanelSubtitle")
         layout.addWidget(desc)
 
         btn_layout = QHBoxLayout()
@@ -240,20 +337,25 @@ class MainWindow(QMainWindow):
         layout.addLayout(btn_layout)
 
         self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("ValidationProgress")
         self.progress_bar.hide()
         layout.addWidget(self.progress_bar)
 
         status_layout = QHBoxLayout()
         self.lbl_status = QLabel("No source loaded")
+        self.lbl_status.setObjectName("StatusLabel")
         status_layout.addWidget(self.lbl_status)
         status_layout.addStretch()
         self.auto_reload_check = QCheckBox("⏰ Auto-reload on file change")
+        self.auto_reload_check.setObjectName("AutoReloadCheck")
         status_layout.addWidget(self.auto_reload_check)
         layout.addLayout(status_layout)
 
         source_group = QGroupBox("📄 Source Information")
+        source_group.setObjectName("SourceInfoGroup")
         g_layout = QVBoxLayout()
         self.source_info_label = QLabel("No source selected")
+        self.source_info_label.setObjectName("SourceInfoLabel")
         self.source_info_label.setWordWrap(True)
         self.watched_files_label = QLabel("Watching 0 files")
         g_layout.addWidget(self.source_info_label)
@@ -282,29 +384,38 @@ class MainWindow(QMainWindow):
         if folder:
             self.load_source(Path(folder))
 
+    @staticmethod
+    def find_source_manifest(folder_path: Path) -> Optional[SourceManifest]:
+        """Accept a manifest directly (quick launcher / recent) or a folder."""
+        if folder_path.suffix == ".ini":
+            return SourceManifest.load(folder_path)
+        return find_manifest(folder_path)
+
     def load_source(self, folder_path: Path):
-        print(folder_path)
-        ini_files = list(folder_path.glob("*.ini"))
-        if not ini_files:
-            self.error_view.log_error(f"No Config Files No .ini config files found in {folder_path}")
+        source_ref = folder_path
+        try:
+            manifest = self.find_source_manifest(folder_path)
+        except (OSError, ManifestError) as e:
+            self.error_view.log_error(f"Invalid Config {e}")
             return
-        self.db.insert_path(folder_path, self.get_curr_date_time())
-
-        config_file = ini_files[0]
-        config = configparser.ConfigParser()
-        config.read(config_file)
-        module_name = config.get('source', 'module', fallback=None)
-        if not module_name:
-            self.error_view.log_error(f"Invalid Config module specified in {config_file.name}")
+        if manifest is None:
+            self.error_view.log_error(f"No Config Files No .ini config files found in {folder_path}")
             return
+        self.db.insert_path(source_ref)
 
-        module_path = folder_path / f"{module_name}.py"
+        module_path = manifest.module_path
         if not module_path.exists():
-            self.error_view.log_error(f"Module Not Found {module_name}.py not found in {folder_path}")
+            self.error_view.log_error(f"Module Not Found {module_path.name} not found in {manifest.folder}")
             return
 
+        self.set_current_source(manifest)
+        self.start_validation(module_path)
+
+    def set_current_source(self, manifest: SourceManifest):
+        module_path = manifest.module_path
         self.current_source = module_path
-        self.source_info_label.setText(f"📄 Source: {module_path.name}\n⚙️ Config: {config_file.name}\n📁 Path: {module_path.parent}")
+        self.current_manifest = manifest
+        self.source_info_label.setText(f"📄 Source: {module_path.name}\n⚙️ Config: {manifest.path.name}\n📁 Path: {module_path.parent}")
 
         # Add to recent files
         if module_path in self.recent_files:
@@ -313,39 +424,132 @@ class MainWindow(QMainWindow):
         if len(self.recent_files) > 10:
             self.recent_files.pop()
 
-        self.start_validation(module_path)
+    # ----------------- Session restore -----------------
+    def last_source_path(self) -> Optional[Path]:
+        recent = self.db.get_recent_paths(1, order="recent")
+        return Path(recent[0]) if recent else None
+
+    def prewarm_last_source(self) -> Optional[SourceManifest]:
+        """
+        Start validating the last opened source before the UI is built.
+        Returns its manifest, or None when there is nothing usable to restore.
+        """
+        path = self.last_source_path()
+        if path is None:
+            return None
+        try:
+            manifest = self.find_source_manifest(path)
+        except (OSError, ManifestError) as e:
+            print(f"[Session] Not restoring {path}: {e}")
+            return None
+        if manifest is None or not manifest.module_path.exists():
+            return None
+        self.db.insert_path(path)
+        self.current_manifest = manifest
+        self.start_validator(manifest.module_path)
+        return manifest
+
+    def restore_last_source(self):
+        path = self.last_source_path()
+        if path is not None:
+            self.load_source(path)
+
+    # ----------------- Workspace index -----------------
+    def workspace_roots(self) -> list[str]:
+        roots = self.settings.value("workspace/roots", [], type=list)
+        return [r for r in roots if r]
+
+    def add_workspace_root(self):
+        folder = QFileDialog.getExistingDirectory(self, "Add Workspace Root", str(Path.home()))
+        if not folder:
+            return
+        roots = self.workspace_roots()
+        if folder not in roots:
+            roots.append(folder)
+            self.settings.setValue("workspace/roots", roots)
+        self.start_source_indexing()
+
+    def start_source_indexing(self):
+        self.source_index.load()  # last known index is usable right away
+        roots = self.workspace_roots()
+        if not roots:
+            return
+        if self.source_indexer and self.source_indexer.isRunning():
+            self.source_indexer.stop()
+            self.source_indexer.wait()
+        self.source_indexer = SourceIndexer(self.db, roots)
+        self.source_indexer.index_updated.connect(self.on_source_index_updated)
+        self.source_indexer.start()
+
+    @pyqtSlot(int, int)
+    def on_source_index_updated(self, total: int, parsed: int):
+        self.source_index.load()
+        self.ready_label.setText(f"Indexed {total} sources ({parsed} updated)")
+
+    def show_quick_launcher(self):
+        if self.quick_launcher is None:
+            self.quick_launcher = QuickLauncher(self.source_index, self)
+            self.quick_launcher.source_selected.connect(self.load_source)
+        self.quick_launcher.open_launcher()
 
     # ----------------- Validation / Widget -----------------
     def start_validation(self, source_path: Path):
-        if self.validator_thread and self.validator_thread.isRunning():
-            self.validator_thread.stop()
-            self.validator_thread.wait()
+        self.set_validating_ui("Validating source...")
+        self.start_validator(source_path)
 
+    def set_validating_ui(self, message: str):
         self.btn_select.setEnabled(False)
         self.btn_reload.setEnabled(False)
-        self.lbl_status.setText("Validating source...")
+        self.lbl_status.setText(message)
         self.progress_bar.setValue(0)
 
-        self.validator_thread = SourceValidator(source_path)
+    def start_validator(self, source_path: Path):
+        """Start the validation thread; safe to call before the UI exists."""
+        if self.validator_thread and self.validator_thread.isRunning():
+            self.validator_thread.stop()
+            self.validator_thread.wait()
+
+        from libs.Sourcevalidator import SourceValidator
+        # Isolated sources are imported by their own process, never by the host
+        self.validator_thread = SourceValidator(source_path, self.current_manifest,
+                                                import_module=not self.isolated)
         self.validator_thread.preflight_check.connect(self.on_preflight_check)
         self.validator_thread.validation_complete.connect(self.on_validation_complete)
         self.validator_thread.progress_update.connect(self.on_progress_update)
         self.validator_thread.finished.connect(self.on_validation_finished)
         self.validator_thread.start()
 
+    def _from_stale_validator(self) -> bool:
+        """A signal queued by a validator that was stopped and replaced."""
+        return self.sender() is not self.validator_thread
+
     @pyqtSlot(int, str)
     def on_progress_update(self, progress: int, message: str):
+        if self._from_stale_validator():
+            return
         self.progress_bar.setValue(progress)
         self.lbl_status.setText(message if progress < 100 else self.lbl_status.text())
 
     @pyqtSlot(bool, str)
     def on_preflight_check(self, success: bool, message: str):
+        if self._from_stale_validator():
+            return
         color = "#48bb78" if success else "#f56565"
         self.lbl_status.setText(f"<span style='color:{color}'>{message}</span>")
 
     @pyqtSlot(bool, str, object)
     def on_validation_complete(self, success: bool, message: str, module: Any):
-        if success and module:
+        if self._from_stale_validator():
+            return
+        if success and self.isolated:
+            self.start_isolated_source()
+            self.lbl_status.setText(f"<span style='color:#48bb78'>{message}</span>")
+            self.btn_reload.setEnabled(True)
+            if self.auto_reload_check.isChecked():
+                QTimer.singleShot(1000, self.enable_file_watching)
+        elif success and module:
+            if module is not self.current_module:
+                self.release_hosted_source()
             self.current_module = module
             self.instantiate_widget(module)
             self.lbl_status.setText(f"<span style='color:#48bb78'>{message}</span>")
@@ -358,6 +562,8 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot()
     def on_validation_finished(self):
+        if self._from_stale_validator():
+            return
         self.btn_select.setEnabled(True)
         self.progress_bar.hide()
         self.ready_label.setText("Ready")
@@ -372,11 +578,9 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            import configparser
-            config_path = self.current_source.parent / f"{self.current_source.stem}.ini"
-            config = configparser.ConfigParser()
-            config.read(config_path)
-            entry_point = config.get('source', 'entry_point', fallback='main_widget')
+            # Same cached manifest the validator used (re-parsed only if edited)
+            self.current_manifest = SourceManifest.load(self.current_manifest.path)
+            entry_point = self.current_manifest.entry_point
             widget_factory = getattr(module, entry_point, None)
 
             if not widget_factory:
@@ -396,12 +600,77 @@ class MainWindow(QMainWindow):
             self.hosted_widget = safe_widget
             self.raw_widget = widget
             self.ready_label.setText(f"✅ Hosting: {widget.__class__.__name__}")
+            # Marked once the previous widget's deleteLater() has run, so the
+            # counts compare one hosted tree with the next
+            label = f"{self.current_manifest.module}.{entry_point}"
+            QTimer.singleShot(500, lambda: self.resource_monitor.mark(label))
+            previous = self.leak_detector.swap(label, safe_widget, widget, module)
+            del widget, safe_widget  # the detector must not find this frame's locals
+            QTimer.singleShot(self.LEAK_CHECK_DELAY_MS, lambda: self.check_leaks(previous))
 
         except Exception as e:
             self.error_view.log_error(f"Widget Instantiation Failed {str(e)}")
             self.lbl_status.setText("<span style='color:#f56565'>Widget creation failed</span>")
             self.renderer.clear()
 
+    # ----------------- Out-of-process hosting -----------------
+    @property
+    def isolated(self) -> bool:
+        return self.settings.value("host/isolated", False, type=bool)
+
+    def set_isolated(self, enabled: bool):
+        self.settings.setValue("host/isolated", enabled)
+        if not enabled and self.process_host is not None:
+            self.process_host.stop()
+        self.ready_label.setText("Sources run in a separate process" if enabled else "Sources run in the host")
+        if self.current_source:
+            self.reload_source()
+
+    def start_isolated_source(self):
+        """Start (or recycle) the child process for the current source."""
+        if self.process_host is None:
+            from libs.Processhost import ProcessHost
+            self.process_host = ProcessHost(self, transport=self.settings.value("host/transport", "auto"))
+            self.process_host.ready.connect(self.on_isolated_ready)
+            self.process_host.failed.connect(self.on_isolated_failed)
+            self.process_host.crashed.connect(self.on_isolated_failed)
+            self.process_host.output.connect(lambda line: print(f"[Source] {line}"))
+        self.release_hosted_source()
+        self.renderer.clear()
+        self.ready_label.setText("Starting source process...")
+        self.process_host.start(self.current_manifest)
+
+    def on_isolated_ready(self, container: QWidget, info: dict):
+        self.renderer.host_widget(container)
+        self.hosted_widget = container
+        self.ready_label.setText(f"✅ Hosting: {info.get('cls', 'widget')} (pid {info.get('pid')})")
+        label = f"{self.current_manifest.module}.{self.current_manifest.entry_point} (process)"
+        QTimer.singleShot(500, lambda: self.resource_monitor.mark(label))
+
+    def on_isolated_failed(self, message: str):
+        self.error_view.log_error(message)
+        self.lbl_status.setText("<span style='color:#f56565'>Source process failed</span>")
+        self.hosted_widget = None
+        self.renderer.clear()
+
+    def release_hosted_source(self):
+        """Drop every host-side reference to the hosted source before the next one."""
+        self.raw_widget = None
+        self.hosted_widget = None
+        module, self.current_module = self.current_module, None
+        if module is not None and sys.modules.get(module.__name__) is module:
+            del sys.modules[module.__name__]
+
+    def check_leaks(self, generation):
+        report = self.leak_detector.check(generation)
+        if report is None or not report.leaked:
+            return
+        print(f"[LeakDetector] {report.format()}")
+        name, chain = report.leaked[0]
+        self.error_view.log_warning(
+            f"Reload leak: {len(report.leaked)} object(s) of {report.label} still alive, "
+            f"e.g. {name} held by {' -> '.join(chain) or 'an unknown referrer'}")
+
     # ----------------- Auto-reload -----------------
     def on_auto_reload_changed(self, state):
         if state == Qt.CheckState.Checked.value:
@@ -470,8 +739,9 @@ class MainWindow(QMainWindow):
         try:
             self.renderer.begin_update()
             self.renderer.clear()
-            if self.current_source:
-                mod_name = self.current_source.stem
+            self.release_hosted_source()
+            if self.current_manifest:
+                mod_name = self.current_manifest.module
                 if mod_name in sys.modules:
                     del sys.modules[mod_name]
             self.start_validation(self.current_source)
@@ -496,19 +766,26 @@ class MainWindow(QMainWindow):
         self.showNormal()
 
     def toggle_theme(self):
-        self.styleSheet_mod.toggle_theme()
-
-    def get_curr_date_time(self) -> str:
-        now = QDateTime.currentDateTime()
-        return now.toString("yyyy-MM-dd HH:mm:ss")
+        theme = self.styleSheet_mod.toggle_theme()
+        if theme:
+            self.settings.setValue("ui/theme", theme)
+            self.ready_label.setText(f"Theme: {theme}")
 
     def closeEvent(self, event):
         self.settings.setValue("window/geometry", self.saveGeometry())
         self.settings.setValue("window/state", self.saveState())
         self.disable_file_watching()
+        if self.source_indexer and self.source_indexer.isRunning():
+            self.source_indexer.stop()
+            self.source_indexer.wait()
         if self.validator_thread and self.validator_thread.isRunning():
             self.validator_thread.stop()
             self.validator_thread.wait()
+        if self.process_host is not None:
+            self.process_host.stop()
+        self.qt_count_timer.stop()
+        self.resource_monitor.stop()
+        self.resource_monitor.wait()
         super().closeEvent(event)
 
 
@@ -516,6 +793,17 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     event_filter = GlobalEventFilter()
     app.installEventFilter(event_filter)
-    win = MainWindow()
+    # --restore-last[=prewarm|sequential] / --no-restore override the setting
+    restore = None
+    for arg in sys.argv[1:]:
+        if arg == "--no-restore":
+            restore = "off"
+        elif arg.startswith("--restore-last"):
+            restore = arg.partition("=")[2] or "sequential"
+    win = MainWindow(restore)
+    if os.environ.get("QTFORGE_STARTUP_PROBE"):
+        from libs.Startupprobe import FirstFrameProbe
+        probe_mode = os.environ["QTFORGE_STARTUP_PROBE"]
+        FirstFrameProbe(win, _STARTED, quit_after=probe_mode == "exit", wait_for_source=probe_mode == "usable")
     win.show()
     sys.exit(app.exec())
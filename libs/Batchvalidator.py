@@ -0,0 +1,307 @@
+"""
+Headless batch validation of every source under one or more roots.
+
+    python -m libs.Batchvalidator ROOT [ROOT ...] --jobs 8 --json results.json --junit results.xml
+
+Runs the SourceValidator stages (config, declared dependencies, module
+file, syntax, pyflakes, static entry point check, import, entry point
+and, with --instantiate, the widget itself under QT_QPA_PLATFORM=offscreen)
+for each `[source]` manifest in a pool of worker processes, and reports
+per-stage timings. A source still running after --timeout seconds has
+its worker killed and fails at the stage it was in.
+Exit code 0 when every source passes, 1 otherwise.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import traceback
+import multiprocessing
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import NamedTuple, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from libs.Sourcevalidator import (StageFailed, stage_config, stage_dependencies, stage_module_file,
+                                  stage_syntax, stage_static, stage_entry_point_static, stage_import,
+                                  stage_entry_point, stage_instantiate)
+
+
+class StageTiming(NamedTuple):
+    stage: str
+    ok: bool
+    seconds: float
+
+
+class SourceResult(NamedTuple):
+    manifest: str
+    module: str
+    entry_point: str
+    ok: bool
+    failed_stage: str         # "" when ok
+    message: str              # preflight detail of the failure
+    trace: str                # traceback raised by the source, if any
+    seconds: float
+    stages: list[StageTiming]
+
+    def to_dict(self) -> dict:
+        data = self._asdict()
+        data["stages"] = [s._asdict() for s in self.stages]
+        return data
+
+
+# ----------------- Worker -----------------
+_index = None      # DistributionIndex with the parent's scan
+_app = None        # QApplication of the worker
+_progress = None   # Connection told each stage as it starts, when run alone
+
+DEFAULT_TIMEOUT = 120.0   # seconds per source
+TIMEOUT_EXIT = 75         # exit code of a worker killed by its watchdog
+
+
+def _init_worker(distributions: dict[str, str], import_module: bool):
+    global _index, _app
+    sys.stdout = sys.stderr   # whatever sources print must not mix with `--json -`
+    from libs.Dependencychecker import DistributionIndex
+    _index = DistributionIndex(mapping=distributions)
+    if import_module:
+        # Sources may build widgets at import time, as they can in the studio
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        _app = QApplication.instance() or QApplication([sys.argv[0]])
+
+
+def validate_source(config_path: str, import_module: bool = True, instantiate: bool = False,
+                    index=None) -> SourceResult:
+    """Run the stages for one manifest; the modules it loaded from its folder are dropped afterwards."""
+    started = time.perf_counter()
+    timings: list[StageTiming] = []
+    module_name = entry_point = ""
+
+    def timed(stage: str, func, *args):
+        if _progress is not None:
+            _progress.send(stage)
+        t0 = time.perf_counter()
+        try:
+            value = func(*args)
+        except StageFailed:
+            timings.append(StageTiming(stage, False, time.perf_counter() - t0))
+            raise
+        except Exception as e:
+            timings.append(StageTiming(stage, False, time.perf_counter() - t0))
+            raise StageFailed(f"Unexpected error: {e}", "Validation crashed", traceback.format_exc()) from e
+        timings.append(StageTiming(stage, True, time.perf_counter() - t0))
+        return value
+
+    before = set(sys.modules)
+    try:
+        manifest = timed("config", stage_config, Path(config_path))
+        module_name, entry_point = manifest.module, manifest.entry_point
+        timed("dependencies", stage_dependencies, manifest, index or _index)
+        module_path = timed("module", stage_module_file, manifest)
+        timed("syntax", stage_syntax, module_path)
+        timed("static", stage_static, module_path)
+        timed("entry_static", stage_entry_point_static, module_path, entry_point)
+        if import_module:
+            module = timed("import", stage_import, manifest)
+            factory = timed("entry_point", stage_entry_point, module, entry_point)
+            if instantiate:
+                _dispose(timed("instantiate", stage_instantiate, factory))
+    except StageFailed as e:
+        return SourceResult(config_path, module_name, entry_point, False, timings[-1].stage,
+                            e.detail, e.trace, time.perf_counter() - started, timings)
+    finally:
+        _drop_source_modules(before, module_name, Path(config_path).parent)
+    return SourceResult(config_path, module_name, entry_point, True, "", "", "",
+                        time.perf_counter() - started, timings)
+
+
+def _drop_source_modules(before: set[str], module_name: str, folder: Path):
+    """
+    Workers are reused: the next source must not see this one's modules.
+    Only the source and what was imported from its folder are dropped;
+    C extensions such as numpy cannot be loaded twice in one process, and
+    site-packages, the stdlib and libs.* stay warm for the next source.
+    """
+    folder = folder.resolve()
+    for name in set(sys.modules) - before:
+        module = sys.modules.get(name)
+        file = getattr(module, "__file__", None)
+        if name == module_name or (file and Path(file).resolve().is_relative_to(folder)):
+            sys.modules.pop(name, None)
+
+
+def _validate_task(config_path: str, import_module: bool, instantiate: bool, timeout: float) -> SourceResult:
+    """validate_source() in a pool worker, which exits if the source hangs so the pool cannot stall."""
+    watchdog = threading.Timer(timeout, os._exit, (TIMEOUT_EXIT,))
+    watchdog.daemon = True
+    watchdog.start()
+    try:
+        return validate_source(config_path, import_module, instantiate)
+    finally:
+        watchdog.cancel()
+
+
+def _validate_alone(connection, distributions: dict[str, str], config_path: str, import_module: bool,
+                    instantiate: bool):
+    global _progress
+    _init_worker(distributions, import_module)
+    _progress = connection
+    connection.send(validate_source(config_path, import_module, instantiate))
+
+
+def _dispose(widget):
+    from PyQt6.QtCore import QCoreApplication, QEvent
+    widget.close()
+    widget.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+# ----------------- Pool -----------------
+def validate_all(paths: list[str], jobs: int, import_module: bool = True, instantiate: bool = False,
+                 timeout: float = DEFAULT_TIMEOUT) -> list[SourceResult]:
+    """
+    Validate `paths` in `jobs` worker processes. A source that kills its
+    worker is reported as crashed, one still running after `timeout`
+    seconds as timed out.
+    """
+    from libs.Dependencychecker import DistributionIndex
+    distributions = DistributionIndex.scan()   # once, instead of once per worker
+    context = multiprocessing.get_context("spawn")
+    results: dict[str, SourceResult] = {}
+    crashed: list[str] = []
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs), mp_context=context, initializer=_init_worker,
+                             initargs=(distributions, import_module)) as pool:
+        futures = {pool.submit(_validate_task, path, import_module, instantiate, timeout): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except BrokenProcessPool:
+                crashed.append(futures[future])
+
+    # A dead worker fails every task it shared the pool with; rerun those alone to find the culprit
+    for path in crashed:
+        results[path] = _run_alone(context, distributions, path, import_module, instantiate, timeout)
+    return [results[path] for path in paths]
+
+
+def _run_alone(context, distributions: dict[str, str], path: str, import_module: bool, instantiate: bool,
+               timeout: float) -> SourceResult:
+    """One source in its own process, killed after `timeout`; reports the stage it crashed or hung in."""
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_validate_alone,
+                              args=(sender, distributions, path, import_module, instantiate), daemon=True)
+    started = time.perf_counter()
+    process.start()
+    sender.close()
+    stage, deadline, timed_out = "process", started + timeout, False
+    try:
+        while True:
+            left = deadline - time.perf_counter()
+            if left <= 0 or not receiver.poll(left):
+                timed_out = True
+                break
+            message = receiver.recv()
+            if not isinstance(message, str):   # the SourceResult
+                process.join()
+                return message
+            stage = message
+    except EOFError:
+        pass   # died without a result
+    finally:
+        receiver.close()
+    elapsed = time.perf_counter() - started
+    if timed_out:
+        process.kill()
+        process.join()
+        return SourceResult(path, "", "", False, stage, f"Timed out after {timeout:g} s (process killed)",
+                            "", elapsed, [StageTiming(stage, False, elapsed)])
+    process.join()
+    return SourceResult(path, "", "", False, stage,
+                        f"The validation process crashed (exit code {process.exitcode})", "", elapsed,
+                        [StageTiming(stage, False, elapsed)])
+
+
+# ----------------- Reports -----------------
+def write_json(results: list[SourceResult], target: str, elapsed: float, jobs: int):
+    report = {
+        "passed": sum(r.ok for r in results),
+        "failed": sum(not r.ok for r in results),
+        "jobs": jobs,
+        "seconds": round(elapsed, 3),
+        "results": [r.to_dict() for r in results],
+    }
+    text = json.dumps(report, indent=2)
+    if target == "-":
+        print(text)
+    else:
+        Path(target).write_text(text, encoding="utf-8")
+
+
+def write_junit(results: list[SourceResult], target: str, elapsed: float):
+    suite = ET.Element("testsuite", name="qtforge.validate", tests=str(len(results)),
+                       failures=str(sum(not r.ok for r in results)), errors="0", time=f"{elapsed:.3f}")
+    for result in results:
+        path = Path(result.manifest)
+        case = ET.SubElement(suite, "testcase", classname=path.parent.name or "sources",
+                             name=f"{result.module or path.stem}.{result.entry_point}".rstrip("."),
+                             file=result.manifest, time=f"{result.seconds:.3f}")
+        if not result.ok:
+            failure = ET.SubElement(case, "failure", type=result.failed_stage,
+                                    message=result.message.splitlines()[0] if result.message else "")
+            failure.text = result.message + (f"\n\n{result.trace}" if result.trace else "")
+        out = ET.SubElement(case, "system-out")
+        out.text = "\n".join(f"{s.stage}: {s.seconds * 1000:.1f} ms{'' if s.ok else ' (failed)'}"
+                             for s in result.stages)
+    ET.ElementTree(suite).write(target, encoding="utf-8", xml_declaration=True)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m libs.Batchvalidator", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("roots", nargs="+", type=Path, help="Folders to search for source manifests")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--json", metavar="PATH", help="Write a JSON report ('-' for stdout)")
+    parser.add_argument("--junit", metavar="PATH", help="Write a JUnit XML report")
+    parser.add_argument("--instantiate", action="store_true",
+                        help="Also build each entry point widget (offscreen)")
+    parser.add_argument("--no-import", action="store_true",
+                        help="Static stages only: never import a source")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="Seconds per source before its worker is killed (default %(default)g)")
+    args = parser.parse_args(argv)
+    if args.instantiate and args.no_import:
+        parser.error("--instantiate needs the import stage")
+
+    from libs.Sourceindex import find_manifests
+    started = time.perf_counter()
+    paths = [str(m.path) for root in args.roots for m in find_manifests(root)]
+    if not paths:
+        print("No source manifests found")
+        return 1
+    results = validate_all(paths, args.jobs, not args.no_import, args.instantiate, args.timeout)
+    elapsed = time.perf_counter() - started
+
+    quiet = args.json == "-"
+    if not quiet:
+        for result in results:
+            status = "PASS" if result.ok else f"FAIL [{result.failed_stage}]"
+            print(f"{status:<22} {result.manifest}")
+            if not result.ok:
+                for line in result.message.splitlines():
+                    print(f"    {line}")
+        failed = sum(not r.ok for r in results)
+        print(f"\n{len(results) - failed} passed, {failed} failed in {elapsed:.1f} s ({args.jobs} jobs)")
+    if args.json:
+        write_json(results, args.json, elapsed, args.jobs)
+    if args.junit:
+        write_junit(results, args.junit, elapsed)
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
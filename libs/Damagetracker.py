@@ -0,0 +1,140 @@
+"""
+Damage tracking for animated widgets: repaint what moved, not the widget.
+
+Each frame the widget reports the bounding boxes of its moving items
+under a name; the tracker adds the boxes the same items had last frame
+(where they must be erased), snaps everything to a grid of `tile`-pixel
+tiles and issues one `update(region)` with the merged tiles. Above
+`full_ratio` of the widget it falls back to a plain `update()`, which is
+cheaper than a fragmented region. Paint code is clipped to the region by
+Qt; `event.region()` tells it which part to redraw.
+
+    self.damage = DamageTracker(self)
+    ...
+    # per tick, after moving things
+    self.damage.track("particles", *self.engine.bounds())
+    self.damage.flush()
+"""
+from typing import Optional
+
+import numpy as np
+from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QRegion
+from PyQt6.QtWidgets import QWidget
+
+Boxes = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]   # x0, y0, x1, y1 (exclusive)
+
+
+class DamageTracker:
+    """Per-frame damage of one widget; `saved_ratio` is the share of pixels not repainted so far."""
+
+    def __init__(self, widget: QWidget, tile: int = 16, full_ratio: float = 0.6):
+        self.widget = widget
+        self.tile = tile
+        self.full_ratio = full_ratio
+        self._previous: dict[str, Boxes] = {}
+        self._pending: list[Boxes] = []
+        self._full = True          # the first frame paints everything
+        self.last_ratio = 1.0      # share of the widget repainted by the last flush
+        self.frames = 0
+        self.saved_pixels = 0      # against a full update every frame
+        self.total_pixels = 0
+
+    # ----------------- Recording -----------------
+    def track(self, name: str, x0, y0, x1, y1):
+        """This frame's boxes of the items called `name`; last frame's are damaged too."""
+        boxes = tuple(np.asarray(v, dtype=np.float64) for v in (x0, y0, x1, y1))
+        previous = self._previous.get(name)
+        if previous is not None:
+            self._pending.append(previous)
+        self._pending.append(boxes)
+        self._previous[name] = boxes
+
+    def forget(self, name: str):
+        """Items `name` are gone: erase where they were drawn last."""
+        previous = self._previous.pop(name, None)
+        if previous is not None:
+            self._pending.append(previous)
+
+    def add_rect(self, rect: QRect):
+        self._pending.append(tuple(np.array([v], dtype=np.float64) for v in
+                                   (rect.x(), rect.y(), rect.x() + rect.width(), rect.y() + rect.height())))
+
+    def invalidate(self):
+        """Repaint everything on the next flush (resize, style or state change)."""
+        self._full = True
+
+    # ----------------- Flushing -----------------
+    def flush(self) -> Optional[QRegion]:
+        """Issue the update for this frame; returns the region, or None for a full update."""
+        w, h = self.widget.width(), self.widget.height()
+        boxes, self._pending = self._pending, []
+        total = w * h
+        if not total:
+            return None
+        if self._full or not boxes:
+            full, self._full = self._full, False
+            if full:
+                self._account(total, total)
+                self.widget.update()
+            return None
+
+        grid = self.tile_grid(boxes, w, h)
+        dirty = int(grid.sum()) * self.tile * self.tile
+        if dirty >= total * self.full_ratio:
+            self._account(total, total)
+            self.widget.update()
+            return None
+        region = self.grid_region(grid, w, h)
+        self._account(min(dirty, total), total)
+        self.widget.update(region)
+        return region
+
+    def tile_grid(self, boxes: list[Boxes], w: int, h: int) -> np.ndarray:
+        """Boolean (rows, cols) grid of the tiles any box touches."""
+        tile = self.tile
+        rows, cols = -(-h // tile), -(-w // tile)
+        x0, y0, x1, y1 = (np.concatenate(parts) for parts in zip(*boxes))
+        # Whole tiles, clipped to the widget; empty boxes and boxes outside are dropped
+        c0 = np.clip(np.floor(x0 / tile), 0, cols).astype(np.intp)
+        c1 = np.clip(np.ceil(x1 / tile), 0, cols).astype(np.intp)
+        r0 = np.clip(np.floor(y0 / tile), 0, rows).astype(np.intp)
+        r1 = np.clip(np.ceil(y1 / tile), 0, rows).astype(np.intp)
+        keep = (c1 > c0) & (r1 > r0)
+        c0, c1, r0, r1 = c0[keep], c1[keep], r0[keep], r1[keep]
+        # 2-D difference array: +1 at each box's top-left, -1 past its edges, then prefix sums
+        diff = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+        np.add.at(diff, (r0, c0), 1)
+        np.add.at(diff, (r0, c1), -1)
+        np.add.at(diff, (r1, c0), -1)
+        np.add.at(diff, (r1, c1), 1)
+        return diff.cumsum(axis=0).cumsum(axis=1)[:rows, :cols] > 0
+
+    def grid_region(self, grid: np.ndarray, w: int, h: int) -> QRegion:
+        """One rect per run of dirty tiles in each row, in the y-x band order `setRects()` needs."""
+        tile = self.tile
+        padded = np.zeros((grid.shape[0], grid.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = grid
+        edges = np.diff(padded, axis=1)
+        # Row-major, so starts and ends pair up run by run, already in band order
+        rows, starts = np.nonzero(edges == 1)
+        ends = np.nonzero(edges == -1)[1]
+        tops = rows * tile
+        lefts = starts * tile
+        widths = np.minimum(ends * tile, w) - lefts
+        heights = np.minimum(tops + tile, h) - tops
+        rects = [QRect(*r) for r in zip(lefts.tolist(), tops.tolist(), widths.tolist(), heights.tolist())]
+        region = QRegion()
+        region.setRects(rects)
+        return region
+
+    def _account(self, painted: int, total: int):
+        self.frames += 1
+        self.last_ratio = painted / total
+        self.saved_pixels += total - painted
+        self.total_pixels += total
+
+    @property
+    def saved_ratio(self) -> float:
+        """Share of pixels not repainted so far, against full updates."""
+        return self.saved_pixels / self.total_pixels if self.total_pixels else 0.0
@@ -1,7 +1,21 @@
 import sqlite3
 import os
+import math
+import time
 from pathlib import Path
 
+# Frecency half-life: a visit counts half as much after this many seconds.
+FRECENCY_HALF_LIFE = 7 * 24 * 3600
+FRECENCY_RATE = math.log(2) / FRECENCY_HALF_LIFE
+
+
+def _logaddexp(a: float | None, b: float) -> float:
+    """Numerically stable log(exp(a) + exp(b)); used as a SQLite function."""
+    if a is None:
+        return b
+    hi, lo = (a, b) if a > b else (b, a)
+    return hi + math.log1p(math.exp(lo - hi))
+
 class DatabaseConnector:
     def __init__(self):
         # Use raw string to avoid escape sequence issues
@@ -19,10 +33,15 @@ class DatabaseConnector:
         self.db_path = os.path.join(self.base_path, "QtForge_Studio.db")
         #print(f'Database path: {self.db_path}')
 
+        # In-memory copy of recent queries, keyed by (order, limit).
+        # Cleared on every write so menus never need to hit the disk.
+        self._recent_cache: dict[tuple[str, int], list[str]] = {}
+
     def connect(self):
         '''Connect to the SQLite database.'''
         try:
             conn = sqlite3.connect(self.db_path)
+            conn.create_function("LOGADDEXP", 2, _logaddexp, deterministic=True)
             return conn
         except sqlite3.Error as e:
             print(f"Critical: Error connecting to SQLite database: {e}")
@@ -60,9 +79,39 @@ class DatabaseConnector:
             "RECENT": [
                 "ID INTEGER PRIMARY KEY",
                 "PATH TEXT UNIQUE",
-                "LAST_OPENED TEXT"
+                "LAST_OPENED INTEGER NOT NULL DEFAULT 0",   # epoch seconds
+                "OPEN_COUNT INTEGER NOT NULL DEFAULT 0",
+                "FRECENCY REAL NOT NULL DEFAULT 0"          # log-domain, see insert_path
+            ],
+            # Workspace source index (see libs/Sourceindex.py)
+            "SOURCES": [
+                "ID INTEGER PRIMARY KEY",
+                "MANIFEST TEXT UNIQUE",
+                "FOLDER TEXT",
+                "ROOT TEXT",
+                "MODULE TEXT",
+                "ENTRY_POINT TEXT",
+                "DESCRIPTION TEXT",
+                "MTIME REAL"
+            ],
+            "SOURCE_DIRS": [
+                "PATH TEXT PRIMARY KEY",
+                "PARENT TEXT",
+                "ROOT TEXT",
+                "MTIME REAL"
+            ],
+            # Small key/value cache (e.g. installed distributions, see libs/Dependencychecker.py)
+            "CACHE_META": [
+                "KEY TEXT PRIMARY KEY",
+                "VALUE TEXT"
             ],
         }
+        indexes = {
+            "IDX_RECENT_LAST_OPENED": ("RECENT", "LAST_OPENED DESC"),
+            "IDX_RECENT_FRECENCY": ("RECENT", "FRECENCY DESC"),
+            "IDX_SOURCES_ROOT": ("SOURCES", "ROOT"),
+            "IDX_SOURCE_DIRS_ROOT": ("SOURCE_DIRS", "ROOT"),
+        }
 
         conn = self.connect()
         if conn is None:
@@ -70,51 +119,101 @@ class DatabaseConnector:
 
         try:
             cursor = conn.cursor()
+            # Old schema stored LAST_OPENED as text; move it aside and copy over
+            existing = {row[1] for row in cursor.execute("PRAGMA table_info(RECENT)")}
+            needs_migration = bool(existing) and "FRECENCY" not in existing
+            if needs_migration:
+                cursor.execute("ALTER TABLE RECENT RENAME TO RECENT_OLD")
             for table_name, columns in tables.items():
                 cursor.execute(
                     f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns)})"
                 )
+            for index_name, (table_name, column) in indexes.items():
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({column})"
+                )
+            if needs_migration:
+                self._migrate_recent_table(cursor)
         except sqlite3.Error as e:
             print(f"Error creating tables: {e}")
         finally:
             conn.commit()
             conn.close()
+        self._recent_cache.clear()
 
-
+    def _migrate_recent_table(self, cursor: sqlite3.Cursor):
+        """
+        Upgrade the old RECENT table (LAST_OPENED as 'yyyy-MM-dd HH:mm:ss' text)
+        to epoch integers with open counts and frecency. Must run after the
+        new RECENT table has been created.
+        """
+        cursor.execute(
+            """
+            INSERT OR IGNORE INTO RECENT (PATH, LAST_OPENED, OPEN_COUNT, FRECENCY)
+            SELECT PATH, EPOCH, 1, ? * EPOCH
+            FROM (
+                SELECT PATH, COALESCE(CAST(strftime('%s', LAST_OPENED) AS INTEGER), 0) AS EPOCH
+                FROM RECENT_OLD
+            )
+            """,
+            (FRECENCY_RATE,)
+        )
+        cursor.execute("DROP TABLE RECENT_OLD")
+        print("[DatabaseConnector] Migrated RECENT table to epoch timestamps")
 
     # ##############################################################################
     # #####                            QUERY                                   #####
     # ##############################################################################
 
-    def insert_path(self, path: str | Path, last_opened: str):
+    def insert_path(self, path: str | Path, opened_at: int | None = None):
         """
-        Save all valid and working paths
+        Save all valid and working paths.
+        Each open bumps OPEN_COUNT and adds exp(rate * opened_at) to the
+        frecency sum. The sum is stored as its logarithm, so ordering by
+        FRECENCY matches ordering by the decayed score at any point in
+        time and can use the index.
         """
+        if opened_at is None:
+            opened_at = int(time.time())
         query = """
-        INSERT OR REPLACE INTO RECENT (PATH, LAST_OPENED)
-        VALUES (?, ?)
+        INSERT INTO RECENT (PATH, LAST_OPENED, OPEN_COUNT, FRECENCY)
+        VALUES (?, ?, 1, ?)
+        ON CONFLICT(PATH) DO UPDATE SET
+            LAST_OPENED = MAX(LAST_OPENED, excluded.LAST_OPENED),
+            OPEN_COUNT  = OPEN_COUNT + 1,
+            FRECENCY    = LOGADDEXP(FRECENCY, excluded.FRECENCY)
         """
         # Convert Path to str if necessary
         path_str = str(path)
-        params = (path_str, last_opened)
+        params = (path_str, opened_at, FRECENCY_RATE * opened_at)
         self.execute_query(query, params)
+        self._recent_cache.clear()
 
-    def get_recent_paths(self, limit: int = 10) -> list[str]:
+    def get_recent_paths(self, limit: int = 10, order: str = "frecency") -> list[str]:
         """
-        Fetch recent paths from the database, sorted by LAST_OPENED descending.
-        Returns a list of paths as strings, up to `limit` entries.
+        Fetch recent paths, ranked by frecency (default) or by LAST_OPENED
+        when order="recent". Returns a list of paths as strings, up to `limit`
+        entries. Results are served from memory until the next write.
         """
+        key = (order, limit)
+        cached = self._recent_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        column = "LAST_OPENED" if order == "recent" else "FRECENCY"
         query = f"""
-        SELECT PATH 
-        FROM RECENT 
-        ORDER BY datetime(LAST_OPENED) DESC
+        SELECT PATH
+        FROM RECENT
+        ORDER BY {column} DESC
         LIMIT ?
         """
         result = self.execute_query(query, (limit,), fetch_all=True)
-        if result:
-            # Each row is a tuple like ('C:/path/to/file',)
-            return [row[0] for row in result]
-        return []
+        if result is None:
+            return []  # Query failed, don't cache the error
+        # Each row is a tuple like ('C:/path/to/file',)
+        paths = [row[0] for row in result]
+        self._recent_cache[key] = paths
+        return list(paths)
 
 
 
@@ -0,0 +1,204 @@
+import os
+import re
+import sys
+import json
+import hashlib
+import platform
+import threading
+from typing import Optional
+
+from libs.Databasconnector import DatabaseConnector
+from libs.Sourcemanifest import SourceManifest
+
+_PRE_RANK = {"dev": -3, "a": -2, "alpha": -2, "b": -1, "beta": -1, "c": 0, "rc": 0, "pre": 0, "preview": 0}
+_VERSION_RE = re.compile(r"^\s*v?(\d+(?:\.\d+)*)(?:[-_.]?(dev|alpha|beta|preview|pre|rc|a|b|c)[-_.]?(\d*))?"
+                         r"(?:[-_.]?(?:post|rev|r)[-_.]?(\d*)|-(\d+))?", re.I)
+_CLAUSE_RE = re.compile(r"^\s*(===|==|!=|~=|>=|<=|>|<)?\s*(.+?)\s*$")
+
+
+def normalize_name(name: str) -> str:
+    """PEP 503 normalisation: 'PyQt6_Charts' -> 'pyqt6-charts'."""
+    return re.sub(r"[-_.]+", "-", name).lower().strip()
+
+
+def parse_version(version: str) -> Optional[tuple[tuple[int, ...], tuple[int, int], int]]:
+    """Return (release, pre, post) for ordering (post is -1 without one), or None if not a version."""
+    m = _VERSION_RE.match(version or "")
+    if not m:
+        return None
+    release = tuple(int(p) for p in m.group(1).split("."))
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+    pre = (_PRE_RANK[m.group(2).lower()], int(m.group(3) or 0)) if m.group(2) else (1, 0)
+    post = m.group(5) or m.group(4)   # '' for '1.0.post', which is post0
+    return release, pre, int(post or 0) if post is not None else -1
+
+
+def _compare(a: str, b: str) -> Optional[int]:
+    ka, kb = parse_version(a), parse_version(b)
+    if ka is None or kb is None:
+        return None
+    return (ka > kb) - (ka < kb)
+
+
+def _is_post_of(version: str, wanted: str) -> bool:
+    """'1.0.post1' against '1.0': a post release of `wanted`, which names none."""
+    kv, kw = parse_version(version), parse_version(wanted)
+    return kw[2] < 0 <= kv[2] and kv[:2] == kw[:2]
+
+
+def satisfies(version: str, specifier: str) -> bool:
+    """
+    Check a version against a comma separated specifier such as
+    '>=6.0.0', '>=6,<7', '~=3.8' or '==6.5.*'. A bare version means '=='.
+    As in PEP 440, '==1.0' does not match '1.0.post1' and '>1.0' does not
+    either, unless the specifier names a post release itself.
+    """
+    for clause in (specifier or "").split(","):
+        clause = clause.strip()
+        if not clause or clause == "*":
+            continue
+        op, wanted = _CLAUSE_RE.match(clause).groups()
+        op = op or "=="
+        if op == "===":
+            if version.strip() != wanted:
+                return False
+            continue
+        if wanted.endswith(".*") and op in ("==", "!="):
+            prefix = parse_version(wanted[:-2])
+            current = parse_version(version)
+            if prefix is None or current is None:
+                return False
+            width = len(wanted[:-2].split("."))
+            padded = current[0] + (0,) * width
+            matched = padded[:width] == (prefix[0] + (0,) * width)[:width]
+            if matched != (op == "=="):
+                return False
+            continue
+
+        cmp = _compare(version, wanted)
+        if cmp is None:
+            return False
+        if op == "~=":
+            # ~=X.Y.Z  means  >=X.Y.Z, ==X.Y.*
+            parts = wanted.split(".")
+            if cmp < 0 or len(parts) < 2 or not satisfies(version, "==" + ".".join(parts[:-1]) + ".*"):
+                return False
+        elif op == ">" and cmp > 0 and _is_post_of(version, wanted):
+            return False
+        elif not {
+            "==": cmp == 0, "!=": cmp != 0, ">=": cmp >= 0,
+            "<=": cmp <= 0, ">": cmp > 0, "<": cmp < 0,
+        }[op]:
+            return False
+    return True
+
+
+# ----------------- Installed distributions -----------------
+class DistributionIndex:
+    """
+    Installed distribution name -> version, built once from
+    importlib.metadata and cached in memory and in the database.
+
+    The cache key is a fingerprint of the sys.path directories' mtimes;
+    installing or removing a package touches site-packages and
+    invalidates it.
+    """
+
+    _memory: Optional[tuple[str, dict[str, str]]] = None
+    _lock = threading.Lock()
+
+    def __init__(self, db: Optional[DatabaseConnector] = None, mapping: Optional[dict[str, str]] = None):
+        self._db = db
+        self._mapping = mapping  # fixed result, e.g. scanned once by a parent process
+
+    @property
+    def db(self) -> DatabaseConnector:
+        if self._db is None:
+            self._db = DatabaseConnector()
+        return self._db
+
+    @staticmethod
+    def fingerprint() -> str:
+        digest = hashlib.sha1(sys.prefix.encode())
+        for entry in sys.path:
+            try:
+                st = os.stat(entry or ".")
+            except OSError:
+                continue
+            digest.update(f"{entry}\0{st.st_mtime_ns}\0".encode())
+        return digest.hexdigest()
+
+    def get(self) -> dict[str, str]:
+        if self._mapping is not None:
+            return self._mapping
+        key = self.fingerprint()
+        with self._lock:
+            cached = DistributionIndex._memory
+            if cached and cached[0] == key:
+                return cached[1]
+
+            mapping = self._load_from_db(key)
+            if mapping is None:
+                mapping = self.scan()
+                self._save_to_db(key, mapping)
+            DistributionIndex._memory = (key, mapping)
+            return mapping
+
+    @staticmethod
+    def scan() -> dict[str, str]:
+        import importlib.metadata
+        mapping = {}
+        for dist in importlib.metadata.distributions():
+            name = dist.metadata["Name"] if dist.metadata else None
+            if name:
+                # First hit wins, matching import resolution order
+                mapping.setdefault(normalize_name(name), dist.version)
+        return mapping
+
+    def _load_from_db(self, key: str) -> Optional[dict[str, str]]:
+        row = self.db.execute_query(
+            "SELECT VALUE FROM CACHE_META WHERE KEY = 'distributions'", fetch_one=True
+        )
+        if not row:
+            return None
+        try:
+            stored = json.loads(row[0])
+        except ValueError:
+            return None
+        if stored.get("fingerprint") != key:
+            return None
+        return stored.get("distributions", {})
+
+    def _save_to_db(self, key: str, mapping: dict[str, str]):
+        self.db.execute_query(
+            "INSERT OR REPLACE INTO CACHE_META (KEY, VALUE) VALUES ('distributions', ?)",
+            (json.dumps({"fingerprint": key, "distributions": mapping}),)
+        )
+
+
+# ----------------- Manifest check -----------------
+def check_manifest(manifest: SourceManifest, index: Optional[DistributionIndex] = None) -> list[str]:
+    """
+    Check [compatibility] and [dependencies] of a manifest against the
+    running interpreter. Returns a list of problems (empty when OK).
+    """
+    problems = []
+
+    python_spec = manifest.python_version
+    if python_spec and not satisfies(platform.python_version(), python_spec):
+        problems.append(f"Python {platform.python_version()} does not satisfy python_version {python_spec}")
+
+    platforms = manifest.platforms
+    if platforms and not any(sys.platform.startswith(p) for p in platforms):
+        problems.append(f"Platform {sys.platform} not in {', '.join(platforms)}")
+
+    if manifest.dependencies:
+        installed = (index or DistributionIndex()).get()
+        for name, spec in manifest.dependencies.items():
+            version = installed.get(normalize_name(name))
+            if version is None:
+                problems.append(f"Missing dependency: {name} {spec}".rstrip())
+            elif not satisfies(version, spec):
+                problems.append(f"Dependency mismatch: {name} {version} does not satisfy {spec}")
+    return problems
@@ -1,24 +1,53 @@
 import os
+from pathlib import Path
 from PyQt6.QtCore import Qt, QSignalBlocker
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QDockWidget
 from typing import Optional
 
+from libs.stylesheetModefier import HOSTED_PROPERTY, StylesheetModifier, fill_variables
+
+# @variables come from the host's theme (src/themes.ini), so Toggle Theme restyles the renderer too
+RENDERER_QSS = """
+    QDockWidget#DetachableRenderer {
+        border: 2px solid @border;
+        border-radius: 6px;
+        titlebar-close-icon: url(close.png);
+        titlebar-normal-icon: url(float.png);
+    }
+    QWidget#RendererContainer { background-color: @window_bg; }
+    QWidget#RendererHeader { background-color: @surface; border-bottom: 1px solid @border; }
+    QLabel#RendererTitle { color: @title; font-weight: bold; font-size: 12px; }
+    QPushButton#DetachButton {
+        background-color: @hover; color: @title;
+        border: none; border-radius: 3px;
+        font-size: 12px; font-weight: bold;
+    }
+    QPushButton#DetachButton:hover { background-color: @pressed; }
+    QPushButton#DetachButton:pressed { background-color: @surface; }
+    QWidget#RendererContent { background-color: @window_bg; }
+    QLabel#RendererPlaceholder {
+        color: @text_muted; font-size: 14px;
+        padding: 60px; background-color: @panel_soft;
+        border: 2px dashed @border; border-radius: 4px; margin: 10px;
+    }
+"""
+DEFAULT_STYLES = Path(__file__).resolve().parents[1] / "src" / "styles.qss"   # standalone: its default theme
+
 class DetachableRenderer(QDockWidget):
     """Detachable renderer panel that can float as its own window."""
 
-    def __init__(self, source_path: str = None, parent=None):
+    def __init__(self, source_path: str = None, parent=None, stylesheet_mod=None):
         # Use current working directory if source_path is None
         if source_path is None:
             source_path = os.getcwd()
         self.source_path = source_path
-        print(f"[DetachableRenderer] __init__ called, source_path={self.source_path}")
+        self.stylesheet_mod = stylesheet_mod
 
         super().__init__("Renderer", parent)
         self.setObjectName("DetachableRenderer")
         self.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
 
         # --- Container setup ---
-        print("[DetachableRenderer] Creating container widget")
         self.container = QWidget()
         self.container.setObjectName("RendererContainer")
         self.setWidget(self.container)
@@ -58,45 +87,25 @@ class DetachableRenderer(QDockWidget):
         self.layout.addWidget(self.content_widget, 1)
 
         self.current_widget: Optional[QWidget] = None
+        self.repaint_overlay = None  # built on first use (View -> Show Repaints)
+        self.showing_repaints = False
 
         # --- Connect signals ---
-        print("[DetachableRenderer] Connecting signals")
         self.detach_button.clicked.connect(self.toggle_detached)
         self.topLevelChanged.connect(self.on_top_level_changed)
 
         # --- Style ---
-        print("[DetachableRenderer] Applying style")
         self.apply_style()
-        print("[DetachableRenderer] Initialization complete")
 
         
     def apply_style(self):
         """Apply renderer-specific styling."""
-        print("[DetachableRenderer] apply_style called")
-        self.setStyleSheet("""
-            QDockWidget#DetachableRenderer {
-                border: 2px solid #4a5568;
-                border-radius: 6px;
-                titlebar-close-icon: url(close.png);
-                titlebar-normal-icon: url(float.png);
-            }
-            QWidget#RendererContainer { background-color: #ffffff; }
-            QWidget#RendererHeader { background-color: #2d3748; border-bottom: 1px solid #4a5568; }
-            QLabel#RendererTitle { color: #ffffff; font-weight: bold; font-size: 12px; }
-            QPushButton#DetachButton {
-                background-color: #4a5568; color: #ffffff;
-                border: none; border-radius: 3px;
-                font-size: 12px; font-weight: bold;
-            }
-            QPushButton#DetachButton:hover { background-color: #5a6578; }
-            QPushButton#DetachButton:pressed { background-color: #3a4558; }
-            QWidget#RendererContent { background-color: #ffffff; }
-            QLabel#RendererPlaceholder {
-                color: #a0aec0; font-size: 14px;
-                padding: 60px; background-color: #f7fafc;
-                border: 2px dashed #cbd5e0; border-radius: 4px; margin: 10px;
-            }
-        """)
+        if self.stylesheet_mod is not None:
+            # Joins the host's compiled sheet; each rule lands on its own widget
+            self.stylesheet_mod.add_layer("DetachableRenderer", RENDERER_QSS)
+        else:
+            theme = StylesheetModifier(DEFAULT_STYLES)
+            self.setStyleSheet(fill_variables(RENDERER_QSS, theme.variables())[0])
         
     def toggle_detached(self):
         """Toggle between docked and detached state."""
@@ -134,8 +143,11 @@ class DetachableRenderer(QDockWidget):
         # Add new widget
         print("[DetachableRenderer] Adding new widget")
         self.placeholder.hide()
+        widget.setProperty(HOSTED_PROPERTY, True)  # keep the host's scoped sheets out of it
         self.current_widget = widget
         self.content_layout.addWidget(widget)
+        if self.showing_repaints:
+            self.repaint_overlay.watch(widget)
         
         # Update title if widget has window title
         if hasattr(widget, 'windowTitle') and widget.windowTitle():
@@ -154,6 +166,8 @@ class DetachableRenderer(QDockWidget):
             self.content_layout.removeWidget(self.current_widget)
             self.current_widget.deleteLater()
             self.current_widget = None
+        if self.showing_repaints:
+            self.repaint_overlay.watch(None)
             
         self.placeholder.show()
         self.title_label.setText("Renderer")
@@ -161,6 +175,16 @@ class DetachableRenderer(QDockWidget):
             self.setWindowTitle("Renderer - Detached")
         print("[DetachableRenderer] clear complete")
 
+    def show_repaints(self, enabled: bool):
+        """Flash the repainted areas of the hosted widget, with the share of pixels saved."""
+        self.showing_repaints = enabled
+        if self.repaint_overlay is None:
+            if not enabled:
+                return
+            from libs.Repaintoverlay import RepaintOverlay
+            self.repaint_overlay = RepaintOverlay(self)
+        self.repaint_overlay.watch(self.current_widget if enabled else None)
+
     def begin_update(self):
         """Disable user interaction during update."""
         print("[DetachableRenderer] begin_update called")
@@ -0,0 +1,415 @@
+"""
+Shared-memory frame transport for sources hosted out of process.
+
+The child renders its widget straight into one half of a double buffer in
+`multiprocessing.shared_memory` and publishes it by flipping the front
+index under a sequence lock; the host wraps the front half in a `QImage`
+without copying and draws it. Input and resize travel the other way
+through a ring of fixed-size records in a second segment. Nothing is
+pickled or sent over a socket per frame: the JSON-lines pipe of
+libs/Sourceprocess.py is only used to set the transport up.
+
+The host creates (and unlinks) both segments; the child only attaches.
+"""
+import sys
+import time
+import ctypes
+import struct
+from collections import deque
+from typing import Optional, NamedTuple
+from multiprocessing import shared_memory
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QTimer, QPoint, QPointF, QEvent, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter, QColor, QMouseEvent, QWheelEvent, QKeyEvent
+from PyQt6.QtWidgets import QWidget, QApplication
+
+FRAME_MAGIC = b"QFFB"
+FRAME_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+BYTES_PER_PIXEL = 4
+DEFAULT_CAPACITY = 1920 * 1080 * BYTES_PER_PIXEL   # bytes per buffer
+POLL_MS = 4   # the host checks for a new frame this often; reading the sequence is a few bytes
+
+# Frame header (64 bytes). `reading` belongs to the reader, everything else to the writer.
+_MAGIC = struct.Struct("<4s")            # 0
+_READING = struct.Struct("<I")           # 4: 0 = idle, 1 + index of the buffer being drawn
+_SEQ = struct.Struct("<Q")               # 8: even = stable, odd = publish in progress
+_FRAME = struct.Struct("<IIIIQQ")        # 16: width, height, stride, front, published_ns, render_ns
+_CAPACITY = struct.Struct("<Q")          # 48
+FRAME_HEADER_SIZE = 64
+
+# Control ring: head, tail, slot count, then 32-byte records
+_RING = struct.Struct("<QQI")
+RING_HEADER_SIZE = 32
+RECORD = struct.Struct("<BBHIiiii8s")    # kind, button, buttons, modifiers, x, y, a, b, text
+DEFAULT_SLOTS = 256
+
+# Control record kinds; `a`/`b` carry the wheel delta, the key code or the new size
+MOUSE_PRESS, MOUSE_RELEASE, MOUSE_MOVE, MOUSE_DOUBLE, WHEEL, KEY_PRESS, KEY_RELEASE, RESIZE = range(1, 9)
+
+
+def attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Open a segment created by another process without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    segment = shared_memory.SharedMemory(name=name)
+    if sys.platform != "win32":
+        # Before 3.13 attaching registers the segment with this process's
+        # resource tracker, which would unlink it when the process exits
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+class Frame(NamedTuple):
+    image: QImage        # wraps shared memory: valid until FrameBuffer.release()
+    sequence: int
+    published_ns: int    # time.perf_counter_ns() in the writer when it was published
+    render_ns: int       # how long the writer took to render it
+
+
+class FrameBuffer:
+    """
+    Two frame buffers and a header in one shared memory segment.
+
+    Writer: `begin_frame()` -> paint into the image -> `end_frame()`.
+    Reader: `acquire()` -> draw the image -> `release()`.
+    While the reader holds a buffer the writer will not start a frame in it;
+    `begin_frame()` returns None and the writer simply skips that tick.
+    """
+
+    def __init__(self, name: Optional[str] = None, capacity: int = DEFAULT_CAPACITY):
+        if name is None:
+            self.segment = shared_memory.SharedMemory(create=True, size=FRAME_HEADER_SIZE + 2 * capacity)
+            self.owner = True
+            self.segment.buf[:FRAME_HEADER_SIZE] = bytes(FRAME_HEADER_SIZE)
+            _MAGIC.pack_into(self.segment.buf, 0, FRAME_MAGIC)
+            _CAPACITY.pack_into(self.segment.buf, 48, capacity)
+        else:
+            self.segment = attach_segment(name)
+            self.owner = False
+            if _MAGIC.unpack_from(self.segment.buf, 0)[0] != FRAME_MAGIC:
+                self.segment.close()
+                raise ValueError(f"{name} is not a frame buffer")
+        self.name = self.segment.name
+        self.capacity = _CAPACITY.unpack_from(self.segment.buf, 48)[0]
+        # Keeps the mapping exported while QImages point into it; dropped in close()
+        self._anchor = ctypes.c_char.from_buffer(self.segment.buf)
+        self._base = ctypes.addressof(self._anchor) + FRAME_HEADER_SIZE
+        self._pending: Optional[tuple[int, int, int, int, int]] = None
+
+    # ----------------- Shared -----------------
+    @property
+    def sequence(self) -> int:
+        return _SEQ.unpack_from(self.segment.buf, 8)[0]
+
+    def fits(self, width: int, height: int) -> bool:
+        return width * height * BYTES_PER_PIXEL <= self.capacity
+
+    def _wrap(self, index: int, width: int, height: int, stride: int) -> QImage:
+        address = self._base + index * self.capacity
+        return QImage(sip.voidptr(address), width, height, stride, FRAME_FORMAT)
+
+    # ----------------- Writer -----------------
+    def begin_frame(self, width: int, height: int) -> Optional[QImage]:
+        """Image over the back buffer, or None while the reader still draws from it."""
+        if width <= 0 or height <= 0 or not self.fits(width, height):
+            return None
+        front = _FRAME.unpack_from(self.segment.buf, 16)[3]
+        back = 1 - front if self.sequence else 0
+        if _READING.unpack_from(self.segment.buf, 4)[0] == back + 1:
+            return None
+        self._pending = (back, width, height, width * BYTES_PER_PIXEL, time.perf_counter_ns())
+        return self._wrap(back, width, height, width * BYTES_PER_PIXEL)
+
+    def end_frame(self):
+        """Publish the frame started by `begin_frame()` (the image must no longer be painted on)."""
+        if self._pending is None:
+            return
+        back, width, height, stride, started = self._pending
+        self._pending = None
+        buf = self.segment.buf
+        seq = self.sequence
+        now = time.perf_counter_ns()
+        _SEQ.pack_into(buf, 8, seq + 1)
+        _FRAME.pack_into(buf, 16, width, height, stride, back, now, now - started)
+        _SEQ.pack_into(buf, 8, seq + 2)
+
+    # ----------------- Reader -----------------
+    def acquire(self) -> Optional[Frame]:
+        """Latest published frame, or None before the first one."""
+        buf = self.segment.buf
+        for _ in range(1000):
+            seq = self.sequence
+            if seq == 0:
+                return None
+            if seq & 1:
+                continue   # publish in progress: a handful of stores away
+            width, height, stride, front, published, render = _FRAME.unpack_from(buf, 16)
+            _READING.pack_into(buf, 4, front + 1)
+            # Still the same frame once the claim is visible: the writer cannot reuse it now
+            if self.sequence == seq:
+                return Frame(self._wrap(front, width, height, stride), seq, published, render)
+            _READING.pack_into(buf, 4, 0)
+        return None
+
+    def release(self):
+        _READING.pack_into(self.segment.buf, 4, 0)
+
+    # ----------------- Teardown -----------------
+    def close(self):
+        if self.segment is None:
+            return
+        self._anchor = None
+        self.segment.close()
+        if self.owner:
+            try:
+                self.segment.unlink()
+            except FileNotFoundError:
+                pass
+        self.segment = None
+
+
+class ControlRing:
+    """Single-producer, single-consumer ring of fixed-size input records (host -> child)."""
+
+    def __init__(self, name: Optional[str] = None, slots: int = DEFAULT_SLOTS):
+        if name is None:
+            self.segment = shared_memory.SharedMemory(create=True, size=RING_HEADER_SIZE + slots * RECORD.size)
+            self.owner = True
+            _RING.pack_into(self.segment.buf, 0, 0, 0, slots)
+        else:
+            self.segment = attach_segment(name)
+            self.owner = False
+        self.name = self.segment.name
+        self.slots = _RING.unpack_from(self.segment.buf, 0)[2]
+
+    def push(self, kind: int, x: int = 0, y: int = 0, a: int = 0, b: int = 0,
+             button: int = 0, buttons: int = 0, modifiers: int = 0, text: str = "") -> bool:
+        """Queue one record; False (record dropped) when the child has fallen a full ring behind."""
+        head, tail, _ = _RING.unpack_from(self.segment.buf, 0)
+        if head - tail >= self.slots:
+            return False
+        RECORD.pack_into(self.segment.buf, RING_HEADER_SIZE + (head % self.slots) * RECORD.size,
+                         kind, button, buttons, modifiers, x, y, a, b, text.encode()[:8])
+        struct.pack_into("<Q", self.segment.buf, 0, head + 1)
+        return True
+
+    def drain(self) -> list[tuple]:
+        head, tail, _ = _RING.unpack_from(self.segment.buf, 0)
+        records = [RECORD.unpack_from(self.segment.buf, RING_HEADER_SIZE + (i % self.slots) * RECORD.size)
+                   for i in range(tail, head)]
+        struct.pack_into("<Q", self.segment.buf, 8, head)
+        return records
+
+    def close(self):
+        if self.segment is None:
+            return
+        self.segment.close()
+        if self.owner:
+            try:
+                self.segment.unlink()
+            except FileNotFoundError:
+                pass
+        self.segment = None
+
+
+class FramePublisher(QObject):
+    """
+    Child side: renders the hosted widget into the frame buffer on a timer
+    and replays the host's input records on it.
+
+    The widget is shown with WA_DontShowOnScreen so it is laid out and
+    polished like a visible window without ever being mapped.
+    """
+
+    def __init__(self, widget: QWidget, frames: FrameBuffer, control: ControlRing,
+                 fps: int = 60, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.widget = widget
+        self.frames = frames
+        self.control = control
+        self.frames_published = 0
+        self.frames_skipped = 0
+        self._grabbed: Optional[QWidget] = None
+
+        widget.hide()
+        widget.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen, True)
+        widget.show()
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(max(1, 1000 // fps))
+
+    def set_frames(self, frames: FrameBuffer):
+        """Switch to a larger buffer created by the host."""
+        old, self.frames = self.frames, frames
+        old.close()
+
+    def stop(self):
+        self.timer.stop()
+        self.frames.close()
+        self.control.close()
+
+    def tick(self):
+        for record in self.control.drain():
+            self.dispatch(*record)
+        width, height = self.widget.width(), self.widget.height()
+        if not self.frames.fits(width, height):
+            height = self.frames.capacity // (width * BYTES_PER_PIXEL)   # show what fits until the host grows it
+        image = self.frames.begin_frame(width, height)
+        if image is None:
+            self.frames_skipped += 1
+            return
+        image.fill(Qt.GlobalColor.transparent)
+        self.widget.render(image)
+        del image
+        self.frames.end_frame()
+        self.frames_published += 1
+
+    # ----------------- Input -----------------
+    def dispatch(self, kind, button, buttons, modifiers, x, y, a, b, text):
+        widget = self.widget
+        mods = Qt.KeyboardModifier(modifiers)
+        if kind == RESIZE:
+            widget.resize(a, b)
+        elif kind in (MOUSE_PRESS, MOUSE_RELEASE, MOUSE_MOVE, MOUSE_DOUBLE):
+            pos = QPoint(x, y)
+            target = self._grabbed or widget.childAt(pos) or widget
+            if kind == MOUSE_PRESS:
+                self._grabbed = target
+            elif kind == MOUSE_RELEASE:
+                self._grabbed = None
+            event_type = {MOUSE_PRESS: QEvent.Type.MouseButtonPress,
+                          MOUSE_RELEASE: QEvent.Type.MouseButtonRelease,
+                          MOUSE_MOVE: QEvent.Type.MouseMove,
+                          MOUSE_DOUBLE: QEvent.Type.MouseButtonDblClick}[kind]
+            local = QPointF(target.mapFrom(widget, pos))
+            event = QMouseEvent(event_type, local, QPointF(widget.mapToGlobal(pos)),
+                                Qt.MouseButton(button), Qt.MouseButton(buttons), mods)
+            QApplication.sendEvent(target, event)
+        elif kind == WHEEL:
+            pos = QPoint(x, y)
+            target = widget.childAt(pos) or widget
+            event = QWheelEvent(QPointF(target.mapFrom(widget, pos)), QPointF(widget.mapToGlobal(pos)),
+                                QPoint(), QPoint(a, b), Qt.MouseButton(buttons), mods,
+                                Qt.ScrollPhase.NoScrollPhase, False)
+            QApplication.sendEvent(target, event)
+        elif kind in (KEY_PRESS, KEY_RELEASE):
+            target = widget.focusWidget() or widget
+            event_type = QEvent.Type.KeyPress if kind == KEY_PRESS else QEvent.Type.KeyRelease
+            QApplication.sendEvent(target, QKeyEvent(event_type, a, mods, text.rstrip(b"\0").decode(errors="ignore")))
+
+
+class FrameView(QWidget):
+    """
+    Host side: shows the child's latest frame and forwards input and size.
+
+    Polls the sequence number every POLL_MS and only repaints when a new
+    frame was published. For recent frames `handoff_ns` keeps the time from
+    acquiring the frame to having drawn it, `latency_ns` the time from the
+    child publishing it to having drawn it, and `render_ns` the child's
+    render time.
+    """
+
+    needs_capacity = pyqtSignal(int, int)   # the view outgrew the buffer: (width, height)
+
+    def __init__(self, frames: FrameBuffer, control: ControlRing, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setObjectName("FrameView")
+        self.frames: Optional[FrameBuffer] = frames
+        self.control: Optional[ControlRing] = control
+        self.handoff_ns: deque[int] = deque(maxlen=240)
+        self.latency_ns: deque[int] = deque(maxlen=240)
+        self.render_ns: deque[int] = deque(maxlen=240)
+        self._shown_sequence = 0
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setMouseTracking(True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start(POLL_MS)
+
+    def set_frames(self, frames: FrameBuffer):
+        self.frames = frames
+        self._shown_sequence = 0
+
+    def detach(self):
+        """Forget the segments before the host closes them."""
+        self.timer.stop()
+        self.frames = None
+        self.control = None
+
+    def poll(self):
+        if self.frames is not None and self.frames.sequence != self._shown_sequence:
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        started = time.perf_counter_ns()
+        frame = self.frames.acquire() if self.frames is not None else None
+        if frame is None:
+            painter.fillRect(self.rect(), QColor("#1a202c"))
+            return
+        try:
+            # The view is opaque: a plain copy, no blending
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.drawImage(0, 0, frame.image)
+            image_rect = frame.image.rect()
+        finally:
+            self.frames.release()
+        now = time.perf_counter_ns()
+        self.handoff_ns.append(now - started)
+        self.latency_ns.append(now - frame.published_ns)
+        self.render_ns.append(frame.render_ns)
+        self._shown_sequence = frame.sequence
+        # Whatever the frame does not cover (the child is still catching up with a resize)
+        if image_rect.width() < self.width():
+            painter.fillRect(image_rect.width(), 0, self.width() - image_rect.width(), self.height(), QColor("#1a202c"))
+        if image_rect.height() < self.height():
+            painter.fillRect(0, image_rect.height(), image_rect.width(), self.height() - image_rect.height(), QColor("#1a202c"))
+
+    # ----------------- Input -----------------
+    def _push(self, kind: int, **fields):
+        if self.control is not None:
+            self.control.push(kind, **fields)
+
+    def _mouse(self, kind: int, event):
+        pos = event.position().toPoint()
+        self._push(kind, x=pos.x(), y=pos.y(), button=event.button().value,
+                   buttons=event.buttons().value, modifiers=event.modifiers().value)
+
+    def mousePressEvent(self, event):
+        self.setFocus()
+        self._mouse(MOUSE_PRESS, event)
+
+    def mouseReleaseEvent(self, event):
+        self._mouse(MOUSE_RELEASE, event)
+
+    def mouseDoubleClickEvent(self, event):
+        self._mouse(MOUSE_DOUBLE, event)
+
+    def mouseMoveEvent(self, event):
+        self._mouse(MOUSE_MOVE, event)
+
+    def wheelEvent(self, event):
+        pos = event.position().toPoint()
+        delta = event.angleDelta()
+        self._push(WHEEL, x=pos.x(), y=pos.y(), a=delta.x(), b=delta.y(),
+                   buttons=event.buttons().value, modifiers=event.modifiers().value)
+
+    def keyPressEvent(self, event):
+        self._push(KEY_PRESS, a=event.key(), modifiers=event.modifiers().value, text=event.text())
+
+    def keyReleaseEvent(self, event):
+        self._push(KEY_RELEASE, a=event.key(), modifiers=event.modifiers().value, text=event.text())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        width, height = self.width(), self.height()
+        if self.frames is not None and not self.frames.fits(width, height):
+            self.needs_capacity.emit(width, height)
+        self._push(RESIZE, a=width, b=height)
@@ -0,0 +1,230 @@
+"""
+NumPy arrays on screen without per-pixel painting.
+
+Tools that draw a heatmap with one `fillRect()` (or `setPixel()`) per
+cell spend the frame in Python. Here the pixels live in a NumPy array
+that a `QImage` wraps in place, so a frame is written with array
+operations and painted with one `drawImage()`:
+
+    ArrayImage      QImage over an array's memory (no copy); the image
+                    holds the array, so the buffer outlives it
+    aligned_empty() array with rows padded for QImage (32-bit aligned)
+    Colormap        256-entry RGB32 lookup table; `apply()` maps values
+                    to colours with vectorised NumPy, in row chunks
+    ImageCanvas     widget painting its `array`; whole frames, sub-rects,
+                    or direct writes followed by `mark_dirty()`
+
+    canvas = ImageCanvas(3840, 2160, colormap="heat", levels=(0.0, 1.0))
+    canvas.set_frame(values)                   # float (h, w) -> colours
+    canvas.set_region(x, y, patch)             # repaints only that rect
+    canvas.array[y0:y1, x0:x1] = rgb32         # or write pixels directly...
+    canvas.mark_dirty(x0, y0, x1 - x0, y1 - y0)
+"""
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QWidget
+
+# dtype, channels -> format picked by ArrayImage when none is given
+ARRAY_FORMATS = {
+    ("uint8", 1): QImage.Format.Format_Grayscale8,
+    ("uint16", 1): QImage.Format.Format_Grayscale16,
+    ("uint8", 3): QImage.Format.Format_RGB888,
+    ("uint8", 4): QImage.Format.Format_RGBA8888,
+    ("uint32", 1): QImage.Format.Format_RGB32,   # 0xffRRGGBB; pass Format_ARGB32 for alpha
+}
+
+# Colour stops (position, (r, g, b)) of the named colormaps
+COLORMAPS = {
+    "gray": [(0.0, (0, 0, 0)), (1.0, (255, 255, 255))],
+    "heat": [(0.0, (0, 0, 0)), (0.35, (200, 0, 0)), (0.7, (255, 200, 0)), (1.0, (255, 255, 255))],
+    "viridis": [(0.0, (68, 1, 84)), (0.25, (59, 82, 139)), (0.5, (33, 145, 140)),
+                (0.75, (94, 201, 98)), (1.0, (253, 231, 37))],
+    "coolwarm": [(0.0, (59, 76, 192)), (0.5, (221, 221, 221)), (1.0, (180, 4, 38))],
+}
+
+CHUNK_VALUES = 1 << 17   # values per colormap pass: scratch rows stay in cache
+
+
+class ArrayImage(QImage):
+    """
+    A `QImage` over the memory of `array`, which it keeps in `.array`.
+    Rows may be padded (any positive row stride that is a multiple of 4),
+    pixels within a row must be contiguous. Writes to the array show in
+    the image and painting on the image writes the array. Qt's shallow
+    copies of it share the memory without holding the array; use
+    `.copy()` for an image that outlives this one.
+    """
+
+    def __init__(self, array: np.ndarray, format: Optional[QImage.Format] = None):
+        if array.ndim not in (2, 3):
+            raise ValueError(f"Expected an (h, w) or (h, w, channels) array, got shape {array.shape}")
+        height, width = array.shape[:2]
+        channels = array.shape[2] if array.ndim == 3 else 1
+        if format is None:
+            format = ARRAY_FORMATS.get((array.dtype.name, channels))
+            if format is None:
+                raise ValueError(f"No QImage format for {array.dtype.name} with {channels} channel(s)")
+        pixel = array.itemsize * channels
+        if array.strides[-1] != array.itemsize or (array.ndim == 3 and array.strides[1] != pixel):
+            raise ValueError("Pixels within a row must be contiguous")
+        stride = array.strides[0]
+        if stride < width * pixel or stride % 4 or array.ctypes.data % 4:
+            raise ValueError(f"Rows must be 32-bit aligned with a positive stride (got {stride} bytes); "
+                             "see aligned_empty()")
+        super().__init__(sip.voidptr(array.ctypes.data), width, height, stride, format)
+        self.array = array
+
+
+def aligned_empty(height: int, width: int, channels: int = 1, dtype="uint8") -> np.ndarray:
+    """Uninitialised (height, width[, channels]) array whose rows start on 4-byte boundaries."""
+    dtype = np.dtype(dtype)
+    row = width * channels * dtype.itemsize
+    stride = -(-row // 4) * 4
+    buffer = np.empty(height * stride + 4, np.uint8)
+    start = -buffer.ctypes.data % 4
+    rows = buffer[start:start + height * stride].reshape(height, stride)[:, :row]
+    shape = (height, width, channels) if channels > 1 else (height, width)
+    return rows.view(dtype).reshape(shape)
+
+
+class Colormap:
+    """
+    Lookup table of 256 RGB32 colours interpolated between `stops`
+    ((position in 0..1, (r, g, b)) pairs). Values are scaled from
+    [vmin, vmax] to the table and clipped at both ends; uint8 values
+    index the table directly.
+    """
+
+    def __init__(self, stops: Sequence[tuple[float, tuple[int, int, int]]], name: str = ""):
+        self.name = name
+        positions = np.array([p for p, _ in stops], np.float64)
+        colours = np.array([c for _, c in stops], np.float64)
+        steps = np.linspace(0.0, 1.0, 256)
+        r, g, b = (np.rint(np.interp(steps, positions, colours[:, i])).astype(np.uint32) for i in range(3))
+        self.lut = (0xFF000000 | (r << 16) | (g << 8) | b).astype(np.uint32)
+
+    @classmethod
+    def named(cls, name: str) -> "Colormap":
+        if name not in COLORMAPS:
+            raise ValueError(f"Unknown colormap {name!r} (one of {', '.join(COLORMAPS)})")
+        return cls(COLORMAPS[name], name)
+
+    def apply(self, values: np.ndarray, out: Optional[np.ndarray] = None,
+              vmin: float = 0.0, vmax: float = 1.0) -> np.ndarray:
+        """Colours of a 2-D `values` array, written into `out` (uint32, same shape) when given."""
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError(f"Expected a 2-D array, got shape {values.shape}")
+        if out is None:
+            out = np.empty(values.shape, np.uint32)
+        elif out.shape != values.shape or out.dtype != np.uint32:
+            raise ValueError(f"out must be uint32 with shape {values.shape}")
+        # A few rows at a time, so the scratch (and take()'s index conversion) stays in cache
+        rows = max(1, CHUNK_VALUES // max(1, values.shape[1]))
+        if values.dtype == np.uint8:
+            for top in range(0, len(values), rows):
+                np.take(self.lut, values[top:top + rows], out=out[top:top + rows], mode="clip")
+            return out
+        scale = 256.0 / (vmax - vmin) if vmax != vmin else 0.0
+        offset = -vmin * scale
+        work = np.empty((min(rows, len(values)), values.shape[1]), np.float32)
+        index = np.empty(work.shape, np.int16)
+        with np.errstate(invalid="ignore"):   # NaN is not special-cased; take() clips what it becomes
+            for top in range(0, len(values), rows):
+                n = min(rows, len(values) - top)
+                np.multiply(values[top:top + n], scale, out=work[:n], casting="unsafe")
+                work[:n] += offset
+                np.clip(work[:n], 0, 255, out=work[:n])
+                np.copyto(index[:n], work[:n], casting="unsafe")
+                np.take(self.lut, index[:n], out=out[top:top + n], mode="clip")
+        return out
+
+
+class ImageCanvas(QWidget):
+    """
+    Widget showing an RGB32 `array` of `width` x `height` pixels through
+    an `ArrayImage`, stretched to the widget. Only the exposed part is
+    drawn, so a sub-rect update costs its own area rather than the frame.
+    """
+
+    def __init__(self, width: int, height: int, colormap: Union[str, Colormap] = "gray",
+                 levels: tuple[float, float] = (0.0, 1.0), smooth: bool = False, parent=None):
+        super().__init__(parent)
+        self.colormap = Colormap.named(colormap) if isinstance(colormap, str) else colormap
+        self.levels = levels
+        self.smooth = smooth
+        self.frames = 0    # set_frame() calls
+        self.regions = 0   # set_region() / mark_dirty() calls
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.resize_canvas(width, height)
+
+    def resize_canvas(self, width: int, height: int):
+        """New, black pixel buffer of `width` x `height`."""
+        self.array = np.full((height, width), 0xFF000000, np.uint32)
+        self.image = ArrayImage(self.array)
+        self.update()
+
+    # ----------------- Writing -----------------
+    def set_frame(self, values: np.ndarray, vmin: Optional[float] = None, vmax: Optional[float] = None):
+        """A whole frame: uint32 pixels are copied as they are, anything else goes through the colormap."""
+        self._write(self.array, values, vmin, vmax)
+        self.frames += 1
+        self.update()
+
+    def set_region(self, x: int, y: int, values: np.ndarray,
+                   vmin: Optional[float] = None, vmax: Optional[float] = None):
+        """Write `values` with its top-left corner at (x, y), clipped to the canvas, and repaint that rect."""
+        height, width = values.shape[:2]
+        left, top = max(0, x), max(0, y)
+        right, bottom = min(self.array.shape[1], x + width), min(self.array.shape[0], y + height)
+        if right <= left or bottom <= top:
+            return
+        source = values[top - y:bottom - y, left - x:right - x]
+        self._write(self.array[top:bottom, left:right], source, vmin, vmax)
+        self.mark_dirty(left, top, right - left, bottom - top)
+
+    def mark_dirty(self, x: int, y: int, width: int, height: int):
+        """Repaint a rect of the canvas, after writing to `array` directly."""
+        self.regions += 1
+        self.update(self._to_widget(QRect(x, y, width, height)))
+
+    def _write(self, target: np.ndarray, values: np.ndarray, vmin: Optional[float], vmax: Optional[float]):
+        if values.shape != target.shape:
+            raise ValueError(f"Expected shape {target.shape}, got {values.shape}")
+        if values.dtype == np.uint32:
+            np.copyto(target, values)
+        else:
+            self.colormap.apply(values, target, self.levels[0] if vmin is None else vmin,
+                                self.levels[1] if vmax is None else vmax)
+
+    # ----------------- Painting -----------------
+    def _to_widget(self, rect: QRect) -> QRect:
+        """Widget pixels covered by a canvas rect (rounded outwards when stretched)."""
+        width, height = self.array.shape[1], self.array.shape[0]
+        if (self.width(), self.height()) == (width, height):
+            return rect
+        sx, sy = self.width() / width, self.height() / height
+        left, top = int(rect.left() * sx), int(rect.top() * sy)
+        right, bottom = -int(-(rect.right() + 1) * sx), -int(-(rect.bottom() + 1) * sy)
+        return QRect(left, top, right - left, bottom - top)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        exposed = event.rect()
+        width, height = self.array.shape[1], self.array.shape[0]
+        if (self.width(), self.height()) == (width, height):
+            painter.drawImage(exposed.topLeft(), self.image, exposed)
+        else:
+            # Stretched: draw the canvas rect behind the exposed part only
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, self.smooth)
+            sx, sy = width / self.width(), height / self.height()
+            left, top = int(exposed.left() * sx), int(exposed.top() * sy)
+            right = min(width, -int(-(exposed.right() + 1) * sx))
+            bottom = min(height, -int(-(exposed.bottom() + 1) * sy))
+            source = QRect(left, top, right - left, bottom - top)
+            painter.drawImage(self._to_widget(source), self.image, source)
+        painter.end()
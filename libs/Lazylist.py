@@ -0,0 +1,195 @@
+"""
+Lists of millions of rows without one item object per row.
+
+`QListWidget.addItems()` builds a `QListWidgetItem` per row, and even a
+`QListView` lays out every row of its model (seconds at a million rows,
+uniform sizes or not). Here the rows stay in their store and are only
+read for the rows on screen:
+
+    LazyListModel   QAbstractListModel over a store: any sequence (list,
+                    MmapRows, ...) or, chunk by chunk through
+                    canFetchMore()/fetchMore(), any iterable
+    LazyListView    a one-column QTableView dressed as a list: fixed row
+                    height, so opening and scrolling cost the same for
+                    ten rows or ten million
+    MmapRows        read-only rows of text in a file, memory-mapped;
+                    opening reads the header only
+
+    MmapRows.write(path, (f"Row {i}" for i in range(10_000_000)))
+    view = LazyListView()
+    view.setModel(LazyListModel(MmapRows(path)))
+    view.doubleClicked.connect(lambda index: print(index.data()))
+"""
+import mmap
+import struct
+from array import array
+from collections.abc import Sequence
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtWidgets import QTableView, QHeaderView, QAbstractItemView
+
+MMAP_MAGIC = b"QFROWS1\0"
+DEFAULT_CHUNK = 1000   # rows per fetch from an iterable
+_HEADER = struct.Struct("<8sQQ")   # magic, row count, offset table position
+
+
+class MmapRows(Sequence):
+    """
+    Rows of UTF-8 text from a file written by `MmapRows.write()`: the
+    header, the row bytes back to back, then a table of row offsets.
+    Rows are decoded when asked for; nothing is read at open but the
+    header, whatever the row count.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:   # empty file
+            self._file.close()
+            raise ValueError(f"{self.path} is not a row file")
+        magic, self._count, table = (_HEADER.unpack_from(self._map, 0) if len(self._map) >= _HEADER.size
+                                     else (b"", 0, 0))
+        if magic != MMAP_MAGIC or table + 8 * (self._count + 1) > len(self._map):
+            self.close()
+            raise ValueError(f"{self.path} is not a row file")
+        self._offsets = np.frombuffer(self._map, np.uint64, self._count + 1, table)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("row index out of range")
+        start, end = self._offsets[index:index + 2].tolist()
+        return self._map[start:end].decode("utf-8")
+
+    def close(self):
+        self._offsets = None   # releases its export of the map
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    @staticmethod
+    def write(path, rows: Iterable[str]) -> int:
+        """Write `rows` (streamed; newlines allowed) to a row file at `path`; returns the row count."""
+        offsets = array("Q")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MMAP_MAGIC, 0, 0))
+            position = _HEADER.size
+            offsets.append(position)
+            for row in rows:
+                data = row.encode("utf-8")
+                f.write(data)
+                position += len(data)
+                offsets.append(position)
+            f.write(offsets.tobytes())
+            f.seek(0)
+            f.write(_HEADER.pack(MMAP_MAGIC, len(offsets) - 1, position))
+        return len(offsets) - 1
+
+
+class LazyListModel(QAbstractListModel):
+    """
+    List model reading `store` on demand. A sequence shows all its rows
+    at once (its length is known and nothing is read until a row is
+    painted) unless `chunk` is given, in which case rows are handed to
+    the view `chunk` at a time as it scrolls to the end. Any other
+    iterable is read `chunk` (default DEFAULT_CHUNK) rows per fetch.
+    `display` turns a row into its text (str by default).
+    """
+
+    def __init__(self, store: Iterable[Any], chunk: Optional[int] = None,
+                 display: Callable[[Any], str] = str, parent=None):
+        super().__init__(parent)
+        self.display = display
+        self.chunk = chunk
+        self.fetches = 0
+        self._set_store(store)
+
+    def _set_store(self, store: Iterable[Any]):
+        if isinstance(store, Sequence):
+            self._store, self._source = store, None
+            self._loaded = len(store) if self.chunk is None else min(self.chunk, len(store))
+        else:
+            self._store, self._source = [], iter(store)
+            self._loaded = self._read()
+
+    def set_store(self, store: Iterable[Any]):
+        """Show another store."""
+        self.beginResetModel()
+        self._set_store(store)
+        self.endResetModel()
+
+    def store(self):
+        """The rows shown; for an iterable, the ones read so far."""
+        return self._store
+
+    # ----------------- Model -----------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid() or index.row() >= self._loaded:
+            return None
+        return self.display(self._store[index.row()])
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._source is not None or self._loaded < len(self._store)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        if self._source is not None:
+            count = self._read()
+        else:
+            count = min(self.chunk or DEFAULT_CHUNK, len(self._store) - self._loaded)
+        if count > 0:
+            self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+            self._loaded += count
+            self.endInsertRows()
+            self.fetches += 1
+
+    def _read(self) -> int:
+        """Append the next chunk of an iterable store; the source is dropped once exhausted."""
+        before = len(self._store)
+        for row in self._source:
+            self._store.append(row)
+            if len(self._store) - before >= (self.chunk or DEFAULT_CHUNK):
+                break
+        else:
+            self._source = None
+        return len(self._store) - before
+
+
+class LazyListView(QTableView):
+    """
+    A single-column list view whose rows all have the same height, so it
+    never measures or lays out rows it is not showing.
+    """
+
+    def __init__(self, parent=None, row_height: Optional[int] = None):
+        super().__init__(parent)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setCornerButtonEnabled(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        columns = self.horizontalHeader()
+        columns.hide()
+        columns.setStretchLastSection(True)
+        rows = self.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(row_height or self.fontMetrics().height() + 6)
@@ -0,0 +1,172 @@
+import gc
+import sys
+import types
+import weakref
+from collections import deque
+from typing import NamedTuple, Optional, Any
+from PyQt6.QtCore import QObject
+
+
+class Generation(NamedTuple):
+    """What one hosted source left behind: weak references only."""
+    label: str
+    refs: list[tuple[str, weakref.ref]]
+
+
+class LeakReport(NamedTuple):
+    label: str
+    checked: int                           # objects that should have been collected
+    leaked: list[tuple[str, list[str]]]    # (object, chain of links from a root down to it)
+
+    def format(self) -> str:
+        if not self.leaked:
+            return f"{self.label}: all {self.checked} objects collected"
+        lines = [f"{self.label}: {len(self.leaked)} of {self.checked} objects still alive"]
+        for name, chain in self.leaked:
+            lines.append(f"  {name}")
+            lines.append("    " + (" -> ".join(chain) if chain else "(no chain found from a module or root)"))
+        return "\n".join(lines)
+
+
+class LeakDetector:
+    """
+    Checks that a hosted source is really gone after it is replaced.
+
+    `swap()` starts tracking the new widget tree and module through weak
+    references and hands back the previous generation; `check()` (called
+    once Qt has run the deferred deletes) collects garbage and reports
+    every tracked object still alive, with a chain of gc referrers back to
+    a module global or a registered root such as the main window.
+    """
+
+    def __init__(self, max_nodes: int = 20000, max_depth: int = 10):
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.current: Optional[Generation] = None
+        self.reports: deque[LeakReport] = deque(maxlen=50)
+        self._roots: dict[int, str] = {}
+
+    def add_root(self, obj: Any, name: str):
+        """Name an object that lives for the whole session (e.g. the main window)."""
+        self._roots[id(obj)] = name
+        if hasattr(obj, "__dict__"):
+            self._roots[id(obj.__dict__)] = name
+
+    # ----------------- Tracking -----------------
+    def swap(self, label: str, *objects: Any) -> Optional[Generation]:
+        """Track `objects` (widgets are tracked with their Python-side children)."""
+        refs: list[tuple[str, weakref.ref]] = []
+        seen: set[int] = set()
+
+        def add(obj: Any, name: str):
+            if obj is None or id(obj) in seen:
+                return
+            try:
+                refs.append((name, weakref.ref(obj)))
+                seen.add(id(obj))
+            except TypeError:
+                pass  # not weak-referenceable
+
+        for obj in objects:
+            if isinstance(obj, types.ModuleType):
+                add(obj, f"module {obj.__name__}")
+                continue
+            add(obj, self.describe_object(obj))
+            if isinstance(obj, QObject):
+                # Only instances of Python subclasses carry Python state worth tracking;
+                # plain Qt wrappers come and go with the C++ objects
+                for child in obj.findChildren(QObject):
+                    if not type(child).__module__.startswith("PyQt6"):
+                        add(child, self.describe_object(child))
+
+        previous, self.current = self.current, Generation(label, refs)
+        return previous
+
+    def check(self, generation: Optional[Generation]) -> Optional[LeakReport]:
+        if generation is None:
+            return None
+        gc.collect()
+        leaked = []
+        for name, ref in generation.refs:
+            obj = ref()
+            if obj is not None:
+                leaked.append((name, self.retaining_chain(obj)))
+            del obj
+        report = LeakReport(generation.label, len(generation.refs), leaked)
+        self.reports.append(report)
+        return report
+
+    # ----------------- Chains -----------------
+    def retaining_chain(self, target: Any) -> list[str]:
+        """Breadth-first walk over gc referrers until a module or a root is reached."""
+        roots = dict(self._roots)
+        for name, module in list(sys.modules.items()):
+            if module is not None and getattr(module, "__dict__", None) is not None:
+                roots[id(module.__dict__)] = f"{name} (module globals)"
+        roots[id(sys.modules)] = "sys.modules"
+
+        # Keep everything addressed by id so the walk's own containers never
+        # show up as referrers of the objects it inspects
+        objects: dict[int, Any] = {id(target): target}
+        parents: dict[int, tuple[int, str]] = {}
+        depth = {id(target): 0}
+        queue: deque[int] = deque([id(target)])
+        own = {id(objects), id(parents), id(depth), id(queue), id(roots)}
+
+        found = None
+        while queue and found is None and len(objects) < self.max_nodes:
+            current = queue.popleft()
+            if depth[current] >= self.max_depth:
+                continue
+            referrers = gc.get_referrers(objects[current])
+            own.add(id(referrers))
+            for ref in referrers:
+                rid = id(ref)
+                if rid in objects or rid in own or isinstance(ref, types.FrameType):
+                    continue
+                objects[rid] = ref
+                parents[rid] = (current, self.describe_link(ref, objects[current]))
+                depth[rid] = depth[current] + 1
+                if rid in roots:
+                    found = rid
+                    break
+                queue.append(rid)
+            own.discard(id(referrers))
+            del referrers
+
+        if found is None:
+            return []
+        chain = [roots[found]]
+        node = found
+        while node != id(target):
+            node, link = parents[node]
+            chain.append(link)
+        return chain
+
+    @staticmethod
+    def describe_link(container: Any, child: Any) -> str:
+        """How `container` refers to `child`."""
+        if isinstance(container, dict):
+            for key, value in container.items():
+                if value is child:
+                    return f"[{key!r}]"
+            return "dict value"
+        if isinstance(container, (list, tuple, deque)):
+            for index, value in enumerate(container):
+                if value is child:
+                    return f"{type(container).__name__}[{index}]"
+        if isinstance(container, types.CellType):
+            return "closure cell"
+        if isinstance(container, types.FunctionType):
+            return f"function {container.__qualname__}"
+        if isinstance(container, types.MethodType):
+            return f"bound method {container.__func__.__qualname__}"
+        return LeakDetector.describe_object(container)
+
+    @staticmethod
+    def describe_object(obj: Any) -> str:
+        try:
+            name = obj.objectName() if isinstance(obj, QObject) else ""
+        except RuntimeError:
+            name = "<deleted>"  # wrapper kept alive after its C++ object was deleted
+        return f"{type(obj).__module__}.{type(obj).__qualname__}" + (f" '{name}'" if name else "")
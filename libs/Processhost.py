@@ -0,0 +1,192 @@
+import sys
+import json
+from pathlib import Path
+from typing import Optional
+from PyQt6.QtCore import QObject, QProcess, QTimer, pyqtSignal
+from PyQt6.QtGui import QWindow, QGuiApplication
+from PyQt6.QtWidgets import QWidget
+
+from libs.Sourcemanifest import SourceManifest
+from libs.Sourceprocess import PROTOCOL_PREFIX
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Platforms whose windows cannot be embedded across processes
+NO_EMBEDDING_PLATFORMS = ("offscreen", "minimal", "wayland")
+TRANSPORTS = ("auto", "window", "shm")
+
+
+class ProcessHost(QObject):
+    """
+    Runs a hosted source in a child Python process (libs/Sourceprocess.py)
+    and embeds its native window in the host.
+
+    Every `start()` recycles the child, so each reload begins from a clean
+    interpreter; a crash or a hang only takes the child down.
+
+    `transport` is "window" (embed the child's native window), "shm" (the
+    child renders into shared-memory frames shown by a FrameView) or "auto":
+    "window" where the platform can embed foreign windows, "shm" elsewhere,
+    and "shm" again if embedding fails at run time.
+    """
+
+    ready = pyqtSignal(object, dict)   # container widget, ready event (title, cls, pid)
+    failed = pyqtSignal(str)           # the source could not be started
+    crashed = pyqtSignal(str)          # the child died after it was up
+    output = pyqtSignal(str)           # anything the source prints
+
+    def __init__(self, parent: Optional[QObject] = None, transport: str = "auto"):
+        super().__init__(parent)
+        self.transport = transport if transport in TRANSPORTS else "auto"
+        self.process: Optional[QProcess] = None
+        self.manifest: Optional[SourceManifest] = None
+        self.frames = None    # libs.Frametransport.FrameBuffer while the shm transport is in use
+        self.control = None   # libs.Frametransport.ControlRing
+        self.view = None      # libs.Frametransport.FrameView handed out with `ready`
+        self._buffer = b""
+        self._is_up = False
+        self._reported = False
+        self._stopping = False
+
+    # ----------------- Lifecycle -----------------
+    def resolve_transport(self) -> str:
+        if self.transport != "auto":
+            return self.transport
+        return "shm" if QGuiApplication.platformName() in NO_EMBEDDING_PLATFORMS else "window"
+
+    def start(self, manifest: SourceManifest, transport: Optional[str] = None):
+        self.stop()
+        self.manifest = manifest
+        self._buffer = b""
+        self._is_up = False
+        self._reported = False
+        self._stopping = False
+
+        process = QProcess(self)
+        process.setProgram(sys.executable)
+        arguments = ["-m", "libs.Sourceprocess", str(manifest.path)]
+        if (transport or self.resolve_transport()) == "shm":
+            from libs.Frametransport import FrameBuffer, ControlRing
+            self.frames, self.control = FrameBuffer(), ControlRing()
+            arguments += ["--frames", self.frames.name, "--control", self.control.name]
+        process.setArguments(arguments)
+        process.setWorkingDirectory(str(REPO_ROOT))
+        process.readyReadStandardOutput.connect(self._on_stdout)
+        process.readyReadStandardError.connect(self._on_stderr)
+        process.finished.connect(self._on_finished)
+        process.errorOccurred.connect(self._on_error)
+        self.process = process
+        process.start()
+
+    def stop(self, timeout_ms: int = 500):
+        """Ask the child to quit; kill it if it does not within `timeout_ms`."""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        self._stopping = True
+        process.blockSignals(True)
+        if process.state() != QProcess.ProcessState.NotRunning:
+            self._write(process, {"cmd": "quit"})
+            if not process.waitForFinished(timeout_ms):
+                process.kill()
+                process.waitForFinished(1000)
+        process.deleteLater()
+        self._release_frames()
+
+    def _release_frames(self):
+        """Close the shared-memory segments once nothing reads them any more."""
+        if self.view is not None:
+            try:
+                self.view.detach()
+            except RuntimeError:
+                pass  # already deleted by the renderer
+            self.view = None
+        for segment in (self.frames, self.control):
+            if segment is not None:
+                segment.close()
+        self.frames = self.control = None
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.state() != QProcess.ProcessState.NotRunning
+
+    def send(self, **message):
+        if self.is_running():
+            self._write(self.process, message)
+
+    @staticmethod
+    def _write(process: QProcess, message: dict):
+        process.write((json.dumps(message) + "\n").encode())
+
+    # ----------------- Child output -----------------
+    def _on_stdout(self):
+        self._buffer += bytes(self.process.readAllStandardOutput())
+        *lines, self._buffer = self._buffer.split(b"\n")
+        for raw in lines:
+            line = raw.decode(errors="replace").rstrip("\r")
+            if line.startswith(PROTOCOL_PREFIX):
+                try:
+                    self._handle(json.loads(line[len(PROTOCOL_PREFIX):]))
+                except ValueError:
+                    self.output.emit(line)
+            elif line:
+                self.output.emit(line)
+
+    def _on_stderr(self):
+        text = bytes(self.process.readAllStandardError()).decode(errors="replace")
+        for line in text.splitlines():
+            self.output.emit(line)
+
+    def _handle(self, message: dict):
+        event = message.get("event")
+        if event == "error":
+            self._reported = True
+            self.failed.emit(message.get("message", "Unknown error"))
+            if message.get("traceback"):
+                self.output.emit(message["traceback"])
+        elif event == "ready" and message.get("transport") == "shm":
+            from libs.Frametransport import FrameView
+            self.view = FrameView(self.frames, self.control)
+            self.view.needs_capacity.connect(self._grow_frames)
+            self.view.setWindowTitle(message.get("title", ""))
+            self._is_up = True
+            self.ready.emit(self.view, message)
+        elif event == "ready":
+            window = QWindow.fromWinId(message["win_id"])
+            if window is None:
+                if self.transport == "auto":
+                    self.output.emit("This platform cannot embed windows from another process; "
+                                     "using shared-memory frames")
+                    # Not from inside this process's own output handler
+                    QTimer.singleShot(0, lambda: self.start(self.manifest, transport="shm"))
+                else:
+                    self.stop()
+                    self.failed.emit("This platform cannot embed windows from another process")
+                return
+            container = QWidget.createWindowContainer(window)
+            container.setObjectName("ProcessContainer")
+            self._is_up = True
+            self.ready.emit(container, message)
+
+    def _grow_frames(self, width: int, height: int):
+        """The view outgrew the frame buffer: hand the child a larger one."""
+        from libs.Frametransport import FrameBuffer, BYTES_PER_PIXEL
+        if self.view is None or not self.is_running():
+            return
+        old, self.frames = self.frames, FrameBuffer(capacity=width * height * BYTES_PER_PIXEL)
+        self.view.set_frames(self.frames)
+        self.send(cmd="frames", name=self.frames.name)
+        old.close()  # the child's mapping stays valid until it switches over
+
+    def _on_finished(self, exit_code: int, status: QProcess.ExitStatus):
+        if self._stopping or self._reported:
+            return
+        if status == QProcess.ExitStatus.CrashExit:
+            self.crashed.emit(f"Source process crashed (exit code {exit_code})")
+        elif self._is_up:
+            self.crashed.emit(f"Source process exited (exit code {exit_code})")
+        elif exit_code != 0:
+            self.failed.emit(f"Source process exited during start-up (exit code {exit_code})")
+
+    def _on_error(self, error: QProcess.ProcessError):
+        if error == QProcess.ProcessError.FailedToStart:
+            self.failed.emit(f"Could not start {sys.executable}")
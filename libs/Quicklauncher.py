@@ -0,0 +1,90 @@
+import time
+from pathlib import Path
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel
+
+from libs.Sourceindex import SourceIndex
+
+
+class QuickLauncher(QDialog):
+    """Ctrl+P style fuzzy launcher over the workspace source index."""
+
+    source_selected = pyqtSignal(object)  # Path to the .ini manifest
+
+    def __init__(self, index: SourceIndex, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.setObjectName("QuickLauncher")
+        self.setWindowTitle("Quick Open")
+        self.setWindowFlag(Qt.WindowType.FramelessWindowHint, True)
+        self.resize(560, 380)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setObjectName("QuickLauncherSearch")
+        self.search_edit.setPlaceholderText("Type to search sources…")
+        layout.addWidget(self.search_edit)
+
+        self.result_list = QListWidget()
+        self.result_list.setObjectName("QuickLauncherResults")
+        self.result_list.setUniformItemSizes(True)
+        layout.addWidget(self.result_list, 1)
+
+        self.info_label = QLabel("")
+        self.info_label.setObjectName("QuickLauncherInfo")
+        layout.addWidget(self.info_label)
+
+        self.search_edit.textChanged.connect(self.update_results)
+        self.search_edit.returnPressed.connect(self.accept_current)
+        self.result_list.itemActivated.connect(lambda _item: self.accept_current())
+        self.search_edit.installEventFilter(self)
+
+    def open_launcher(self):
+        """Show the launcher with an empty query."""
+        self.search_edit.clear()
+        self.update_results("")
+        if self.parent() is not None:
+            parent_geo = self.parent().geometry()
+            self.move(parent_geo.center().x() - self.width() // 2, parent_geo.top() + 80)
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.search_edit.setFocus()
+
+    def update_results(self, text: str):
+        start = time.perf_counter()
+        results = self.index.search(text)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        self.result_list.setUpdatesEnabled(False)
+        self.result_list.clear()
+        for entry in results:
+            item = QListWidgetItem(f"{entry.module}  ·  {entry.entry_point}    {entry.folder}")
+            item.setData(Qt.ItemDataRole.UserRole, entry.manifest)
+            item.setToolTip(entry.description or entry.manifest)
+            self.result_list.addItem(item)
+        self.result_list.setUpdatesEnabled(True)
+        if results:
+            self.result_list.setCurrentRow(0)
+        self.info_label.setText(f"{len(results)} of {len(self.index.entries)} sources · {elapsed:.2f} ms")
+
+    def accept_current(self):
+        item = self.result_list.currentItem()
+        if item is None:
+            return
+        self.hide()
+        self.source_selected.emit(Path(item.data(Qt.ItemDataRole.UserRole)))
+
+    def eventFilter(self, obj, event):
+        # Let the arrow keys move the selection while typing
+        if obj is self.search_edit and event.type() == QEvent.Type.KeyPress:
+            if event.key() in (Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_PageUp, Qt.Key.Key_PageDown):
+                self.result_list.keyPressEvent(event)
+                return True
+            if event.key() == Qt.Key.Key_Escape:
+                self.hide()
+                return True
+        return super().eventFilter(obj, event)
@@ -0,0 +1,170 @@
+"""
+Render caches for animated, painted widgets.
+
+Most of what such a widget paints every frame does not change between
+frames: the background only changes with the widget size, and the shapes
+come from a small set (a ring of a given radius and alpha). Rendering
+them once into pixmaps turns each frame into blits:
+
+    BackgroundCache   the background, re-rendered only when the size changes
+    SpriteCache       bounded LRU of pre-rendered pixmaps keyed by anything
+    RingSprites       antialiased ring sprites keyed by (radius, alpha level)
+    blit_batch()      draw many cached sprites, one drawPixmapFragments()
+                      call per distinct sprite instead of one per shape
+
+    background = BackgroundCache(vertical_gradient(QColor(0, 100, 180), QColor(0, 200, 255)))
+    rings = RingSprites(QColor(0, 255, 255))
+    ...
+    background.paint(painter, self)
+    blit_batch(painter, rings, rings.keys(radii, alphas), xs, ys)
+"""
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import numpy as np
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QSize, QRect, QPointF
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap, QPen, QLinearGradient
+
+# Columns of a QPainter.PixmapFragment (ten doubles), as in libs/Particleengine.py
+_X, _Y, _SOURCE_LEFT, _SOURCE_TOP, _WIDTH, _HEIGHT, _SCALE_X, _SCALE_Y, _ROTATION, _OPACITY = range(10)
+
+
+class BackgroundCache:
+    """
+    A background rendered once per widget size by `draw(painter, rect)`.
+    Only the current size is kept: a resize re-renders it once.
+    """
+
+    def __init__(self, draw: Callable[[QPainter, QRect], None]):
+        self.draw = draw
+        self._pixmap = None
+        self._key = None
+        self.renders = 0
+
+    def pixmap(self, size: QSize, ratio: float = 1.0) -> QPixmap:
+        key = (size.width(), size.height(), ratio)
+        if key != self._key:
+            pixmap = QPixmap(max(1, round(size.width() * ratio)), max(1, round(size.height() * ratio)))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            self.draw(painter, QRect(0, 0, size.width(), size.height()))
+            painter.end()
+            self._pixmap, self._key = pixmap, key
+            self.renders += 1
+        return self._pixmap
+
+    def paint(self, painter: QPainter, widget):
+        """Blit the background of `widget` at its current size."""
+        painter.drawPixmap(0, 0, self.pixmap(widget.size(), widget.devicePixelRatioF()))
+
+    def invalidate(self):
+        self._pixmap = self._key = None
+
+
+def vertical_gradient(top: QColor, bottom: QColor) -> Callable[[QPainter, QRect], None]:
+    """`BackgroundCache` draw function: a top-to-bottom linear gradient."""
+    def draw(painter: QPainter, rect: QRect):
+        gradient = QLinearGradient(0, rect.top(), 0, rect.bottom() + 1)
+        gradient.setColorAt(0, top)
+        gradient.setColorAt(1, bottom)
+        painter.fillRect(rect, gradient)
+    return draw
+
+
+class SpriteCache:
+    """
+    Least-recently-used cache of at most `limit` pixmaps; `render(key)`
+    draws a missing one. Keys can be anything hashable; `blit_batch()`
+    needs integer keys, like the ones `RingSprites.keys()` makes.
+    """
+
+    def __init__(self, render: Callable[[Hashable], QPixmap], limit: int = 256):
+        self.render = render
+        self.limit = limit
+        self._sprites: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def get(self, key: Hashable) -> QPixmap:
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        sprite = self._sprites[key] = self.render(key)
+        if len(self._sprites) > self.limit:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def clear(self):
+        self._sprites.clear()
+
+
+class RingSprites(SpriteCache):
+    """
+    Antialiased rings of one colour, `pen_width` wide, keyed by whole-pixel
+    radius and one of `levels` alpha levels (alpha 0-255 is quantised, so
+    a fading ring reuses a handful of sprites instead of one per frame).
+    """
+
+    def __init__(self, color: QColor, pen_width: float = 1.0, levels: int = 32, limit: int = 512):
+        super().__init__(self._render_ring, limit)
+        self.color = QColor(color)
+        self.pen_width = pen_width
+        self.levels = levels
+
+    def keys(self, radii, alphas) -> np.ndarray:
+        """Vectorised keys for arrays of radii (pixels) and alphas (0-255)."""
+        radius = np.maximum(np.rint(radii), 1).astype(np.int64)
+        level = np.rint(np.clip(alphas, 0, 255) * (self.levels - 1) / 255).astype(np.int64)
+        return radius * self.levels + level
+
+    def _render_ring(self, key: int) -> QPixmap:
+        radius, level = divmod(int(key), self.levels)
+        margin = self.pen_width / 2 + 1
+        side = int(2 * (radius + margin)) | 1   # odd: the centre falls on a pixel
+        image = QImage(side, side, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        color = QColor(self.color)
+        color.setAlpha(round(level * 255 / (self.levels - 1)))
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(color, self.pen_width))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(QPointF(side / 2, side / 2), radius, radius)
+        painter.end()
+        return QPixmap.fromImage(image)
+
+
+def blit_batch(painter: QPainter, sprites: SpriteCache, keys: np.ndarray, xs: np.ndarray, ys: np.ndarray):
+    """
+    Draw `sprites.get(key)` centred on (x, y) for every element, with one
+    `drawPixmapFragments()` call per distinct key, so the number of calls
+    is bounded by the sprites in use rather than the number of shapes.
+    """
+    if not len(keys):
+        return
+    order = np.argsort(keys, kind="stable")
+    keys, xs, ys = keys[order], np.asarray(xs)[order], np.asarray(ys)[order]
+    n = len(keys)
+    fragments = sip.array(QPainter.PixmapFragment, n)
+    columns = np.frombuffer(memoryview(fragments), dtype=np.float64).reshape(n, 10)
+    columns[:, _X] = xs
+    columns[:, _Y] = ys
+    columns[:, _SOURCE_LEFT:_SOURCE_TOP + 1] = 0
+    columns[:, _SCALE_X:_SCALE_Y + 1] = 1
+    columns[:, _ROTATION] = 0
+    columns[:, _OPACITY] = 1
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1, [n]))
+    for start, end in zip(starts[:-1], starts[1:]):
+        sprite = sprites.get(int(keys[start]))
+        columns[start:end, _WIDTH] = sprite.width()
+        columns[start:end, _HEIGHT] = sprite.height()
+        painter.drawPixmapFragments(fragments[start:end], sprite)
@@ -0,0 +1,134 @@
+"""
+Repaint overlay: which parts of a hosted widget are being repainted.
+
+A frameless, see-through, input-transparent window kept over the widget.
+It watches the Paint events of the widget and its children, flashes each
+repainted region for FADE_S seconds and shows the share of pixels
+repainted and saved (against repainting every widget whole on every
+paint) over the last STATS_S seconds.
+
+It is a separate window so that drawing the flashes never repaints the
+widget underneath, which would feed back into what is measured. Where
+windows cannot be placed (Wayland) it may not line up with the widget.
+"""
+import math
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QTimer, QEvent, QPoint, QRect, QSize
+from PyQt6.QtGui import QPainter, QColor, QRegion, QImage, QFont
+from PyQt6.QtWidgets import QWidget, QApplication
+
+FADE_S = 0.5
+STATS_S = 1.0
+FLASH_COLOR = QColor(255, 0, 96)
+AREA_SCALE = 0.25   # regions are rasterised at this scale to measure them
+
+
+def region_area(region: QRegion, size: QSize) -> float:
+    """Pixels covered by `region` inside a `size` widget (approximate unless it is one rect)."""
+    if region.rectCount() <= 1:
+        r = region.boundingRect().intersected(QRect(QPoint(0, 0), size))
+        return float(max(0, r.width()) * max(0, r.height()))
+    # PyQt6 cannot list the rects of a QRegion: rasterise it small and count
+    w, h = max(1, math.ceil(size.width() * AREA_SCALE)), max(1, math.ceil(size.height() * AREA_SCALE))
+    image = QImage(w, h, QImage.Format.Format_Grayscale8)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.scale(AREA_SCALE, AREA_SCALE)
+    painter.setClipRegion(region)
+    painter.fillRect(QRect(QPoint(0, 0), size), Qt.GlobalColor.white)
+    painter.end()
+    bits = np.frombuffer(image.constBits().asstring(image.sizeInBytes()), dtype=np.uint8)
+    covered = bits.reshape(h, image.bytesPerLine())[:, :w]
+    return float(np.count_nonzero(covered)) / (AREA_SCALE * AREA_SCALE)
+
+
+class RepaintOverlay(QWidget):
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent, Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint
+                         | Qt.WindowType.WindowTransparentForInput | Qt.WindowType.WindowStaysOnTopHint
+                         | Qt.WindowType.WindowDoesNotAcceptFocus)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.target: Optional[QWidget] = None
+        self.flashes: deque = deque()   # (time, region in target coordinates)
+        self.samples: deque = deque()   # (time, repainted pixels, widget pixels)
+        self.label_font = QFont()
+        self.label_font.setBold(True)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(33)
+        self.timer.timeout.connect(self.refresh)
+
+    def watch(self, widget: Optional[QWidget]):
+        """Follow `widget` (None stops)."""
+        app = QApplication.instance()
+        if self.target is None and widget is not None:
+            app.installEventFilter(self)
+            self.timer.start()
+        elif self.target is not None and widget is None:
+            app.removeEventFilter(self)
+            self.timer.stop()
+            self.hide()
+        self.target = widget
+        self.flashes.clear()
+        self.samples.clear()
+        self.refresh()
+
+    # ----------------- Measuring -----------------
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and obj is not self and obj.isWidgetType():
+            target = self.target
+            if target is not None and not sip.isdeleted(target) and (obj is target or target.isAncestorOf(obj)):
+                region = event.region()
+                now = time.monotonic()
+                self.flashes.append((now, region.translated(obj.mapTo(target, QPoint(0, 0)))))
+                self.samples.append((now, region_area(region, obj.size()), obj.width() * obj.height()))
+        return False
+
+    def stats(self) -> tuple[float, int]:
+        """(share of pixels saved, paints) over the last STATS_S seconds."""
+        painted = sum(s[1] for s in self.samples)
+        full = sum(s[2] for s in self.samples)
+        return (1 - painted / full if full else 0.0), len(self.samples)
+
+    # ----------------- Display -----------------
+    def refresh(self):
+        target = self.target
+        if target is None or sip.isdeleted(target) or not target.isVisible():
+            self.hide()
+            return
+        now = time.monotonic()
+        while self.flashes and now - self.flashes[0][0] > FADE_S:
+            self.flashes.popleft()
+        while self.samples and now - self.samples[0][0] > STATS_S:
+            self.samples.popleft()
+        geometry = QRect(target.mapToGlobal(QPoint(0, 0)), target.size())
+        if geometry != self.geometry():
+            self.setGeometry(geometry)
+        if not self.isVisible():
+            self.show()
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        now = time.monotonic()
+        for stamp, region in self.flashes:
+            color = QColor(FLASH_COLOR)
+            color.setAlpha(int(110 * max(0.0, 1 - (now - stamp) / FADE_S)))
+            painter.setClipRegion(region)
+            painter.fillRect(self.rect(), color)
+        painter.setClipping(False)
+
+        saved, paints = self.stats()
+        text = f"repainted {100 * (1 - saved) if paints else 0:.1f}%  ·  saved {100 * saved:.1f}%  ·  {paints / STATS_S:.0f} paints/s"
+        painter.setFont(self.label_font)
+        box = painter.fontMetrics().boundingRect(text).adjusted(-8, -4, 8, 4)
+        box.moveTopLeft(QPoint(8, 8))
+        painter.fillRect(box, QColor(0, 0, 0, 170))
+        painter.setPen(QColor(255, 255, 255))
+        painter.drawText(box, Qt.AlignmentFlag.AlignCenter, text)
@@ -0,0 +1,141 @@
+import time
+import threading
+import tracemalloc
+from collections import deque
+from typing import NamedTuple, Optional
+from PyQt6.QtCore import QThread, QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+
+class ResourceSample(NamedTuple):
+    t: float              # seconds since the monitor started
+    rss_mb: float
+    cpu_percent: float
+    threads: int
+    traced_mb: float      # tracemalloc current size, 0 when not tracing
+    qobjects: int
+    qwidgets: int
+
+
+class ReloadMarker(NamedTuple):
+    t: float
+    label: str
+    sample: ResourceSample
+    top_allocations: list[str]   # tracemalloc growth since the previous marker
+
+
+class ResourceMonitor(QThread):
+    """
+    Samples the host process on a background thread into a ring buffer.
+
+    RSS, CPU% and thread count come from psutil (imported by the thread,
+    not at startup). QObject/QWidget counts can only be taken on the GUI
+    thread, so the host feeds them through `update_qt_counts()` from a
+    timer. `mark()` puts a reload on the timeline together with the
+    resources at that moment, so growth can be attributed per reload.
+    """
+
+    sample_added = pyqtSignal(object)   # ResourceSample
+    marker_added = pyqtSignal(object)   # ReloadMarker
+
+    def __init__(self, capacity: int = 600, interval_ms: int = 1000, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.samples: deque[ResourceSample] = deque(maxlen=capacity)
+        self.markers: deque[ReloadMarker] = deque(maxlen=100)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = False
+        self._started = time.perf_counter()
+        self._qt_counts = (0, 0)
+        self._process = None
+        self._last_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    # ----------------- Thread -----------------
+    def stop(self):
+        self._stop = True
+        self._wake.set()
+
+    def run(self):
+        try:
+            import psutil
+            self._process = psutil.Process()
+            self._process.cpu_percent(None)  # first call only primes the counter
+        except ImportError:
+            print("[ResourceMonitor] psutil not installed; only Qt object counts are sampled")
+
+        while not self._stop:
+            sample = self._sample(cpu=True)
+            with self._lock:
+                self.samples.append(sample)
+            self.sample_added.emit(sample)
+            self._wake.wait(self.interval_ms / 1000)
+
+    def _sample(self, cpu: bool) -> ResourceSample:
+        rss_mb = cpu_percent = 0.0
+        threads = 0
+        if self._process is not None:
+            try:
+                rss_mb = self._process.memory_info().rss / 1024 / 1024
+                threads = self._process.num_threads()
+                if cpu:
+                    cpu_percent = self._process.cpu_percent(None)
+                elif self.samples:
+                    cpu_percent = self.samples[-1].cpu_percent
+            except Exception as e:
+                print(f"[ResourceMonitor] Sampling failed: {e}")
+        traced_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024 if tracemalloc.is_tracing() else 0.0
+        qobjects, qwidgets = self._qt_counts
+        return ResourceSample(time.perf_counter() - self._started, rss_mb, cpu_percent,
+                              threads, traced_mb, qobjects, qwidgets)
+
+    # ----------------- GUI thread -----------------
+    def update_qt_counts(self):
+        """Count live QObjects and QWidgets; must be called on the GUI thread."""
+        app = QApplication.instance()
+        if app is None:
+            return
+        widgets = QApplication.allWidgets()
+        qobjects = len(app.findChildren(QObject))
+        for top in QApplication.topLevelWidgets():
+            qobjects += 1 + len(top.findChildren(QObject))
+        self._qt_counts = (qobjects, len(widgets))
+
+    def mark(self, label: str) -> ReloadMarker:
+        """Put `label` on the timeline with the resources at this moment."""
+        self.update_qt_counts()
+        marker = ReloadMarker(time.perf_counter() - self._started, label,
+                              self._sample(cpu=False), self._allocation_growth())
+        with self._lock:
+            self.markers.append(marker)
+        self.marker_added.emit(marker)
+        return marker
+
+    # ----------------- Allocations -----------------
+    @staticmethod
+    def set_trace_allocations(enabled: bool):
+        """tracemalloc slows every allocation down, so it is opt-in."""
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not enabled and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _allocation_growth(self, limit: int = 5) -> list[str]:
+        if not tracemalloc.is_tracing():
+            self._last_snapshot = None
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        previous, self._last_snapshot = self._last_snapshot, snapshot
+        if previous is None:
+            stats = snapshot.statistics("lineno")[:limit]
+            return [f"{s.traceback[0].filename}:{s.traceback[0].lineno} {s.size / 1024:.1f} KiB" for s in stats]
+        growth = [s for s in snapshot.compare_to(previous, "lineno") if s.size_diff > 0][:limit]
+        return [f"{s.traceback[0].filename}:{s.traceback[0].lineno} +{s.size_diff / 1024:.1f} KiB" for s in growth]
+
+    # ----------------- Access -----------------
+    def history(self) -> tuple[list[ResourceSample], list[ReloadMarker]]:
+        with self._lock:
+            return list(self.samples), list(self.markers)
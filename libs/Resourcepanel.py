@@ -0,0 +1,161 @@
+from typing import Optional
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QPainter, QPen, QColor, QPolygonF
+from PyQt6.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QGridLayout, QLabel,
+                             QListWidget, QListWidgetItem, QCheckBox, QSizePolicy)
+
+from libs.Resourcemonitor import ResourceMonitor, ResourceSample, ReloadMarker
+
+# (field, label, unit) shown as one sparkline each
+METRICS = (
+    ("rss_mb", "RSS", "MB"),
+    ("cpu_percent", "CPU", "%"),
+    ("threads", "Threads", ""),
+    ("traced_mb", "Py alloc", "MB"),
+    ("qobjects", "QObjects", ""),
+    ("qwidgets", "QWidgets", ""),
+)
+
+# Growth between two reloads above which the reload is flagged
+LEAK_RSS_MB = 2.0
+LEAK_QOBJECTS = 50
+
+
+class Sparkline(QWidget):
+    """Minimal line chart: one series scaled to its own range, reload markers as ticks."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values: list[float] = []
+        self.markers: list[float] = []   # 0..1 positions along the x axis
+        self.setMinimumSize(160, 28)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+    def set_data(self, values: list[float], markers: list[float]):
+        self.values = values
+        self.markers = markers
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        w, h = self.width() - 1, self.height() - 3
+
+        painter.setPen(QPen(QColor("#ed8936"), 1, Qt.PenStyle.DashLine))
+        for pos in self.markers:
+            x = pos * w
+            painter.drawLine(QPointF(x, 0), QPointF(x, h + 2))
+
+        if len(self.values) < 2:
+            return
+        low, high = min(self.values), max(self.values)
+        span = (high - low) or 1.0
+        step = w / (len(self.values) - 1)
+        line = QPolygonF([QPointF(i * step, 1 + h - (v - low) / span * h) for i, v in enumerate(self.values)])
+        painter.setPen(QPen(QColor("#4299e1"), 1.5))
+        painter.drawPolyline(line)
+
+
+class ResourcePanel(QDockWidget):
+    """Dock showing the ResourceMonitor timeline and the growth per reload."""
+
+    def __init__(self, monitor: ResourceMonitor, parent=None):
+        super().__init__("Resources", parent)
+        self.setObjectName("ResourcePanel")
+        self.monitor = monitor
+
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(8, 8, 8, 8)
+
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(8)
+        self.value_labels: dict[str, QLabel] = {}
+        self.sparklines: dict[str, Sparkline] = {}
+        for row, (field, label, _unit) in enumerate(METRICS):
+            grid.addWidget(QLabel(label), row, 0)
+            self.sparklines[field] = Sparkline()
+            grid.addWidget(self.sparklines[field], row, 1)
+            self.value_labels[field] = QLabel("-")
+            self.value_labels[field].setMinimumWidth(70)
+            self.value_labels[field].setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            grid.addWidget(self.value_labels[field], row, 2)
+        layout.addLayout(grid)
+
+        self.trace_check = QCheckBox("Track Python allocations (tracemalloc)")
+        self.trace_check.toggled.connect(self.monitor.set_trace_allocations)
+        layout.addWidget(self.trace_check)
+
+        layout.addWidget(QLabel("Reloads (growth since the previous one)"))
+        self.marker_list = QListWidget()
+        self.marker_list.setObjectName("ListView")
+        self.marker_list.currentItemChanged.connect(self.show_marker_details)
+        layout.addWidget(self.marker_list, 1)
+        self.details_label = QLabel("")
+        self.details_label.setWordWrap(True)
+        self.details_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(self.details_label)
+        self.setWidget(container)
+
+        monitor.sample_added.connect(self.refresh)
+        monitor.marker_added.connect(self.add_marker)
+        samples, markers = monitor.history()
+        previous: Optional[ReloadMarker] = None
+        for marker in markers:
+            self.add_marker(marker, previous)
+            previous = marker
+        self.refresh()
+
+    def refresh(self, _sample: Optional[ResourceSample] = None):
+        if not self.isVisible():
+            return
+        samples, markers = self.monitor.history()
+        if not samples:
+            return
+        start, end = samples[0].t, samples[-1].t
+        span = (end - start) or 1.0
+        positions = [(m.t - start) / span for m in markers if start <= m.t <= end]
+        for field, _label, unit in METRICS:
+            values = [getattr(s, field) for s in samples]
+            self.sparklines[field].set_data(values, positions)
+            value = values[-1]
+            self.value_labels[field].setText(f"{value:.1f} {unit}".strip() if isinstance(value, float) else str(value))
+
+    def add_marker(self, marker: ReloadMarker, previous: Optional[ReloadMarker] = None):
+        if previous is None:
+            _, markers = self.monitor.history()
+            index = next((i for i, m in enumerate(markers) if m is marker), len(markers))
+            previous = markers[index - 1] if index > 0 else None
+
+        text = f"{marker.t:8.1f}s  {marker.label}"
+        leaked = False
+        if previous is not None:
+            rss = marker.sample.rss_mb - previous.sample.rss_mb
+            objects = marker.sample.qobjects - previous.sample.qobjects
+            widgets = marker.sample.qwidgets - previous.sample.qwidgets
+            text += f"   RSS {rss:+.1f} MB   QObjects {objects:+d}   QWidgets {widgets:+d}"
+            leaked = rss > LEAK_RSS_MB or objects > LEAK_QOBJECTS
+        item = QListWidgetItem(text)
+        item.setData(Qt.ItemDataRole.UserRole, marker)
+        if leaked:
+            item.setForeground(QColor("#f56565"))
+        self.marker_list.insertItem(0, item)
+        self.refresh()
+
+    def show_marker_details(self, item: Optional[QListWidgetItem], _previous=None):
+        if item is None:
+            self.details_label.setText("")
+            return
+        marker: ReloadMarker = item.data(Qt.ItemDataRole.UserRole)
+        lines = [f"RSS {marker.sample.rss_mb:.1f} MB, {marker.sample.qobjects} QObjects, "
+                 f"{marker.sample.qwidgets} QWidgets, {marker.sample.threads} threads"]
+        if marker.top_allocations:
+            lines.append("Top allocation growth:")
+            lines.extend(f"  {line}" for line in marker.top_allocations)
+        elif not self.trace_check.isChecked():
+            lines.append("Enable allocation tracking to see where Python memory went.")
+        self.details_label.setText("\n".join(lines))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
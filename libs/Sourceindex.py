@@ -0,0 +1,263 @@
+import os
+import re
+import heapq
+import sqlite3
+from pathlib import Path
+from typing import NamedTuple
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from libs.Databasconnector import DatabaseConnector
+from libs.Sourcemanifest import SourceManifest, ManifestError
+
+# Folders never worth descending into
+SKIP_DIRS = {"__pycache__", "venv", ".venv", "env", "node_modules", "build", "dist", "site-packages"}
+
+
+class SourceEntry(NamedTuple):
+    manifest: str
+    folder: str
+    module: str
+    entry_point: str
+    description: str
+
+
+# ----------------- Indexer -----------------
+def scan_dir(folder: str) -> tuple[list[str], list[tuple[Path, float]]]:
+    """One directory listing: (sub-directories worth visiting, [(.ini path, mtime)])."""
+    subdirs: list[str] = []
+    manifests: list[tuple[Path, float]] = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif name.endswith(".ini"):
+                        manifests.append((Path(entry.path), entry.stat().st_mtime))
+                except OSError:
+                    continue
+    except OSError as e:
+        print(f"[SourceIndexer] Cannot list {folder}: {e}")
+    return subdirs, manifests
+
+
+def find_manifests(root: str | Path) -> list[SourceManifest]:
+    """Every `[source]` manifest under `root`, without the database (sorted by path)."""
+    found = []
+    stack = [str(Path(root).resolve())]
+    while stack:
+        subdirs, manifests = scan_dir(stack.pop())
+        stack.extend(subdirs)
+        for path, _mtime in manifests:
+            try:
+                found.append(SourceManifest.parse(path))
+            except (OSError, ManifestError):
+                continue  # not a source manifest
+    return sorted(found, key=lambda m: str(m.path))
+
+
+class SourceIndexer(QThread):
+    """
+    Background walker that keeps the SOURCES table in sync with the
+    `[source]` manifests found under the workspace roots.
+
+    A directory whose mtime is unchanged since the last run is not listed
+    again: its sub-directories come from SOURCE_DIRS and only its known
+    manifests are stat'ed for in-place edits.
+    """
+
+    progress_update = pyqtSignal(int, str)   # directories visited, current root
+    index_updated = pyqtSignal(int, int)     # manifests indexed, manifests (re)parsed
+
+    def __init__(self, db: DatabaseConnector, roots: list[str | Path]):
+        super().__init__()
+        self.db = db
+        self.roots = [str(Path(r).resolve()) for r in roots]
+        self._stop = False
+
+    def stop(self):
+        self._stop = True
+
+    def run(self):
+        conn = self.db.connect()
+        if conn is None:
+            return
+        parsed = 0
+        try:
+            cursor = conn.cursor()
+            self._purge_removed_roots(cursor)
+            for root in self.roots:
+                if self._stop:
+                    break
+                parsed += self._refresh_root(cursor, root)
+                conn.commit()
+            total = cursor.execute("SELECT COUNT(*) FROM SOURCES").fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"[SourceIndexer] Index error: {e}")
+            return
+        finally:
+            conn.commit()
+            conn.close()
+        self.index_updated.emit(total, parsed)
+
+    def _purge_removed_roots(self, cursor: sqlite3.Cursor):
+        marks = ", ".join("?" for _ in self.roots) or "''"
+        cursor.execute(f"DELETE FROM SOURCES WHERE ROOT NOT IN ({marks})", self.roots)
+        cursor.execute(f"DELETE FROM SOURCE_DIRS WHERE ROOT NOT IN ({marks})", self.roots)
+
+    def _refresh_root(self, cursor: sqlite3.Cursor, root: str) -> int:
+        # Load what we know about this root in two queries instead of one per dir
+        known_dirs: dict[str, float] = {}
+        children: dict[str, list[str]] = {}
+        for path, parent, mtime in cursor.execute(
+                "SELECT PATH, PARENT, MTIME FROM SOURCE_DIRS WHERE ROOT = ?", (root,)):
+            known_dirs[path] = mtime
+            children.setdefault(parent, []).append(path)
+        known_manifests: dict[str, list[tuple[str, float]]] = {}
+        for manifest, folder, mtime in cursor.execute(
+                "SELECT MANIFEST, FOLDER, MTIME FROM SOURCES WHERE ROOT = ?", (root,)):
+            known_manifests.setdefault(folder, []).append((manifest, mtime))
+
+        parsed = 0
+        visited = 0
+        stack = [root]
+        while stack and not self._stop:
+            folder = stack.pop()
+            visited += 1
+            if visited % 500 == 0:
+                self.progress_update.emit(visited, root)
+            try:
+                dir_mtime = os.stat(folder).st_mtime
+            except OSError:
+                self._forget_dir(cursor, folder)
+                continue
+
+            if known_dirs.get(folder) == dir_mtime:
+                # Listing unchanged; only check known manifests for edits
+                stack.extend(children.get(folder, []))
+                for manifest, mtime in known_manifests.get(folder, []):
+                    try:
+                        current = os.stat(manifest).st_mtime
+                    except OSError:
+                        cursor.execute("DELETE FROM SOURCES WHERE MANIFEST = ?", (manifest,))
+                        continue
+                    if current != mtime:
+                        parsed += self._index_manifest(cursor, root, Path(manifest), current)
+                continue
+
+            subdirs, manifests = scan_dir(folder)
+            cursor.execute(
+                "INSERT OR REPLACE INTO SOURCE_DIRS (PATH, PARENT, ROOT, MTIME) VALUES (?, ?, ?, ?)",
+                (folder, str(Path(folder).parent) if folder != root else "", root, dir_mtime)
+            )
+            for stale in set(children.get(folder, [])) - set(subdirs):
+                self._forget_dir(cursor, stale)
+            current = {str(m) for m, _ in manifests}
+            for manifest, _ in known_manifests.get(folder, []):
+                if manifest not in current:
+                    cursor.execute("DELETE FROM SOURCES WHERE MANIFEST = ?", (manifest,))
+            known = dict(known_manifests.get(folder, []))
+            for manifest, mtime in manifests:
+                if known.get(str(manifest)) != mtime:
+                    parsed += self._index_manifest(cursor, root, manifest, mtime)
+            stack.extend(subdirs)
+        return parsed
+
+    def _index_manifest(self, cursor: sqlite3.Cursor, root: str, manifest_path: Path, mtime: float) -> int:
+        try:
+            # Uncached parse: the index should not fill the loader's cache
+            manifest = SourceManifest.parse(manifest_path)
+        except (OSError, ManifestError):
+            # Not a source manifest (or broken); make sure it is not listed
+            cursor.execute("DELETE FROM SOURCES WHERE MANIFEST = ?", (str(manifest_path),))
+            return 0
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO SOURCES
+                (MANIFEST, FOLDER, ROOT, MODULE, ENTRY_POINT, DESCRIPTION, MTIME)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                str(manifest_path), str(manifest_path.parent), root,
+                manifest.module, manifest.entry_point, manifest.description, mtime,
+            )
+        )
+        return 1
+
+    def _forget_dir(self, cursor: sqlite3.Cursor, folder: str):
+        """Drop a directory and everything indexed below it."""
+        prefix = folder + os.sep
+        cursor.execute(
+            "DELETE FROM SOURCE_DIRS WHERE PATH = ? OR substr(PATH, 1, ?) = ?",
+            (folder, len(prefix), prefix)
+        )
+        cursor.execute(
+            "DELETE FROM SOURCES WHERE FOLDER = ? OR substr(FOLDER, 1, ?) = ?",
+            (folder, len(prefix), prefix)
+        )
+
+
+# ----------------- Fuzzy search -----------------
+class SourceIndex:
+    """
+    In-memory fuzzy finder over the SOURCES table.
+
+    Every haystack is padded to the same width and joined into one string,
+    so a query is a single regex scan in C and the row of a match is one
+    integer division. Python only touches the matching rows.
+    """
+
+    MAX_WIDTH = 96
+
+    def __init__(self, db: DatabaseConnector | None = None):
+        self.db = db
+        self.entries: list[SourceEntry] = []
+        self._text = ""
+        self._stride = 1
+
+    def load(self):
+        """Reload entries from the database."""
+        rows = []
+        if self.db is not None:
+            rows = self.db.execute_query(
+                "SELECT MANIFEST, FOLDER, MODULE, ENTRY_POINT, DESCRIPTION FROM SOURCES ORDER BY MODULE",
+                fetch_all=True
+            ) or []
+        self.set_entries([SourceEntry(*row) for row in rows])
+
+    def set_entries(self, entries: list[SourceEntry]):
+        self.entries = list(entries)
+        haystacks = [
+            f"{e.module} {e.entry_point} {Path(e.folder).name}".replace("\n", " ").lower()
+            for e in self.entries
+        ]
+        width = min(self.MAX_WIDTH, max((len(h) for h in haystacks), default=0))
+        self._stride = width + 1
+        # Every row starts with its own newline: "\nrow0\nrow1..."
+        self._text = "".join("\n" + h[:width].ljust(width) for h in haystacks)
+
+    @staticmethod
+    def _compile(chars: list[str]) -> re.Pattern:
+        # \n[^c0]*(c0[^c1]*c1...) only starts at row boundaries and the
+        # possessive quantifiers never backtrack, so a scan is linear.
+        escaped = [re.escape(c) for c in chars]
+        body = escaped[0] + "".join(f"[^{c}\\n]*+{c}" for c in escaped[1:])
+        return re.compile(f"\\n[^{escaped[0]}\\n]*+({body})")
+
+    def search(self, query: str, limit: int = 50) -> list[SourceEntry]:
+        """Return up to `limit` entries whose name contains `query` as a subsequence."""
+        chars = [c for c in query.lower() if not c.isspace()]
+        if not chars:
+            return self.entries[:limit]
+
+        # Tight matches first, then matches near the start of the module name
+        scored = [
+            (m.end(1) - m.start(1), m.start(1) - m.start(), m.start())
+            for m in self._compile(chars).finditer(self._text)
+        ]
+        best = heapq.nsmallest(limit, scored)
+        return [self.entries[pos // self._stride] for *_, pos in best]
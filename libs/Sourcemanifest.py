@@ -0,0 +1,136 @@
+import os
+import threading
+import configparser
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+
+class ManifestError(ValueError):
+    """Raised when a source .ini cannot be used as a manifest."""
+
+
+@dataclass(frozen=True)
+class SourceManifest:
+    """
+    Typed view of a source `.ini` manifest.
+
+    Parsed once per file change: `SourceManifest.load()` returns the cached
+    instance while the file's mtime and size are unchanged, so the loader,
+    the validator and the widget factory all see the same object.
+    """
+
+    path: Path
+    module: str
+    entry_point: str = "main_widget"
+    description: str = ""
+    version: str = ""
+    author: str = ""
+    dependencies: dict[str, str] = field(default_factory=dict)   # [dependencies] name = specifier
+    requirements: dict[str, str] = field(default_factory=dict)   # [requirements]
+    compatibility: dict[str, str] = field(default_factory=dict)  # [compatibility]
+    metadata: dict[str, str] = field(default_factory=dict)       # [metadata]
+    stamp: tuple[int, int] = (0, 0)                               # (mtime_ns, size) when parsed
+
+    # ----------------- Derived -----------------
+    @property
+    def folder(self) -> Path:
+        return self.path.parent
+
+    @property
+    def module_path(self) -> Path:
+        return self.folder / f"{self.module}.py"
+
+    @property
+    def requires_mainwindow(self) -> bool:
+        return self.requirements.get("requires_mainwindow", "").strip().lower() in ("1", "true", "yes", "on")
+
+    @property
+    def python_version(self) -> str:
+        return self.compatibility.get("python_version", "")
+
+    @property
+    def platforms(self) -> list[str]:
+        value = self.compatibility.get("platform", "")
+        return [p.strip() for p in value.split(",") if p.strip()]
+
+    # ----------------- Loading -----------------
+    @classmethod
+    def parse(cls, path: str | Path) -> "SourceManifest":
+        """Parse a manifest without touching the cache."""
+        path = Path(path).resolve()
+        st = os.stat(path)
+        config = configparser.ConfigParser(inline_comment_prefixes=("#", ";"))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                config.read_file(f)
+        except (configparser.Error, UnicodeDecodeError) as e:
+            raise ManifestError(f"Malformed config {path.name}: {e}") from e
+
+        if not config.has_section("source"):
+            raise ManifestError(f"Missing [source] section in {path.name}")
+        module = config.get("source", "module", fallback="").strip()
+        if not module:
+            raise ManifestError(f"Invalid Config module specified in {path.name}")
+
+        def section(name: str) -> dict[str, str]:
+            return dict(config.items(name)) if config.has_section(name) else {}
+
+        return cls(
+            path=path,
+            module=module,
+            entry_point=config.get("source", "entry_point", fallback="").strip() or "main_widget",
+            description=config.get("source", "description", fallback="").strip(),
+            version=config.get("source", "version", fallback="").strip(),
+            author=config.get("source", "author", fallback="").strip(),
+            dependencies=section("dependencies"),
+            requirements=section("requirements"),
+            compatibility=section("compatibility"),
+            metadata=section("metadata"),
+            stamp=(st.st_mtime_ns, st.st_size),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SourceManifest":
+        """
+        Return the manifest for `path`, parsing it only if it changed since
+        the last call. Raises FileNotFoundError or ManifestError.
+        """
+        path = Path(path).resolve()
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _cache_lock:
+            cached = _cache.get(path)
+        if cached is not None and cached.stamp == stamp:
+            return cached
+        manifest = cls.parse(path)
+        with _cache_lock:
+            _cache[path] = manifest
+        return manifest
+
+
+_cache: dict[Path, SourceManifest] = {}
+_cache_lock = threading.Lock()
+
+
+def clear_manifest_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+def find_manifest(folder: str | Path) -> Optional[SourceManifest]:
+    """
+    Pick the manifest for a folder. Candidates are tried in name order and
+    the first one whose module file exists wins, so the choice no longer
+    depends on filesystem ordering.
+    """
+    fallback = None
+    for ini_path in sorted(Path(folder).glob("*.ini")):
+        try:
+            manifest = SourceManifest.load(ini_path)
+        except (OSError, ManifestError):
+            continue
+        if manifest.module_path.exists():
+            return manifest
+        fallback = fallback or manifest
+    return fallback
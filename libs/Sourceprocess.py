@@ -0,0 +1,123 @@
+"""
+Child process entry point for out-of-process hosting.
+
+    python -m libs.Sourceprocess path/to/source.ini
+    python -m libs.Sourceprocess path/to/source.ini --frames NAME --control NAME
+
+Imports the source, creates its entry point widget and hands the native
+window id to the host (libs/Processhost.py), which embeds it in the
+renderer. With --frames the widget is never mapped: it renders into the
+host's shared-memory frame buffer instead (libs/Frametransport.py), for
+platforms that cannot embed foreign windows and for headless previews.
+Host -> child commands and child -> host events are JSON lines
+on stdin/stdout; event lines carry PROTOCOL_PREFIX so anything the source
+itself prints is passed through as log output.
+"""
+import os
+import sys
+import json
+import argparse
+import threading
+import importlib.util
+from pathlib import Path
+
+PROTOCOL_PREFIX = "@qtforge "
+
+
+def send(event: str, **fields):
+    sys.stdout.write(PROTOCOL_PREFIX + json.dumps({"event": event, **fields}) + "\n")
+    sys.stdout.flush()
+
+
+def import_source(manifest):
+    spec = importlib.util.spec_from_file_location(manifest.module, manifest.module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[manifest.module] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(argv: list[str] | None = None) -> int:
+    import traceback
+    from PyQt6.QtCore import Qt, QObject, pyqtSignal
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from libs.Sourcemanifest import SourceManifest
+
+    parser = argparse.ArgumentParser(prog="python -m libs.Sourceprocess")
+    parser.add_argument("manifest", nargs="?")
+    parser.add_argument("--frames", help="Shared-memory frame buffer to render into")
+    parser.add_argument("--control", help="Shared-memory input ring that goes with --frames")
+    parser.add_argument("--fps", type=int, default=60)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    if not args.manifest:
+        send("error", message="No manifest given")
+        return 2
+
+    app = QApplication(sys.argv[:1])
+
+    class Commands(QObject):
+        """Reads host commands on a thread; delivers them on the GUI thread."""
+        received = pyqtSignal(dict)
+
+        def read(self):
+            for line in sys.stdin:
+                try:
+                    self.received.emit(json.loads(line))
+                except ValueError:
+                    continue
+            self.received.emit({"cmd": "quit"})  # host went away
+
+    commands = Commands()
+
+    try:
+        manifest = SourceManifest.load(args.manifest)
+        module = import_source(manifest)
+        factory = getattr(module, manifest.entry_point, None)
+        if factory is None:
+            raise AttributeError(f"Entry point '{manifest.entry_point}' not found in module")
+        widget = factory()
+        if not isinstance(widget, QWidget):
+            raise TypeError(f"Entry point must return QWidget, got {type(widget)}")
+    except Exception as e:
+        send("error", message=f"{type(e).__name__}: {e}", traceback=traceback.format_exc())
+        return 1
+
+    publisher = None
+
+    def on_command(message: dict):
+        if message.get("cmd") == "quit":
+            if publisher is not None:
+                publisher.stop()
+            app.quit()
+        elif message.get("cmd") == "frames" and publisher is not None:
+            from libs.Frametransport import FrameBuffer
+            publisher.set_frames(FrameBuffer(message["name"]))
+
+    commands.received.connect(on_command)
+    # Started once connected: commands sent earlier simply wait in the pipe
+    threading.Thread(target=commands.read, daemon=True).start()
+
+    if args.frames:
+        from libs.Frametransport import FrameBuffer, ControlRing, FramePublisher
+        try:
+            publisher = FramePublisher(widget, FrameBuffer(args.frames), ControlRing(args.control), args.fps)
+        except (OSError, ValueError) as e:
+            send("error", message=f"Could not attach the frame buffer: {e}")
+            return 1
+        send("ready", transport="shm", title=widget.windowTitle(),
+             cls=type(widget).__name__, pid=os.getpid())
+        return app.exec()
+
+    # A native, frameless window parked off screen until the host embeds it
+    widget.setWindowFlag(Qt.WindowType.FramelessWindowHint, True)
+    widget.move(-10000, -10000)
+    widget.show()
+    send("ready", transport="window", win_id=int(widget.winId()), title=widget.windowTitle(),
+         cls=type(widget).__name__, pid=os.getpid())
+    return app.exec()
+
+
+if __name__ == "__main__":
+    # Run from the repository root so `libs` is importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    sys.exit(main())
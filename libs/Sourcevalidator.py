@@ -1,14 +1,188 @@
 import sys
 import ast
-import importlib.util
-import configparser
 from pathlib import Path
+from typing import Optional
 from PyQt6.QtCore import pyqtSignal, QThread
-import traceback
 import io
 
-from pyflakes.api import check
-from pyflakes.reporter import Reporter
+# pyflakes, importlib.util and traceback are imported where they are used:
+# this module is loaded on the first validation, not at host startup
+from libs.Sourcemanifest import SourceManifest, ManifestError
+from libs.Dependencychecker import check_manifest
+from libs.Widgetscan import check_entry_point
+
+
+class StageFailed(Exception):
+    """
+    A validation stage failed. `detail` is what the preflight log shows,
+    `summary` the one-line status; `trace` carries the traceback of an
+    exception raised by the source itself.
+    """
+
+    def __init__(self, detail: str, summary: str, trace: str = ""):
+        super().__init__(detail)
+        self.detail = detail
+        self.summary = summary
+        self.trace = trace
+
+
+# ----------------- Stages -----------------
+# Shared by SourceValidator (GUI) and libs/Batchvalidator.py (headless).
+# Each one returns what the next needs or raises StageFailed.
+
+def stage_config(config_path: Path) -> SourceManifest:
+    if not config_path.exists():
+        raise StageFailed(f"Missing config: {config_path.name}", "Config file missing")
+    try:
+        # Cached by path + mtime; re-parsed only if the .ini was edited
+        return SourceManifest.load(config_path)
+    except ManifestError as e:
+        raise StageFailed(str(e), "Invalid config") from e
+
+
+def stage_dependencies(manifest: SourceManifest, index=None):
+    """Declared dependencies and compatibility, before anything is imported."""
+    problems = check_manifest(manifest, index)
+    if problems:
+        msg = "\n".join(f"[DEPENDENCY] {p}" for p in problems)
+        raise StageFailed(msg, f"Dependency check failed:\n{msg}")
+
+
+def stage_module_file(manifest: SourceManifest) -> Path:
+    module_path = manifest.module_path
+    if not module_path.exists():
+        raise StageFailed(f"Missing module file: {module_path.name}", "Module file missing")
+    return module_path
+
+
+def stage_syntax(module_path: Path):
+    try:
+        compile(module_path.read_text(encoding="utf-8"), str(module_path), "exec")
+    except SyntaxError as e:
+        msg = format_exception(e, module_path)
+        raise StageFailed(msg, msg) from e
+
+
+def stage_static(module_path: Path):
+    ok, msg = run_pyflakes_check(module_path)
+    if not ok:
+        raise StageFailed(msg, f"Static analysis failed:\n{msg}")
+
+
+def stage_entry_point_static(module_path: Path, entry_point: str):
+    """The entry point checked on the AST, so a typo in the .ini fails before a heavy import."""
+    problems = check_entry_point(module_path, entry_point)
+    if problems:
+        msg = "\n".join(f"[ENTRY POINT] {p}" for p in problems)
+        raise StageFailed(msg, f"Entry point check failed:\n{msg}")
+
+
+def stage_import(manifest: SourceManifest):
+    """Import the source module under its manifest name (left in sys.modules on success)."""
+    import importlib.util
+    import traceback
+    module_name = manifest.module
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, manifest.module_path)
+        module = importlib.util.module_from_spec(spec)
+    except Exception as e:
+        raise StageFailed(f"Import spec failed: {e}", "Module import failed", traceback.format_exc()) from e
+
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except ModuleNotFoundError as mnfe:
+        sys.modules.pop(module_name, None)
+        # Surfacing this beats a half-initialised module failing later on
+        raise StageFailed(f"Missing module '{mnfe.name}' (declare it under [dependencies])",
+                          "Module import failed") from mnfe
+    except (Exception, SystemExit) as e:
+        sys.modules.pop(module_name, None)
+        raise StageFailed(f"Module runtime error: {e}", "Module import failed", traceback.format_exc()) from e
+    return module
+
+
+def stage_entry_point(module, entry_point: str):
+    if not hasattr(module, entry_point):
+        raise StageFailed(f"Entry point '{entry_point}' not found", "Entry point missing")
+    return getattr(module, entry_point)
+
+
+def stage_instantiate(factory):
+    """Build the widget (needs a QApplication); the caller disposes of it."""
+    import traceback
+    from PyQt6.QtWidgets import QWidget
+    try:
+        widget = factory()
+    except (Exception, SystemExit) as e:
+        raise StageFailed(f"Widget instantiation failed: {e}", "Widget creation failed", traceback.format_exc()) from e
+    if not isinstance(widget, QWidget):
+        raise StageFailed(f"Entry point must return QWidget, got {type(widget)}", "Widget creation failed")
+    return widget
+
+
+# ----------------- Helpers -----------------
+def find_dependencies(module_path: Path) -> set[str]:
+    dependencies = set()
+    try:
+        content = module_path.read_text(encoding="utf-8")
+        tree = ast.parse(content)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    dependencies.add(alias.name.split('.')[0])
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                dependencies.add(node.module.split('.')[0])
+    except Exception as e:
+        print(f"[Validator] Dependency parse error: {e}")
+    return dependencies
+
+
+def run_pyflakes_check(module_path: Path) -> tuple[bool, str]:
+    """Run pyflakes and ignore unused import warnings."""
+    from pyflakes.api import check
+    from pyflakes.reporter import Reporter
+    try:
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        reporter = Reporter(stdout, stderr)
+
+        source = module_path.read_text(encoding="utf-8")
+        check(source, str(module_path), reporter)
+
+        output = stdout.getvalue().strip()
+        if output:
+            formatted = []
+            for line in output.splitlines():
+                # Ignore "imported but unused"
+                if "imported but unused" in line:
+                    continue
+                # Keep real errors
+                parts = line.split(":", 1)
+                formatted.append(f"[STATIC] {Path(module_path).name}:{parts[1] if len(parts) > 1 else line}")
+            if formatted:
+                return False, "\n".join(formatted)
+        return True, "Static analysis OK"
+
+    except Exception as e:
+        return False, format_exception(e, module_path)
+
+
+def format_exception(e: Exception, path: Path | None = None) -> str:
+    import traceback
+    if isinstance(e, SyntaxError):
+        file = Path(e.filename).name if e.filename else (path.name if path else "<?>")
+        line = e.lineno or "?"
+        col = e.offset or "?"
+        text = (e.text or "").rstrip()
+        return f"[SYNTAX ERROR] {file}:{line}:{col}\n→ {e.msg}\n→ {text}"
+
+    tb = traceback.extract_tb(e.__traceback__)
+    last = tb[-1] if tb else None
+    if last:
+        return f"[{type(e).__name__}] {Path(last.filename).name}:{last.lineno}\n→ {e}"
+    return f"[{type(e).__name__}] {e}"
+
 
 class SourceValidator(QThread):
     """Background thread for source validation and safe module loading."""
@@ -17,171 +191,84 @@ class SourceValidator(QThread):
     preflight_check = pyqtSignal(bool, str)              # success, message
     progress_update = pyqtSignal(int, str)               # progress, message
 
-    def __init__(self, source_path: Path):
+    def __init__(self, source_path: Path, manifest: Optional[SourceManifest] = None,
+                 import_module: bool = True):
         super().__init__()
         self.source_path = source_path
-        self.config_path = source_path.parent / f"{source_path.stem}.ini"
-
-    # ----------------- Dependency / Syntax -----------------
-    def find_dependencies(self, module_path: Path):
-        dependencies = set()
-        try:
-            content = module_path.read_text(encoding="utf-8")
-            tree = ast.parse(content)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        dependencies.add(alias.name.split('.')[0])
-                elif isinstance(node, ast.ImportFrom) and node.module:
-                    dependencies.add(node.module.split('.')[0])
-        except Exception as e:
-            print(f"[Validator] Dependency parse error: {e}")
-        return dependencies
-
-    def is_builtin_module(self, module_name: str) -> bool:
-        return module_name in sys.builtin_module_names
+        self.manifest = manifest
+        self.import_module = import_module  # False: the source runs in a child process
+        self.config_path = manifest.path if manifest else source_path.parent / f"{source_path.stem}.ini"
 
-    # ----------------- Static Analysis -----------------
-    def run_pyflakes_check(self, module_path: Path) -> tuple[bool, str]:
-        """Run pyflakes and ignore unused import warnings."""
-        try:
-            stdout = io.StringIO()
-            stderr = io.StringIO()
-            reporter = Reporter(stdout, stderr)
-
-            source = module_path.read_text(encoding="utf-8")
-            check(source, str(module_path), reporter)
-
-            output = stdout.getvalue().strip()
-            if output:
-                formatted = []
-                for line in output.splitlines():
-                    # Ignore "imported but unused"
-                    if "imported but unused" in line:
-                        continue
-                    # Keep real errors
-                    parts = line.split(":", 1)
-                    formatted.append(f"[STATIC] {Path(module_path).name}:{parts[1] if len(parts) > 1 else line}")
-                if formatted:
-                    return False, "\n".join(formatted)
-            return True, "Static analysis OK"
-
-        except Exception as e:
-            return False, self.format_exception(e, module_path)
+    def stop(self):
+        """Ask the thread to give up before importing the module."""
+        self.requestInterruption()
 
     # ----------------- Validation -----------------
     def run(self):
+        import traceback
         try:
             self.progress_update.emit(10, "Starting validation...")
 
             # --- Config ---
-            if not self.config_path.exists():
-                self.preflight_check.emit(False, f"Missing config: {self.config_path.name}")
-                self.validation_complete.emit(False, "Config file missing", None)
-                return
-
             self.progress_update.emit(20, "Reading config...")
-            config = configparser.ConfigParser()
-            config.read(self.config_path)
+            self.manifest = stage_config(self.config_path)
 
-            if "source" not in config:
-                self.preflight_check.emit(False, "Missing [source] section")
-                self.validation_complete.emit(False, "Invalid config", None)
-                return
-
-            module_name = config.get("source", "module", fallback=None)
-            entry_point = config.get("source", "entry_point", fallback="main_widget")
-
-            if not module_name:
-                self.preflight_check.emit(False, "Module not specified")
-                self.validation_complete.emit(False, "Missing module name", None)
-                return
+            # --- Declared dependencies (before anything is imported) ---
+            self.progress_update.emit(25, "Checking declared dependencies...")
+            stage_dependencies(self.manifest)
 
             # --- Module file ---
             self.progress_update.emit(30, "Checking module file...")
-            module_path = self.source_path.parent / f"{module_name}.py"
-
-            if not module_path.exists():
-                self.preflight_check.emit(False, f"Missing module file: {module_path.name}")
-                self.validation_complete.emit(False, "Module file missing", None)
-                return
+            module_path = stage_module_file(self.manifest)
 
             # --- Syntax ---
             self.progress_update.emit(40, "Checking syntax...")
-            try:
-                compile(module_path.read_text(encoding="utf-8"), str(module_path), "exec")
-                self.preflight_check.emit(True, "Syntax OK")
-            except SyntaxError as e:
-                msg = self.format_exception(e, module_path)
-                self.preflight_check.emit(False, msg)
-                self.validation_complete.emit(False, msg, None)
-                return
+            stage_syntax(module_path)
+            self.preflight_check.emit(True, "Syntax OK")
 
             # --- Static Analysis ---
             self.progress_update.emit(45, "Running static analysis...")
-            ok, msg = self.run_pyflakes_check(module_path)
-            if not ok:
-                self.preflight_check.emit(False, msg)
-                self.validation_complete.emit(False, f"Static analysis failed:\n{msg}", None)
-                return
+            stage_static(module_path)
+
+            # --- Entry point, before the import ---
+            self.progress_update.emit(50, "Checking entry point...")
+            stage_entry_point_static(module_path, self.manifest.entry_point)
 
             # --- Dependencies ---
             self.progress_update.emit(55, "Analyzing dependencies...")
-            for dep in self.find_dependencies(module_path):
+            for dep in find_dependencies(module_path):
                 dep_file = self.source_path.parent / f"{dep}.py"
                 if dep_file.exists():
                     self.progress_update.emit(60, f"Found dependency: {dep}")
 
+            # --- Out of process: everything that needs an import happens in the child ---
+            if not self.import_module:
+                self.progress_update.emit(100, "Validation complete")
+                self.preflight_check.emit(True, "Static checks passed")
+                self.validation_complete.emit(True, "Source checked; starting process", None)
+                return
+
             # --- Import ---
+            if self.isInterruptionRequested():
+                return   # cancelled: superseded by a newer validation, nothing to report
             self.progress_update.emit(70, "Importing module...")
-            module = None
-            try:
-                spec = importlib.util.spec_from_file_location(module_name, module_path)
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                try:
-                    spec.loader.exec_module(module)
-                except ModuleNotFoundError as mnfe:
-                    print(f"[Validator] Optional module not found: {mnfe.name}, ignoring.")
-                except Exception as e:
-                    print(f"[Validator] Runtime error in module '{module_name}':\n", traceback.format_exc())
-                    self.preflight_check.emit(False, f"Module runtime error: {e}")
-                    self.validation_complete.emit(False, "Module import failed", None)
-                    return
-            except Exception as e:
-                print("[Validator] Import spec error:\n", traceback.format_exc())
-                self.preflight_check.emit(False, f"Import spec failed: {e}")
-                self.validation_complete.emit(False, "Module import failed", None)
-                return
+            module = stage_import(self.manifest)
 
             # --- Entry point ---
             self.progress_update.emit(85, "Checking entry point...")
-            if not hasattr(module, entry_point):
-                self.preflight_check.emit(False, f"Entry point '{entry_point}' not found")
-                self.validation_complete.emit(False, "Entry point missing", None)
-                return
+            stage_entry_point(module, self.manifest.entry_point)
 
             # --- SUCCESS ---
             self.progress_update.emit(100, "Validation complete")
             self.preflight_check.emit(True, "All checks passed")
             self.validation_complete.emit(True, "Source loaded successfully", module)
 
+        except StageFailed as e:
+            if e.trace:
+                print(f"[Validator] {e.detail}:\n", e.trace)
+            self.preflight_check.emit(False, e.detail)
+            self.validation_complete.emit(False, e.summary, None)
         except Exception as e:
             print("[Validator] Fatal error:\n", traceback.format_exc())
             self.preflight_check.emit(False, f"Unexpected error: {e}")
             self.validation_complete.emit(False, "Validation crashed", None)
-
-    # ----------------- Exception Formatting -----------------
-    def format_exception(self, e: Exception, path: Path | None = None) -> str:
-        if isinstance(e, SyntaxError):
-            file = Path(e.filename).name if e.filename else (path.name if path else "<?>")
-            line = e.lineno or "?"
-            col = e.offset or "?"
-            text = (e.text or "").rstrip()
-            return f"[SYNTAX ERROR] {file}:{line}:{col}\n→ {e.msg}\n→ {text}"
-
-        tb = traceback.extract_tb(e.__traceback__)
-        last = tb[-1] if tb else None
-        if last:
-            return f"[{type(e).__name__}] {Path(last.filename).name}:{last.lineno}\n→ {e}"
-        return f"[{type(e).__name__}] {e}"
@@ -0,0 +1,71 @@
+import sys
+import json
+import time
+from PyQt6.QtCore import QObject, QEvent, QTimer
+from PyQt6.QtWidgets import QApplication, QWidget
+
+
+class FirstFrameProbe(QObject):
+    """
+    Reports the time from `started` to the first painted frame of `window`.
+
+    Enabled with QTFORGE_STARTUP_PROBE=1 (or =exit to quit right after the
+    report, as test/benchmarks/StartupBench.py does). The report is one line
+    on stdout: "QTFORGE_STARTUP {json}" with the elapsed time and the
+    modules loaded at that moment.
+
+    With QTFORGE_STARTUP_PROBE=usable the report waits until the window
+    hosts a source (`window.hosted_widget`), adds "usable_ms" and quits.
+    """
+
+    PREFIX = "QTFORGE_STARTUP"
+
+    def __init__(self, window: QWidget, started: float, quit_after: bool = False,
+                 wait_for_source: bool = False, timeout_ms: int = 60000):
+        super().__init__(window)
+        self.window = window
+        self.started = started
+        self.quit_after = quit_after or wait_for_source
+        self.wait_for_source = wait_for_source
+        self.timeout_ms = timeout_ms
+        self.first_frame_ms: float | None = None
+        self.modules: list[str] = []
+        self._done = False
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Type.Paint and not self._done:
+            self._done = True
+            # Measured once the paint event has been delivered
+            QTimer.singleShot(0, self.on_first_frame)
+        return False
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 2)
+
+    def on_first_frame(self):
+        self.window.removeEventFilter(self)
+        self.first_frame_ms = self.elapsed_ms()
+        self.modules = sorted(sys.modules)
+        if self.wait_for_source:
+            self.poll_source()
+        else:
+            self.report()
+
+    def poll_source(self):
+        if getattr(self.window, "hosted_widget", None) is not None:
+            self.report(usable_ms=self.elapsed_ms())
+        elif self.elapsed_ms() > self.timeout_ms:
+            self.report(usable_ms=None)
+        else:
+            QTimer.singleShot(5, self.poll_source)
+
+    def report(self, **extra):
+        payload = {
+            "first_frame_ms": self.first_frame_ms,
+            **extra,
+            "modules": self.modules,
+        }
+        print(f"{self.PREFIX} {json.dumps(payload)}", flush=True)
+        if self.quit_after:
+            QApplication.instance().quit()
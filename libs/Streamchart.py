@@ -0,0 +1,334 @@
+"""
+Streaming time series for QtCharts line series.
+
+Appending to a `QLineSeries` point by point keeps every point forever
+and re-lays out the series on each call, so a live chart slows down and
+grows until it is closed. `StreamSeries` keeps the samples in a
+fixed-capacity NumPy ring instead and pushes them to the series in bulk,
+at most once per frame, with one `replace()`:
+
+    RingBuffer        fixed-capacity (x, y) ring; memory never grows
+    StreamDecimator   incremental min/max or LTTB decimation on a fixed
+                      grid of x buckets, one per couple of plotted pixels;
+                      finished buckets are never decimated again
+    StreamSeries      ring + decimator + series: the last `window` of x
+                      on the plot area's width, x axis scrolled and y
+                      axis rescaled only when the data leaves its range
+
+    stream = StreamSeries(series, window=10.0)
+    ...
+    stream.append(t, value)          # or stream.extend(ts, values)
+
+x must not decrease (time). `min_max_decimate()` and `lttb()` are the
+same decimations over whole arrays.
+"""
+from typing import Optional
+
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, QSignalBlocker, Qt
+from PyQt6.QtGui import QPolygonF
+from PyQt6.QtCharts import QLineSeries, QValueAxis
+
+DECIMATION_MODES = ("minmax", "lttb", None)
+
+
+class RingBuffer:
+    """(x, y) samples in a (2, capacity) float64 array; `total` counts every sample ever written."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = np.empty((2, capacity), dtype=np.float64)
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def append(self, x: float, y: float):
+        i = self.total % self.capacity
+        self.data[0, i] = x
+        self.data[1, i] = y
+        self.total += 1
+
+    def extend(self, x, y):
+        values = np.array((x, y), dtype=np.float64, ndmin=2)
+        n = values.shape[1]
+        if n > self.capacity:   # only the newest fit
+            values = values[:, -self.capacity:]
+            self.total += n - self.capacity
+            n = self.capacity
+        start = self.total % self.capacity
+        first = min(n, self.capacity - start)
+        self.data[:, start:start + first] = values[:, :first]
+        self.data[:, :n - first] = values[:, first:]
+        self.total += n
+
+    def latest(self, count: int) -> np.ndarray:
+        """The newest `count` samples (fewer if not held), oldest first, as (2, n)."""
+        count = min(count, len(self))
+        end = self.total % self.capacity
+        if count <= end:
+            return self.data[:, end - count:end]
+        return np.concatenate((self.data[:, self.capacity - (count - end):], self.data[:, :end]), axis=1)
+
+    def ordered(self) -> np.ndarray:
+        return self.latest(len(self))
+
+    def clear(self):
+        self.total = 0
+
+
+def _bucket_starts(ids: np.ndarray) -> np.ndarray:
+    return np.flatnonzero(np.concatenate(([True], ids[1:] != ids[:-1])))
+
+
+def _min_max_points(data: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Per run of equal bucket ids, its lowest and highest sample in x order, as (2, n)."""
+    starts = _bucket_starts(ids)
+    ends = np.concatenate((starts[1:], [len(ids)])) - 1
+    order = np.lexsort((data[1], ids))   # by bucket, then by y
+    low, high = order[starts], order[ends]
+    picks = np.stack((np.minimum(low, high), np.maximum(low, high)), axis=1).ravel()
+    picks = picks[np.concatenate(([True], picks[1:] != picks[:-1]))]   # one-sample buckets
+    return data[:, picks]
+
+
+def min_max_decimate(x, y, buckets: int) -> np.ndarray:
+    """At most 2 * `buckets` points: the min and max of each of `buckets` equal x spans."""
+    data = np.array((x, y), dtype=np.float64, ndmin=2)
+    if data.shape[1] <= 2 * buckets:
+        return data
+    span = data[0, -1] - data[0, 0] or 1.0
+    ids = np.minimum(((data[0] - data[0, 0]) * (buckets / span)).astype(np.int64), buckets - 1)
+    return _min_max_points(data, ids)
+
+
+def lttb(x, y, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets down to `threshold` points (first and last kept)."""
+    data = np.array((x, y), dtype=np.float64, ndmin=2)
+    n = data.shape[1]
+    if threshold >= n or threshold < 3:
+        return data
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    picks = np.empty(threshold, dtype=np.int64)
+    picks[0], picks[-1] = 0, n - 1
+    ax, ay = data[:, 0]
+    for b in range(threshold - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nxt = data[:, hi:edges[b + 2]] if b + 2 < len(edges) else data[:, n - 1:]
+        cx, cy = nxt.mean(axis=1)
+        bx, by = data[:, lo:hi]
+        i = lo + int(np.argmax(np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))))
+        picks[b + 1] = i
+        ax, ay = data[:, i]
+    return data[:, picks]
+
+
+class StreamDecimator:
+    """
+    Decimates a stream on a fixed grid of x buckets `bucket` wide. Samples
+    are fed as they arrive; a bucket is decimated once, when a sample of a
+    later bucket shows it is complete, into a ring of `capacity` points.
+    `view()` adds the still-open buckets (min/max) so the line reaches the
+    newest sample.
+
+    "minmax" keeps each bucket's lowest and highest sample: every peak
+    survives. "lttb" keeps one sample per bucket, the one spanning the
+    largest triangle with the previous pick and the next bucket's mean,
+    so a bucket is only final once the next one is complete.
+    """
+
+    def __init__(self, bucket: float, capacity: int, mode: str = "minmax"):
+        if mode not in ("minmax", "lttb"):
+            raise ValueError(f"Unknown decimation mode {mode!r}")
+        self.bucket = bucket
+        self.mode = mode
+        self.points = RingBuffer(capacity)
+        self._open = np.empty((2, 0))     # samples of the newest, unfinished bucket
+        self._held = np.empty((2, 0))     # lttb: the complete bucket waiting for its successor
+        self._anchor = None               # lttb: the previous pick
+
+    def feed(self, samples: np.ndarray):
+        if not samples.shape[1]:
+            return
+        data = np.concatenate((self._open, samples), axis=1) if self._open.shape[1] else samples
+        ids = np.floor(data[0] / self.bucket).astype(np.int64)
+        cut = int(np.searchsorted(ids, ids[-1]))
+        self._open = data[:, cut:].copy()
+        if not cut:
+            return
+        done, done_ids = data[:, :cut], ids[:cut]
+        if self.mode == "minmax":
+            points = _min_max_points(done, done_ids)
+            self.points.extend(points[0], points[1])
+            return
+        starts = _bucket_starts(done_ids)
+        for start, end in zip(starts, np.concatenate((starts[1:], [cut]))):
+            self._close_lttb(done[:, start:end])
+
+    def _close_lttb(self, bucket: np.ndarray):
+        if self._anchor is None:   # the very first sample is always kept
+            self._anchor = bucket[:, 0].copy()   # `bucket` may be a view of the raw ring
+            self.points.append(*self._anchor)
+            bucket = bucket[:, 1:]
+            if not bucket.shape[1]:
+                return
+        if self._held.shape[1]:
+            ax, ay = self._anchor
+            cx, cy = bucket.mean(axis=1)
+            bx, by = self._held
+            i = int(np.argmax(np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))))
+            self._anchor = self._held[:, i]
+            self.points.append(*self._anchor)
+        self._held = bucket.copy()
+
+    def view(self, x0: float) -> np.ndarray:
+        """Decimated points with x >= `x0`, then the open buckets, as (2, n)."""
+        points = self.points.ordered()
+        points = points[:, np.searchsorted(points[0], x0):]
+        tail = np.concatenate((self._held, self._open), axis=1)
+        if tail.shape[1]:
+            tail = _min_max_points(tail, np.floor(tail[0] / self.bucket).astype(np.int64))
+            points = np.concatenate((points, tail), axis=1)
+        return points
+
+
+class StreamSeries(QObject):
+    """
+    Streams samples into `series`: the last `window` of x, decimated with
+    `mode` ("minmax", "lttb" or None for every sample) to one bucket per
+    `bucket_px` pixels of the plot area, flushed by a timer at most `fps`
+    times a second and only when something was appended. `capacity` bounds
+    the raw samples held (it should cover `window` at the feed rate). The
+    series' value axes are driven too: x scrolls with the newest sample; y
+    is refitted with `margin` headroom when the data leaves its range or
+    fills less than `shrink` of it.
+
+    QtCharts recomputes the whole line on `replace()` and again when an
+    axis range changes, so when the x axis moves anyway the points are
+    replaced with the series' signals blocked (`pointsReplaced` is not
+    emitted) and the axis move does the one recompute.
+    """
+
+    def __init__(self, series: QLineSeries, window: float = 10.0, capacity: int = 1 << 17,
+                 mode: Optional[str] = "minmax", bucket_px: float = 2.0, fps: int = 60,
+                 margin: float = 0.1, shrink: float = 0.5):
+        super().__init__(series)
+        if mode not in DECIMATION_MODES:
+            raise ValueError(f"Unknown decimation mode {mode!r}")
+        self.series = series
+        self.window = window
+        self.mode = mode
+        self.bucket_px = bucket_px
+        self.margin = margin
+        self.shrink = shrink
+        self.raw = RingBuffer(capacity)
+        self.decimator: Optional[StreamDecimator] = None
+        self._fed = 0          # raw.total already given to the decimator
+        self._buckets = 0
+        self._dirty = False
+        self._polygon = QPolygonF()
+        self._x_range = None
+        self._y_range = None
+        self.flushes = 0
+        self.rescales = 0
+        self.plotted = 0       # points in the series after the last flush
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, 1000 // fps))
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    # ----------------- Feeding -----------------
+    def append(self, x: float, y: float):
+        self.raw.append(x, y)
+        self._dirty = True
+
+    def extend(self, x, y):
+        self.raw.extend(x, y)
+        self._dirty = True
+
+    def clear(self):
+        self.raw.clear()
+        self.decimator = None
+        self._fed = 0
+        self._x_range = self._y_range = None
+        self.series.clear()
+        self.plotted = 0
+
+    # ----------------- Flushing -----------------
+    def flush(self):
+        """Push the visible window to the series with one `replace()`, if anything changed."""
+        if not self._dirty or not len(self.raw):
+            return
+        self._dirty = False
+        latest = float(self.raw.data[0, (self.raw.total - 1) % self.raw.capacity])
+        x0 = latest - self.window
+        if self.mode is None:
+            points = self.raw.ordered()
+            points = points[:, np.searchsorted(points[0], x0):]
+        else:
+            points = self._decimate(x0)
+
+        x_axis, y_axis = self._axes()
+        x_range = (max(x0, float(points[0, 0])) if points.shape[1] else x0, latest)
+        if x_axis is not None and x_range != self._x_range:
+            blocker = QSignalBlocker(self.series)
+            self._replace(points)
+            blocker.unblock()
+            self._x_range = x_range
+            x_axis.setRange(*x_range)   # recomputes the line once
+        else:
+            self._replace(points)
+        if y_axis is not None and points.shape[1]:
+            self._fit_y(y_axis, float(points[1].min()), float(points[1].max()))
+        self.flushes += 1
+
+    def _axes(self) -> tuple[Optional[QValueAxis], Optional[QValueAxis]]:
+        x_axis = y_axis = None
+        for axis in self.series.attachedAxes():
+            if isinstance(axis, QValueAxis):
+                if axis.orientation() == Qt.Orientation.Horizontal:
+                    x_axis = axis
+                else:
+                    y_axis = axis
+        return x_axis, y_axis
+
+    def _decimate(self, x0: float) -> np.ndarray:
+        chart = self.series.chart()
+        width = chart.plotArea().width() if chart is not None else 0
+        buckets = max(1, int((width if width > 0 else 800) / self.bucket_px))
+        if self.decimator is None or buckets != self._buckets:
+            # New grid: re-decimate what the ring still holds of the window
+            self._buckets = buckets
+            bucket = self.window / buckets
+            self.decimator = StreamDecimator(bucket, 2 * buckets + 8, self.mode)
+            samples = self.raw.ordered()
+            start = np.searchsorted(samples[0], x0 - bucket)
+            self._fed = self.raw.total - (samples.shape[1] - start)
+        self.decimator.feed(self.raw.latest(self.raw.total - self._fed))
+        self._fed = self.raw.total
+        return self.decimator.view(x0)
+
+    def _replace(self, points: np.ndarray):
+        n = points.shape[1]
+        if self._polygon.size() != n:
+            self._polygon.resize(n)
+        if n:   # fill the polygon's QPointF array in place
+            buffer = self._polygon.data()
+            buffer.setsize(n * 16)
+            np.frombuffer(buffer, dtype=np.float64).reshape(n, 2)[:] = points.T
+        self.series.replace(self._polygon)
+        self.plotted = n
+
+    def _fit_y(self, y_axis: QValueAxis, low: float, high: float):
+        if self._y_range is not None:
+            current_low, current_high = self._y_range
+            inside = current_low <= low and high <= current_high
+            if inside and (high - low) >= self.shrink * (current_high - current_low):
+                return
+        pad = (high - low) * self.margin or abs(high) * self.margin or 1.0
+        if self._y_range == (low - pad, high + pad):   # flat data: already fitted
+            return
+        self._y_range = (low - pad, high + pad)
+        y_axis.setRange(*self._y_range)
+        self.rescales += 1
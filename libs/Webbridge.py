@@ -0,0 +1,282 @@
+"""
+Batched Python -> JavaScript channel for widgets hosting a web page.
+
+One `runJavaScript()` per data point serialises JSON and crosses the
+WebEngine IPC once per point. `WebBridge` queues outgoing messages and
+sends everything queued in one call per frame; numeric arrays travel as
+base64 blocks that the page turns into typed arrays, and arrays sent
+under the same `key` between two frames are concatenated into one block.
+
+The page acknowledges each batch from its next animation frame. With
+`max_in_flight` batches unacknowledged the bridge holds back and keeps
+queuing; keyed arrays beyond `max_pending` values shed their oldest
+values, so a page that falls behind (or is hidden) gets the newest data
+once it catches up instead of an ever-growing backlog. Messages without
+a key are never dropped.
+
+The JavaScript half comes from `client_script()` and is inlined in the
+page together with qwebchannel.js, so the page needs no network:
+
+    bridge = WebBridge(view.page())
+    view.setHtml(PAGE.replace("/*BRIDGE*/", bridge.client_script()))
+    bridge.received.connect(on_message)        # qtBridge.send({...}) in the page
+    bridge.send_array("appendPoints", values, key="series")
+    bridge.send("clear")
+
+    // in the page
+    qtBridge.on("appendPoints", msg => ring.push(msg.values));   // Float32Array
+    qtBridge.onFrame(draw);
+"""
+import json
+import base64
+from typing import Any, Optional
+
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, QFile, QIODevice, pyqtSignal, pyqtSlot
+from PyQt6.QtWebChannel import QWebChannel
+
+QWEBCHANNEL_JS = ":/qtwebchannel/qwebchannel.js"
+ARRAY_DTYPES = ("int8", "uint8", "int16", "uint16", "int32", "uint32", "float32", "float64")   # typed arrays
+
+CLIENT_JS = """
+(function () {
+  "use strict";
+  var handlers = {}, frameHandlers = [], waiting = [];
+  var py = null, received = 0, frameRequested = false;
+  var TYPES = {int8: Int8Array, uint8: Uint8Array, int16: Int16Array, uint16: Uint16Array, int32: Int32Array,
+               uint32: Uint32Array, float32: Float32Array, float64: Float64Array};
+
+  function decode(block) {
+    var bytes = atob(block.data), buffer = new Uint8Array(bytes.length);
+    for (var i = 0; i < bytes.length; i++) buffer[i] = bytes.charCodeAt(i);
+    return new TYPES[block.dtype](buffer.buffer);
+  }
+
+  function frame() {
+    frameRequested = false;
+    frameHandlers.forEach(function (fn) {
+      try { fn(); } catch (e) { console.error("[qtBridge] Frame handler failed: " + e); }
+    });
+    if (py) py.ack(received);   // this batch has reached the screen; a failing handler must not stall the bridge
+  }
+
+  window.qtBridge = {
+    on: function (action, fn) { handlers[action] = fn; },
+    onFrame: function (fn) { frameHandlers.push(fn); },
+    send: function (message) {
+      var text = JSON.stringify(message);
+      if (py) py.post(text); else waiting.push(text);
+    },
+    receive: function (batch) {
+      batch.messages.forEach(function (message) {
+        if (message.block) message.values = decode(message.block);
+        var fn = handlers[message.action];
+        if (fn) fn(message); else console.warn("[qtBridge] No handler for " + message.action);
+      });
+      received = batch.seq;
+      if (!frameRequested) { frameRequested = true; requestAnimationFrame(frame); }
+      return batch.seq;
+    }
+  };
+
+  function connect() {
+    new QWebChannel(qt.webChannelTransport, function (channel) {
+      py = channel.objects.%NAME%;
+      py.hello();
+      waiting.forEach(function (text) { py.post(text); });
+      waiting = [];
+    });
+  }
+  if (window.qt && qt.webChannelTransport) connect(); else document.addEventListener("DOMContentLoaded", connect);
+})();
+"""
+
+
+class _PageEndpoint(QObject):
+    """What the page sees over the web channel; only these slots are published."""
+
+    def __init__(self, bridge: "WebBridge"):
+        super().__init__(bridge)
+        self._bridge = bridge
+
+    @pyqtSlot()
+    def hello(self):
+        self._bridge._page_ready()
+
+    @pyqtSlot(int)
+    def ack(self, seq: int):
+        self._bridge._acked(seq)
+
+    @pyqtSlot(str)
+    def post(self, text: str):
+        self._bridge._posted(text)
+
+
+class WebBridge(QObject):
+    """
+    Message channel to and from the page of a `QWebEngineView`. Outgoing
+    messages are flushed at most `fps` times a second, one batch per
+    flush, and only after the page said hello (queued until then).
+    """
+
+    received = pyqtSignal(object)   # decoded JSON sent by qtBridge.send()
+
+    def __init__(self, page, name: str = "pyBridge", fps: int = 60, max_in_flight: int = 2,
+                 max_pending: int = 1 << 20, stall_ms: int = 1000):
+        super().__init__(page)
+        self.page = page
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.max_pending = max_pending
+        self.stall_ms = stall_ms
+        self.ready = False
+        self._pending: list[dict] = []
+        self._blocks: dict[str, dict] = {}   # key -> its queued message, until the next plain message
+        self._pending_values = 0
+        self.sent_seq = 0
+        self.acked_seq = 0
+        self._since_send = QElapsedTimer()
+        self._since_send.start()
+        # Counters
+        self.batches = 0
+        self.messages = 0
+        self.bytes_sent = 0
+        self.held_frames = 0     # flushes skipped waiting for acks
+        self.dropped_values = 0  # shed from keyed arrays under backpressure
+        self.stalls = 0          # acks given up on after stall_ms
+
+        self._endpoint = _PageEndpoint(self)
+        self.channel = QWebChannel(self)
+        self.channel.registerObject(name, self._endpoint)
+        page.setWebChannel(self.channel)
+        if hasattr(page, "loadStarted"):
+            page.loadStarted.connect(self._page_unloaded)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, 1000 // fps))
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def client_script(self) -> str:
+        """qwebchannel.js and the qtBridge client, to inline in the page's <script>."""
+        source = QFile(QWEBCHANNEL_JS)
+        if not source.open(QIODevice.OpenModeFlag.ReadOnly):
+            print(f"[WebBridge] Cannot read {QWEBCHANNEL_JS}")
+            return CLIENT_JS.replace("%NAME%", self.name)
+        qwebchannel = bytes(source.readAll()).decode("utf-8")
+        source.close()
+        return qwebchannel + "\n" + CLIENT_JS.replace("%NAME%", self.name)
+
+    # ----------------- Queuing -----------------
+    def send(self, action: str, **fields: Any):
+        """Queue a JSON message; it also closes the open array blocks, keeping order."""
+        self._pending.append({"action": action, **fields})
+        self._blocks.clear()
+
+    def send_array(self, action: str, values, key: Optional[str] = None, dtype: str = "float32", **fields: Any):
+        """
+        Queue `values` as a typed-array block (`message.values` in the page).
+        With a `key`, further arrays for that key join the same block until
+        the batch goes out, and the oldest values are shed under backpressure.
+        """
+        if np.dtype(dtype).name not in ARRAY_DTYPES:
+            raise ValueError(f"No typed array for dtype {dtype!r}")
+        values = np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder("<"))
+        message = self._blocks.get(key) if key is not None else None
+        if message is None or message["action"] != action:
+            message = {"action": action, **fields, "_parts": []}
+            if key is not None:
+                message["key"] = key
+                self._blocks[key] = message
+            self._pending.append(message)
+        message["_parts"].append(values)
+        self._pending_values += values.size
+        if self._pending_values > self.max_pending:
+            self._shed()
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _shed(self):
+        """Drop the oldest queued values of keyed blocks until under max_pending; emptied blocks are unqueued."""
+        excess = self._pending_values - self.max_pending
+        emptied = []
+        for message in self._pending:
+            if excess <= 0:
+                break
+            if "key" not in message or "_parts" not in message:
+                continue
+            parts = message["_parts"]
+            while parts and excess > 0:
+                head = parts[0]
+                per_row = max(1, head.size // max(1, len(head)))   # whole rows of 2-D blocks
+                rows = min(len(head), -(-excess // per_row))
+                if rows >= len(head):
+                    parts.pop(0)
+                else:
+                    parts[0] = head[rows:]
+                cut = rows * per_row
+                excess -= cut
+                self._pending_values -= cut
+                self.dropped_values += cut
+            if not parts:
+                emptied.append(message)
+        if emptied:
+            gone = {id(message) for message in emptied}
+            self._pending = [message for message in self._pending if id(message) not in gone]
+            for message in emptied:
+                if self._blocks.get(message["key"]) is message:
+                    del self._blocks[message["key"]]
+
+    # ----------------- Sending -----------------
+    def flush(self):
+        """Send everything queued as one batch, unless the page is behind."""
+        if not self._pending or not self.ready:
+            return
+        if self.sent_seq - self.acked_seq >= self.max_in_flight:
+            if self._since_send.elapsed() < self.stall_ms:
+                self.held_frames += 1
+                return
+            self.acked_seq = self.sent_seq   # no ack coming (hidden page, lost batch): go on
+            self.stalls += 1
+        messages = [self._encode(message) for message in self._pending]
+        self._pending = []
+        self._blocks.clear()
+        self._pending_values = 0
+        self.sent_seq += 1
+        payload = json.dumps({"seq": self.sent_seq, "messages": messages}, separators=(",", ":"))
+        self.page.runJavaScript(f"window.qtBridge && qtBridge.receive({payload});")
+        self._since_send.restart()
+        self.batches += 1
+        self.messages += len(messages)
+        self.bytes_sent += len(payload)
+
+    @staticmethod
+    def _encode(message: dict) -> dict:
+        parts = message.pop("_parts", None)
+        if parts is None:
+            return message
+        values = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        message["block"] = {"dtype": values.dtype.name, "shape": list(values.shape),
+                            "data": base64.b64encode(values.tobytes()).decode("ascii")}
+        return message
+
+    # ----------------- From the page -----------------
+    def _page_ready(self):
+        self.ready = True
+        self.sent_seq = self.acked_seq = 0
+        self.flush()
+
+    def _page_unloaded(self):
+        self.ready = False
+
+    def _acked(self, seq: int):
+        self.acked_seq = max(self.acked_seq, seq)
+
+    def _posted(self, text: str):
+        try:
+            message = json.loads(text)
+        except ValueError as e:
+            print(f"[WebBridge] Bad message from page: {e}")
+            return
+        self.received.emit(message)
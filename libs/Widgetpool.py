@@ -0,0 +1,147 @@
+"""
+Widget recycling for UIs that keep adding and dropping widgets.
+
+Creating a widget means allocating it, polishing its style, wiring its
+signals and, once it is in a layout, invalidating that layout; deleting
+it undoes all of that again. `WidgetPool` keeps released widgets per
+kind, hidden but still parented, and hands them out again after a
+`reset` call, so signals are wired once per instance (handlers should
+read the widget's current state rather than capture it). `LayoutBatcher`
+queues insertions and removals and applies them together, once per
+event-loop pass, before the layout request and the repaint they cause are
+handled, so a burst of churn costs one layout and one repaint; a widget
+added and dropped within the same pass never reaches the layout.
+
+    pool = WidgetPool()
+    pool.register("button", make_button, reset_button)
+    batch = LayoutBatcher(layout, pool)
+    widget = pool.acquire("button")
+    batch.insert(widget)
+    batch.remove(oldest)        # released to the pool when the batch is applied
+"""
+from collections import defaultdict, deque
+from typing import Callable, NamedTuple, Optional
+
+from PyQt6.QtCore import QObject, QTimer, QSignalBlocker
+from PyQt6.QtWidgets import QWidget, QLayout
+
+KIND_PROPERTY = "widgetPoolKind"
+
+
+class PoolKind(NamedTuple):
+    factory: Callable[[], QWidget]
+    reset: Optional[Callable[[QWidget], None]]
+
+
+class WidgetPool:
+    """
+    Released widgets per kind, up to `limit` each; beyond that they are
+    deleted. `reset(widget)` runs with the widget's signals blocked, so
+    clearing its state does not fire its handlers.
+    """
+
+    def __init__(self, limit: int = 64):
+        self.limit = limit
+        self.kinds: dict[str, PoolKind] = {}
+        self.free: dict[str, deque] = defaultdict(deque)
+        self.created = 0
+        self.reused = 0
+        self.deleted = 0
+
+    def register(self, kind: str, factory: Callable[[], QWidget],
+                 reset: Optional[Callable[[QWidget], None]] = None):
+        self.kinds[kind] = PoolKind(factory, reset)
+
+    def acquire(self, kind: str) -> QWidget:
+        free = self.free[kind]
+        if free:
+            widget = free.pop()   # the most recently released one is the warmest
+            self.reused += 1
+        else:
+            widget = self.kinds[kind].factory()
+            widget.setProperty(KIND_PROPERTY, kind)
+            self.created += 1
+        return widget
+
+    def release(self, widget: QWidget):
+        """Take `widget` back: hidden and reset, or deleted when its kind is full."""
+        kind = widget.property(KIND_PROPERTY)
+        widget.hide()
+        if kind not in self.kinds or len(self.free[kind]) >= self.limit:
+            widget.deleteLater()
+            self.deleted += 1
+            return
+        reset = self.kinds[kind].reset
+        if reset is not None:
+            blocker = QSignalBlocker(widget)
+            reset(widget)
+            blocker.unblock()
+        self.free[kind].append(widget)
+
+    def idle(self) -> int:
+        return sum(len(free) for free in self.free.values())
+
+    def clear(self):
+        """Delete every idle widget."""
+        for free in self.free.values():
+            while free:
+                free.pop().deleteLater()
+                self.deleted += 1
+
+
+class LayoutBatcher(QObject):
+    """
+    Queues `insert()`/`remove()` on a layout and applies the whole batch
+    on the next event-loop pass (or `flush()`). Removed widgets go back to
+    `pool` when there is one.
+    """
+
+    def __init__(self, layout: QLayout, pool: Optional[WidgetPool] = None):
+        super().__init__(layout)
+        self.layout = layout
+        self.pool = pool
+        self._inserts: list[QWidget] = []
+        self._removes: list[QWidget] = []
+        self.batches = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    def insert(self, widget: QWidget):
+        self._inserts.append(widget)
+        self._timer.start()
+
+    def remove(self, widget: QWidget):
+        if widget in self._inserts:   # added and dropped within one batch
+            self._inserts.remove(widget)
+            self._release(widget)
+            return
+        self._removes.append(widget)
+        self._timer.start()
+
+    def pending(self) -> int:
+        return len(self._inserts) + len(self._removes)
+
+    def flush(self):
+        self._timer.stop()
+        if not self._inserts and not self._removes:
+            return
+        inserts, self._inserts = self._inserts, []
+        removes, self._removes = self._removes, []
+        # No setUpdatesEnabled() around this: re-enabling repaints every child,
+        # while the updates queued here are coalesced into one paint anyway
+        for widget in removes:
+            self.layout.removeWidget(widget)
+            self._release(widget)
+        for widget in inserts:
+            self.layout.addWidget(widget)
+            widget.show()
+        self.batches += 1
+
+    def _release(self, widget: QWidget):
+        if self.pool is not None:
+            self.pool.release(widget)
+        else:
+            widget.hide()
+            widget.deleteLater()
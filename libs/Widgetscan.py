@@ -0,0 +1,462 @@
+"""
+Static widget discovery: which classes of a source file are QWidgets,
+without importing it.
+
+Base classes are resolved over the AST. Names bound by `import` and
+`from ... import` (relative or absolute, found next to the file or in
+a parent folder), `Alias = Other` assignments and `module.Class`
+attributes are followed into the local modules they name, until they
+reach a Qt class (`PyQt6`, `PyQt5`, `PySide6`, `PySide2`). Parsed
+modules are cached per `WidgetResolver`. A Qt class is a widget when
+QtWidgets or EXTRA_WIDGETS says so, and known not to be one when it
+comes from a module without widgets (QtCore, QtGui...) or is one of
+QtWidgets' other classes; any other Qt name is left unknown, as is a
+class with a base that is not a name (`make_base()`, `Base[T]`).
+
+    resolver = WidgetResolver()
+    resolver.qt_base(path, "RendererWidget")    # "QWidget", "QMainWindow", "" (not a widget), None (unknown)
+    scan_file(path).candidates                  # widget classes, best entry point first
+    check_entry_point(path, "RendererWidget")   # [] or what is wrong with it
+
+`check_entry_point()` tells, before the source is imported, whether a
+manifest's entry point exists, derives from QWidget and can be built
+without arguments.
+
+Ranking favours the class built in the `if __name__ == "__main__":`
+block (or in a function called from it), then a QMainWindow, a name
+matching the file, and penalises classes that need constructor
+arguments or that other classes of the file build or derive from.
+"""
+import ast
+import difflib
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+QT_PACKAGES = {"PyQt6", "PyQt5", "PySide6", "PySide2"}
+
+# Widget classes outside QtWidgets, known by name so their (heavy) modules are never imported
+EXTRA_WIDGETS = frozenset({
+    "QChartView", "QWebEngineView", "QOpenGLWidget", "QSvgWidget", "QVideoWidget", "QQuickWidget",
+    "QPdfView", "QCameraViewfinder", "QAxWidget", "QDesignerFormWindowInterface",
+    "QPrintPreviewWidget", "QPrintDialog", "QPageSetupDialog", "QsciScintilla",
+    "QDesktopWidget", "QGLWidget",   # PyQt5 only
+})
+
+# Qt modules without a single widget class: what comes from them is known not to be one
+NON_WIDGET_MODULES = frozenset({
+    "QtCore", "QtGui", "QtNetwork", "QtSql", "QtXml", "QtDBus", "QtQml", "QtWebChannel", "QtTest",
+})
+
+# Used when PyQt6 itself is missing
+FALLBACK_WIDGETS = frozenset({
+    "QWidget", "QMainWindow", "QDialog", "QFrame", "QLabel", "QPushButton", "QAbstractButton",
+    "QGroupBox", "QScrollArea", "QAbstractScrollArea", "QTabWidget", "QStackedWidget", "QSplitter",
+    "QListView", "QListWidget", "QTreeView", "QTreeWidget", "QTableView", "QTableWidget",
+    "QAbstractItemView", "QGraphicsView", "QTextEdit", "QPlainTextEdit", "QLineEdit", "QComboBox",
+    "QSpinBox", "QDoubleSpinBox", "QSlider", "QAbstractSlider", "QProgressBar", "QToolBar",
+    "QDockWidget", "QMenu", "QMenuBar", "QStatusBar", "QCheckBox", "QRadioButton", "QToolButton",
+    "QCalendarWidget", "QMdiArea", "QWizard", "QMessageBox", "QFileDialog", "QInputDialog",
+})
+
+
+@lru_cache(maxsize=None)
+def qt_widget_names() -> frozenset:
+    """Names of the QWidget classes of QtWidgets (from PyQt6 when installed) and EXTRA_WIDGETS."""
+    try:
+        from PyQt6 import QtWidgets
+    except ImportError:
+        return FALLBACK_WIDGETS | EXTRA_WIDGETS
+    names = {name for name, obj in vars(QtWidgets).items()
+             if isinstance(obj, type) and issubclass(obj, QtWidgets.QWidget)}
+    return frozenset(names) | EXTRA_WIDGETS
+
+
+@lru_cache(maxsize=None)
+def qt_non_widget_names() -> frozenset:
+    """Classes of QtWidgets that are not QWidgets (QApplication, layouts...); empty without PyQt6."""
+    try:
+        from PyQt6 import QtWidgets
+    except ImportError:
+        return frozenset()
+    names = {name for name, obj in vars(QtWidgets).items()
+             if isinstance(obj, type) and not issubclass(obj, QtWidgets.QWidget)}
+    return frozenset(names) - EXTRA_WIDGETS
+
+
+class ClassInfo(NamedTuple):
+    name: str
+    lineno: int
+    bases: list[str]                 # dotted names
+    opaque_bases: list[str]          # other base expressions (`make_base()`, `Base[T]`): cannot be followed
+    required: Optional[list[str]]    # __init__ parameters without defaults; None when it has no __init__
+    builds: set[str]                 # names called in its body
+
+
+class FunctionInfo(NamedTuple):
+    name: str
+    lineno: int
+    required: list[str]
+
+
+class ModuleInfo(NamedTuple):
+    path: Path
+    classes: dict[str, ClassInfo]
+    functions: dict[str, FunctionInfo]
+    imports: dict[str, tuple[str, Optional[str], int]]   # local name -> (module, name or None, level)
+    aliases: dict[str, str]                               # Name = dotted.name at top level
+    main_builds: set[str]                                 # names called under `if __name__ ...`
+    star_imports: bool
+    bound: set[str]                                       # every name the module binds at top level
+    literals: set[str]                                    # Name = literal (number, string, list...) at top level
+
+
+class Candidate(NamedTuple):
+    name: str
+    lineno: int
+    qt_base: str                     # the Qt widget class it derives from
+    score: int
+    reasons: list[str]
+    required: list[str]              # constructor arguments without defaults
+
+
+class FileScan(NamedTuple):
+    path: str
+    digest: str
+    candidates: list[Candidate]      # best first
+    error: str                       # "" when parsed
+
+
+# ----------------- Parsing -----------------
+def _dotted(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        head = _dotted(node.value)
+        return f"{head}.{node.attr}" if head else None
+    return None
+
+
+def _required(args: ast.arguments, method: bool) -> list[str]:
+    positional = args.posonlyargs + args.args
+    if method and positional:
+        positional = positional[1:]
+    required = [a.arg for a in positional[:len(positional) - len(args.defaults)]]
+    required += [a.arg for a, default in zip(args.kwonlyargs, args.kw_defaults) if default is None]
+    return required
+
+
+def _calls(nodes) -> set[str]:
+    """Names called anywhere below `nodes` (`Name(...)` and the last part of `a.Name(...)`)."""
+    names = set()
+    for top in nodes:
+        for node in ast.walk(top):
+            if isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name):
+                    names.add(node.func.id)
+                elif isinstance(node.func, ast.Attribute):
+                    names.add(node.func.attr)
+    return names
+
+
+def _bound_names(tree: ast.Module) -> set[str]:
+    """Names bound at module level, also inside if/try/with/for blocks and through `global`."""
+    names = set()
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+            continue
+        if isinstance(node, ast.Lambda):
+            continue
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update((a.asname or a.name).split(".")[0] for a in node.names)
+        stack.extend(ast.iter_child_nodes(node))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Global):
+            names.update(node.names)
+    return names
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    return isinstance(node, ast.If) and any(isinstance(n, ast.Name) and n.id == "__name__"
+                                            for n in ast.walk(node.test))
+
+
+def parse_module(path: Path, source: Optional[str] = None) -> ModuleInfo:
+    """Top-level classes, functions, imports and aliases of a module (raises SyntaxError, OSError)."""
+    tree = ast.parse(source if source is not None else Path(path).read_text(encoding="utf-8"), str(path))
+    classes, functions, imports, aliases = {}, {}, {}, {}
+    main_nodes, star, literals = [], False, set()
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            init = next((n for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+                         and n.name == "__init__"), None)
+            dotted = [_dotted(b) for b in node.bases]
+            classes[node.name] = ClassInfo(node.name, node.lineno, [d for d in dotted if d],
+                                           [ast.unparse(b) for b, d in zip(node.bases, dotted) if not d],
+                                           _required(init.args, True) if init else None, _calls(node.body))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions[node.name] = FunctionInfo(node.name, node.lineno, _required(node.args, False))
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    imports[alias.asname] = (alias.name, None, 0)
+                else:
+                    top = alias.name.split(".")[0]
+                    imports[top] = (top, None, 0)
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name == "*":
+                    star = True
+                else:
+                    imports[alias.asname or alias.name] = (node.module or "", alias.name, node.level)
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            target = _dotted(node.value)
+            if target:
+                aliases[node.targets[0].id] = target
+            elif isinstance(node.value, (ast.Constant, ast.JoinedStr, ast.List, ast.Tuple, ast.Dict, ast.Set)):
+                literals.add(node.targets[0].id)
+        elif _is_main_guard(node):
+            main_nodes.append(node)
+    main_builds = _calls(main_nodes)
+    # One level down: `def main(): w = Window()` called from the guard
+    for name in list(main_builds):
+        if name in functions:
+            body = next(n for n in tree.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+                        and n.name == name)
+            main_builds |= _calls(body.body)
+    return ModuleInfo(Path(path), classes, functions, imports, aliases, main_builds, star, _bound_names(tree),
+                      literals - set(classes) - set(functions))
+
+
+# ----------------- Resolution -----------------
+class WidgetResolver:
+    """Resolves names of a module to the Qt widget class they derive from; parsed modules are cached."""
+
+    def __init__(self, max_parents: int = 4):
+        self.max_parents = max_parents   # parent folders searched for absolute local imports
+        self._modules: dict[Path, Optional[ModuleInfo]] = {}
+
+    def module(self, path: Path) -> Optional[ModuleInfo]:
+        path = Path(path).resolve()
+        if path not in self._modules:
+            try:
+                self._modules[path] = parse_module(path)
+            except (OSError, SyntaxError, ValueError, UnicodeDecodeError):
+                self._modules[path] = None
+        return self._modules[path]
+
+    def qt_base(self, path: Path, name: str) -> Optional[str]:
+        """Qt widget class that `name` in the module at `path` derives from; "" if none, None if unknown."""
+        info = self.module(path)
+        return self.resolve(info, name) if info else None
+
+    def resolve(self, info: ModuleInfo, name: str, seen: Optional[set] = None) -> Optional[str]:
+        seen = set() if seen is None else seen
+        key = (info.path, name)
+        if key in seen:
+            return ""   # inheritance cycle
+        seen.add(key)
+        if name in info.classes:
+            unknown = bool(info.classes[name].opaque_bases)
+            for base in info.classes[name].bases:
+                found = self._resolve_dotted(info, base, seen)
+                if found:
+                    return found
+                unknown |= found is None
+            return None if unknown else ""
+        if name in info.aliases:
+            return self._resolve_dotted(info, info.aliases[name], seen)
+        if name in info.imports:
+            module, attr, level = info.imports[name]
+            return self._resolve_import(info, module, attr, level, seen) if attr else ""
+        if name in info.functions or name in ("object", "Exception"):
+            return ""
+        return None   # builtin, star import or undefined
+
+    def _resolve_dotted(self, info: ModuleInfo, dotted: str, seen: set) -> Optional[str]:
+        parts = dotted.split(".")
+        if len(parts) == 1:
+            return self.resolve(info, dotted, seen)
+        if parts[0] not in info.imports:
+            return None
+        module, attr, level = info.imports[parts[0]]
+        qualified = ".".join(p for p in (module, attr, *parts[1:-1]) if p)
+        return self._resolve_import(info, qualified, parts[-1], level, seen)
+
+    def _resolve_import(self, info: ModuleInfo, module: str, attr: str, level: int, seen: set) -> Optional[str]:
+        if not level and module.split(".")[0] in QT_PACKAGES:
+            if attr in qt_widget_names():
+                return attr
+            submodule = module.split(".")[1] if "." in module else ""
+            if submodule in NON_WIDGET_MODULES or attr in qt_non_widget_names():
+                return ""
+            return None   # other Qt modules and versions (QtPrintSupport, Qsci, PyQt5-only classes)
+        path = self.find_module(info.path, module, level)
+        if path is None:
+            return None   # third-party or missing: cannot tell
+        target = self.module(path)
+        return self.resolve(target, attr, seen) if target else None
+
+    def definition(self, info: ModuleInfo, name: str,
+                   seen: Optional[set] = None) -> tuple[Optional[ModuleInfo], Optional[object]]:
+        """The ClassInfo or FunctionInfo `name` stands for, following aliases and local imports."""
+        seen = set() if seen is None else seen
+        if (info.path, name) in seen:
+            return None, None
+        seen.add((info.path, name))
+        if name in info.classes:
+            return info, info.classes[name]
+        if name in info.functions:
+            return info, info.functions[name]
+        if name in info.aliases and "." not in info.aliases[name]:
+            return self.definition(info, info.aliases[name], seen)
+        if name in info.imports:
+            module, attr, level = info.imports[name]
+            path = self.find_module(info.path, module, level) if attr else None
+            target = self.module(path) if path else None
+            if target:
+                return self.definition(target, attr, seen)
+        return None, None
+
+    def _definition_dotted(self, info: ModuleInfo, dotted: str) -> tuple[Optional[ModuleInfo], Optional[object]]:
+        parts = dotted.split(".")
+        if len(parts) == 1:
+            return self.definition(info, dotted)
+        if parts[0] not in info.imports:
+            return None, None
+        module, attr, level = info.imports[parts[0]]
+        path = self.find_module(info.path, ".".join(p for p in (module, attr, *parts[1:-1]) if p), level)
+        target = self.module(path) if path else None
+        return self.definition(target, parts[-1]) if target else (None, None)
+
+    def init_required(self, info: ModuleInfo, name: str) -> Optional[list[str]]:
+        """
+        Required `__init__` arguments of class `name`: its own `__init__`'s
+        or the first one up its local bases; [] when it gets Qt's, None
+        when it is not a local class or a base cannot be followed.
+        """
+        owner, cls = self.definition(info, name)
+        return self._init_required(owner, cls, set()) if isinstance(cls, ClassInfo) else None
+
+    def _init_required(self, owner: ModuleInfo, cls: ClassInfo, seen: set) -> Optional[list[str]]:
+        if (owner.path, cls.name) in seen:
+            return []   # inheritance cycle
+        seen.add((owner.path, cls.name))
+        if cls.required is not None:
+            return cls.required
+        for base in cls.bases:
+            base_owner, base_cls = self._definition_dotted(owner, base)
+            if isinstance(base_cls, ClassInfo):
+                required = self._init_required(base_owner, base_cls, seen)
+                if required != []:
+                    return required
+            elif self._resolve_dotted(owner, base, set()) is None:
+                return None   # neither local nor Qt: cannot tell
+        return None if cls.opaque_bases else []
+
+    def find_module(self, origin: Path, module: str, level: int = 0) -> Optional[Path]:
+        """File of a local module imported from `origin` (package __init__ or module.py)."""
+        parts = [p for p in module.split(".") if p]
+        if level:
+            folders = [origin.parents[level - 1]] if level <= len(origin.parents) else []
+        else:
+            folders = list(origin.parents)[:self.max_parents + 1]
+        for folder in folders:
+            base = folder.joinpath(*parts) if parts else folder
+            for candidate in (base.with_suffix(".py") if parts else None, base / "__init__.py"):
+                if candidate is not None and candidate.is_file():
+                    return candidate.resolve()
+        return None
+
+
+# ----------------- Ranking -----------------
+def rank_candidates(info: ModuleInfo, resolver: WidgetResolver) -> list[Candidate]:
+    """The module's widget classes, most likely entry point first."""
+    bases = {name: resolver.resolve(info, name) for name in info.classes}
+    widgets = [name for name, base in bases.items() if base]
+    derived_from = {b.split(".")[-1] for name in widgets for b in info.classes[name].bases}
+    candidates = []
+    for name in widgets:
+        cls = info.classes[name]
+        score, reasons = 0, [f"derives from {bases[name]}"]
+        if name in info.main_builds:
+            score += 50
+            reasons.append("built under __main__")
+        if bases[name] == "QMainWindow":
+            score += 15
+            reasons.append("main window")
+        if name.lower() == info.path.stem.replace(" ", "").lower():
+            score += 10
+            reasons.append("named after the file")
+        built_by = [other for other in widgets if other != name and name in info.classes[other].builds]
+        if built_by:
+            score -= 10
+            reasons.append(f"built by {', '.join(built_by)}")
+        if name in derived_from:
+            score -= 20
+            reasons.append("base of another widget")
+        required = resolver.init_required(info, name) or []   # inherited __init__ too, as check_entry_point sees it
+        if required:
+            score -= 40
+            reasons.append(f"needs {', '.join(required)}")
+        candidates.append(Candidate(name, cls.lineno, bases[name], score, reasons, required))
+    return sorted(candidates, key=lambda c: (-c.score, c.lineno))
+
+
+def check_entry_point(path: Path, name: str, resolver: Optional[WidgetResolver] = None) -> list[str]:
+    """
+    What is wrong with `name` as the entry point of the module at `path`,
+    found without importing it; [] when it plausibly builds a widget with
+    no arguments. What cannot be followed (bases from other packages, star
+    imports, names bound dynamically) gets the benefit of the doubt.
+    """
+    resolver = resolver or WidgetResolver()
+    info = resolver.module(path)
+    if info is None:
+        return []   # unreadable or invalid: the syntax stage says why
+    if name not in info.bound:
+        if info.star_imports or "__getattr__" in info.functions:
+            return []
+        close = difflib.get_close_matches(name, list(info.classes) + list(info.functions), n=1)
+        hint = f" (did you mean '{close[0]}'?)" if close else ""
+        return [f"'{name}' is not defined in {info.path.name}{hint}"]
+    if name in info.literals:
+        return [f"'{name}' is a constant, not a class or function"]
+    owner, definition = resolver.definition(info, name)
+    problems = []
+    if isinstance(definition, ClassInfo):
+        if resolver.resolve(owner, definition.name) == "":
+            problems.append(f"'{name}' is a class that does not derive from QWidget")
+        required = resolver.init_required(owner, definition.name)
+        if required:
+            problems.append(f"'{name}' cannot be built without arguments (needs {', '.join(required)})")
+    elif isinstance(definition, FunctionInfo) and definition.required:
+        problems.append(f"'{name}' cannot be called without arguments (needs {', '.join(definition.required)})")
+    return problems
+
+
+_resolver = None   # per process, so pool workers share parsed imports across files
+
+
+def scan_file(path: str) -> FileScan:
+    """Hash, parse and rank one file (process-pool friendly: plain arguments and results)."""
+    global _resolver
+    if _resolver is None:
+        _resolver = WidgetResolver()
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        return FileScan(path, "", [], str(e))
+    digest = hashlib.sha1(data).hexdigest()
+    try:
+        info = parse_module(Path(path).resolve(), data.decode("utf-8"))
+    except (SyntaxError, ValueError, UnicodeDecodeError) as e:
+        return FileScan(path, digest, [], f"{type(e).__name__}: {e}")
+    _resolver._modules[info.path] = info
+    return FileScan(path, digest, rank_candidates(info, _resolver), "")
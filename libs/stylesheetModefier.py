@@ -1,24 +1,344 @@
 # libs/stylesheetModefier.py
-from PyQt6.QtWidgets import QWidget
+import os
+import re
+import configparser
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer, QFileSystemWatcher
+from PyQt6.QtWidgets import QWidget, QApplication
 from pathlib import Path
+from typing import Optional
+
+# @name placeholders in a QSS template, e.g. "color: @text;"
+VARIABLE_PATTERN = re.compile(r"@([A-Za-z_][\w-]*)")
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+RULE_PATTERN = re.compile(r"([^{}]+)\{([^{}]*)\}")
+ID_PATTERN = re.compile(r"#([A-Za-z_][\w-]*)")
+TYPE_PATTERN = re.compile(r"\.?([A-Za-z_]\w*)")
+ATTRIBUTE_PATTERN = re.compile(r"\[[^\]]*\]")
+STATE_PATTERN = re.compile(r"::?!?[\w-]+(?:\([^)]*\))?")   # :hover, :!enabled, ::item, ::indicator:checked
+COMBINATOR_PATTERN = re.compile(r"\s*[\s>+~]\s*")
+
+# Dynamic property marking a subtree the engine must not give sheets to
+# (set by DetachableRenderer on hosted widgets)
+HOSTED_PROPERTY = "qtforgeHosted"
+# Dynamic property on widgets whose sheet the engine set, so inline
+# sheets set by anything else are never overwritten or cleared
+STYLED_PROPERTY = "qtforgeStyled"
+
+
+def parse_rules(qss: str) -> list[tuple[str, str]]:
+    """Split a QSS string into (selector, body) pairs, one per selector of a group."""
+    rules = []
+    for match in RULE_PATTERN.finditer(COMMENT_PATTERN.sub("", qss)):
+        body = " ".join(match.group(2).split())
+        for selector in match.group(1).split(","):
+            selector = " ".join(selector.split())
+            if selector:
+                rules.append((selector, body))
+    return rules
+
+
+def rule_target(selector: str) -> tuple[Optional[str], Optional[str]]:
+    """
+    (class, objectName) of the widgets a selector styles, read from its last
+    compound selector without pseudo-states, sub-controls and attributes.
+    None matches any class or name: `QFrame#Panel QLabel:hover` -> ("QLabel", None).
+    """
+    compound = COMBINATOR_PATTERN.split(STATE_PATTERN.sub("", ATTRIBUTE_PATTERN.sub("", selector)).strip())[-1]
+    kind, name = TYPE_PATTERN.match(compound), ID_PATTERN.search(compound)
+    return (kind.group(1) if kind else None), (name.group(1) if name else None)
+
+
+def fill_variables(template: str, variables: dict[str, str]) -> tuple[str, set[str]]:
+    """Replace the @names of `template` from `variables`; returns the QSS and the names it lacked."""
+    missing = set()
+
+    def substitute(match: re.Match) -> str:
+        name = match.group(1).lower()
+        if name in variables:
+            return variables[name]
+        missing.add(name)
+        return match.group(0)
+
+    return VARIABLE_PATTERN.sub(substitute, template), missing
+
+
+def _describe(widget: QWidget) -> str:
+    name = widget.objectName()
+    return f"{widget.metaObject().className()}{'#' + name if name else ''}"
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return 0, 0
+
 
 class StylesheetModifier:
-    def __init__(self, qss_path: str | Path, parent: QWidget):
+    """
+    Small QSS theme engine.
+
+    The stylesheet is a template using @variables; each theme is a section
+    of a themes .ini (default: themes.ini next to the .qss). A template is
+    compiled once per theme and kept as a plain string, so switching themes
+    is a dictionary lookup before the sheets are set.
+
+    With no parent the sheet is applied on the QApplication. After
+    `attach(root)` each widget under `root` gets a sheet of only the rules
+    whose last compound selector matches its class and objectName, and a
+    reload re-sets the sheets whose text changed: editing `QTextEdit`
+    re-polishes the text edits, editing `#StatusLabel` the status label.
+    Widgets created later get theirs when Qt first polishes them. Subtrees
+    marked with HOSTED_PROPERTY (the renderer's hosted source) get none, as
+    out of process, though a sheet change on one of their ancestors (say
+    `QMainWindow`) still re-polishes them along with the rest of its subtree.
+    Every rule that can match a widget is on its own sheet, so specificity
+    decides between them as it would on the application sheet.
+    """
+
+    def __init__(self, qss_path: str | Path, parent: Optional[QWidget] = None,
+                 themes_path: str | Path | None = None, theme: Optional[str] = None):
         self.qss_path = Path(qss_path)
         self.parent = parent
+        self.themes_path = Path(themes_path) if themes_path else self.qss_path.with_name("themes.ini")
+
+        self._template: Optional[str] = None
+        self._template_stamp = (0, 0)
+        self._themes: dict[str, dict[str, str]] = {}
+        self._themes_stamp = (0, 0)
+        self._compiled: dict[tuple, str] = {}
+        self._applied: Optional[str] = None
+
+        self._layers: dict[str, str] = {}   # extra templates compiled after the main one
+        self._layers_version = 0
+        self.root: Optional[QWidget] = None
+        self._rules: list[tuple[tuple[Optional[str], Optional[str]], str]] = []   # (class, name) target, rule
+        self._sheets: dict[tuple[str, str], str] = {}   # (class, objectName) -> sheet, for self._rules
+        self._polish_filter: Optional[_PolishFilter] = None
+        self._watcher: Optional[QFileSystemWatcher] = None
+        self._reload_timer: Optional[QTimer] = None
+
+        themes = self.theme_names()
+        self.theme = theme if theme in themes else (themes[0] if themes else None)
+
+    # ----------------- Sources -----------------
+    def _load_template(self) -> Optional[str]:
+        stamp = _stamp(self.qss_path)
+        if self._template is None or stamp != self._template_stamp:
+            try:
+                self._template = self.qss_path.read_text(encoding="utf-8")
+            except OSError:
+                return None
+            self._template_stamp = stamp
+        return self._template
+
+    def _load_themes(self) -> dict[str, dict[str, str]]:
+        stamp = _stamp(self.themes_path)
+        if stamp != self._themes_stamp:
+            # '#' starts colour values here, so only ';' may start an inline comment
+            config = configparser.ConfigParser(inline_comment_prefixes=(";",))
+            try:
+                config.read(self.themes_path, encoding="utf-8")
+            except configparser.Error as e:
+                print(f"[StylesheetModifier] Invalid themes file {self.themes_path.name}: {e}")
+            self._themes = {name: dict(config.items(name)) for name in config.sections()}
+            self._themes_stamp = stamp
+        return self._themes
+
+    def theme_names(self) -> list[str]:
+        return list(self._load_themes())
 
-    def apply_stylesheet(self):
-        """Load and apply the QSS stylesheet to the parent widget."""
+    def variables(self, theme: Optional[str] = None) -> dict[str, str]:
+        """The @variables of `theme` (default: the current one)."""
+        theme = theme or self.theme
+        return self._load_themes().get(theme, {}) if theme else {}
+
+    def add_layer(self, name: str, template: str):
+        """
+        Add (or replace) a named sheet compiled together with the main
+        template, so widgets with their own inline sheet share the theme
+        variables, the compiled cache and the scoped reload.
+        """
+        if self._layers.get(name) == template:
+            return
+        self._layers[name] = template
+        self._layers_version += 1
+        if self.root is not None or self._applied is not None:
+            self.apply_stylesheet()
+
+    # ----------------- Compile -----------------
+    def compile(self, theme: Optional[str] = None) -> Optional[str]:
+        """Return the QSS for `theme`, compiling it only on first use or after an edit."""
+        template = self._load_template()
+        if template is None:
+            return None
+        theme = theme or self.theme
+        variables = self.variables(theme)
+
+        key = (theme, self._template_stamp, self._themes_stamp, self._layers_version)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled, missing = fill_variables("\n".join([template, *self._layers.values()]), variables)
+            if missing:
+                print(f"[StylesheetModifier] Undefined variables in theme '{theme}': {', '.join(sorted(missing))}")
+            self._compiled[key] = compiled
+        return compiled
+
+    # ----------------- Apply -----------------
+    def apply_stylesheet(self) -> list[str]:
+        """
+        Apply the current theme to the parent widget, the application or,
+        once attached, the widgets under root. Returns what was restyled.
+        """
         if not self.qss_path.exists():
             print(f"[StylesheetModifier] QSS file not found: {self.qss_path}")
-            return
+            return []
         try:
-            with open(self.qss_path, 'r', encoding='utf-8') as f:
-                qss_content = f.read()
+            qss_content = self.compile()
+            if qss_content is None or qss_content == self._applied:
+                return []  # every setStyleSheet re-polishes a whole tree; skip no-ops
+            if self.root is not None and self.parent is None:
+                changed = self._apply_scoped(qss_content)
+            elif self.parent is not None:
                 self.parent.setStyleSheet(qss_content)
-                print(f"[StylesheetModifier] Stylesheet applied: {self.qss_path.name}")
+                changed = [_describe(self.parent)]
+            else:
+                QApplication.instance().setStyleSheet(qss_content)
+                changed = ["QApplication"]
+            self._applied = qss_content
+            return changed
         except Exception as e:
             print(f"[StylesheetModifier] Failed to apply stylesheet: {e}")
+            return []
+
+    # ----------------- Scoped apply -----------------
+    def attach(self, root: QWidget):
+        """
+        Give each widget under `root` its own sheet and apply. Best called
+        before `root` is first shown, while nothing is polished yet.
+        """
+        app = QApplication.instance()
+        if self._applied is not None and app.styleSheet() == self._applied:
+            app.setStyleSheet("")   # applied before attaching: the widget sheets take over
+        self.root = root
+        self._applied = None
+        if self._polish_filter is None:
+            self._polish_filter = _PolishFilter(self)
+            app.installEventFilter(self._polish_filter)
+        self.apply_stylesheet()
+
+    def _targets(self) -> list[QWidget]:
+        """Root and the widgets under it, not descending into hosted sources."""
+        found = []
+        stack = [self.root]
+        while stack:
+            widget = stack.pop()
+            if widget.property(HOSTED_PROPERTY):
+                continue
+            found.append(widget)
+            stack.extend(widget.findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly))
+        return found
+
+    def _is_target(self, widget: QWidget) -> bool:
+        while widget is not None:
+            if widget.property(HOSTED_PROPERTY):
+                return False
+            if widget is self.root:
+                return True
+            widget = widget.parentWidget()
+        return False
+
+    def _sheet_for(self, widget: QWidget) -> str:
+        name = widget.objectName()
+        key = (widget.metaObject().className(), name)
+        sheet = self._sheets.get(key)
+        if sheet is None:
+            sheet = "\n".join(rule for (kind, target), rule in self._rules
+                              if (target is None or target == name) and (kind is None or widget.inherits(kind)))
+            self._sheets[key] = sheet
+        return sheet
+
+    def _restyle(self, widget: QWidget) -> bool:
+        """Set the widget's sheet if it changed; False when it did not, or the sheet is not ours."""
+        sheet = self._sheet_for(widget)
+        current = widget.styleSheet()
+        if current == sheet or (current and not widget.property(STYLED_PROPERTY)):
+            return False
+        widget.setProperty(STYLED_PROPERTY, True)
+        widget.setStyleSheet(sheet)
+        return True
+
+    def _apply_scoped(self, qss: str) -> list[str]:
+        self._rules = [(rule_target(selector), f"{selector} {{ {body} }}") for selector, body in parse_rules(qss)]
+        self._sheets = {}
+        # Every target is restyled here anyway; the filter would only add a Python call per event
+        app = QApplication.instance()
+        app.removeEventFilter(self._polish_filter)
+        try:
+            return [_describe(widget) for widget in self._targets() if self._restyle(widget)]
+        finally:
+            app.installEventFilter(self._polish_filter)
+
+    # ----------------- Hot reload -----------------
+    def watch(self, enabled: bool = True):
+        """Re-apply automatically when the .qss or the themes file is saved."""
+        if not enabled:
+            if self._watcher is not None:
+                self._watcher.deleteLater()
+                self._watcher = None
+            return
+        if self._watcher is None:
+            self._watcher = QFileSystemWatcher()
+            self._watcher.fileChanged.connect(self._on_file_changed)
+            self._reload_timer = QTimer()
+            self._reload_timer.setSingleShot(True)
+            self._reload_timer.setInterval(100)  # editors often write a file twice
+            self._reload_timer.timeout.connect(self.reload)
+        for path in (self.qss_path, self.themes_path):
+            if path.exists() and str(path) not in self._watcher.files():
+                self._watcher.addPath(str(path))
+
+    def _on_file_changed(self, path: str):
+        # Atomic saves replace the file and drop it from the watcher
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+        self._reload_timer.start()
+
+    def reload(self) -> list[str]:
+        """Recompile from disk and re-apply; only the widgets whose sheet changed are re-polished."""
+        changed = self.apply_stylesheet()
+        if changed:
+            shown = ", ".join(sorted(set(changed))[:8]) + (", ..." if len(set(changed)) > 8 else "")
+            print(f"[StylesheetModifier] Restyled {len(changed)} widget(s): {shown}")
+        return changed
+
+    def set_theme(self, theme: str):
+        if theme not in self.theme_names():
+            print(f"[StylesheetModifier] Unknown theme: {theme}")
+            return
+        self.theme = theme
+        self.apply_stylesheet()
+
+    def toggle_theme(self) -> Optional[str]:
+        """Switch to the next theme (dark <-> light) and return its name."""
+        themes = self.theme_names()
+        if not themes:
+            return None
+        index = themes.index(self.theme) if self.theme in themes else -1
+        self.set_theme(themes[(index + 1) % len(themes)])
+        return self.theme
+
+
+class _PolishFilter(QObject):
+    """Gives widgets created under the attached root their sheet on first polish."""
+
+    def __init__(self, engine: StylesheetModifier):
+        super().__init__()
+        self.engine = engine
 
-    def toggle_theme(self):
-        pass
\ No newline at end of file
+    def eventFilter(self, obj, event):
+        if (event.type() == QEvent.Type.Polish and isinstance(obj, QWidget)
+                and self.engine.root is not None and self.engine._is_target(obj)):
+            self.engine._restyle(obj)
+        return False
@@ -1,78 +1,128 @@
 import sys
+from pathlib import Path
 import random
-from PyQt6.QtWidgets import *
-from PyQt6.QtCore import *
-from PyQt6.QtGui import *
+from collections import deque
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QLineEdit,
+                             QCheckBox, QRadioButton, QComboBox, QTextEdit)
+from PyQt6.QtCore import QTimer
+
+if __name__ == "__main__":   # run on its own: the studio has libs on the path when it hosts this file
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from libs.Widgetpool import WidgetPool, LayoutBatcher
+
+WIDGET_TYPES = ['button', 'label', 'lineedit', 'checkbox', 'radiobutton', 'combobox', 'textedit']
+
+
+# Signals are wired once per instance: handlers read the widget's current text,
+# so they stay right when the pool hands the widget out again
+def make_button():
+    widget = QPushButton()
+    widget.clicked.connect(lambda _, w=widget: print(f"{w.text()} clicked"))
+    return widget
+
+
+def make_lineedit():
+    widget = QLineEdit()
+    widget.textChanged.connect(lambda text, w=widget: print(f"{w.placeholderText()} text: {text}"))
+    return widget
+
+
+def make_checkbox():
+    widget = QCheckBox()
+    widget.stateChanged.connect(lambda state, w=widget: print(f"{w.text()} state: {state}"))
+    return widget
+
+
+def make_radiobutton():
+    widget = QRadioButton()
+    widget.setAutoExclusive(False)  # recycled radios must not uncheck each other's reset
+    widget.toggled.connect(lambda checked, w=widget: print(f"{w.text()} toggled: {checked}"))
+    return widget
+
+
+def make_combobox():
+    widget = QComboBox()
+    widget.addItems([f"Item {i}" for i in range(1, 6)])
+    widget.currentIndexChanged.connect(lambda idx, w=widget: print(f"{w.currentText()} selected"))
+    return widget
+
+
+def make_textedit():
+    widget = QTextEdit()
+    widget.textChanged.connect(lambda w=widget: print(f"{w.placeholderText()} changed"))
+    return widget
+
 
 class DynamicTestUI(QWidget):
     """
     Generates widgets dynamically for testing the live renderer.
     Continuously adds widgets with random types, positions, and signals.
+    Widgets are recycled through a pool and layout changes are batched.
     """
 
-    def __init__(self):
+    def __init__(self, interval_ms: int = 500, max_widgets: int = 50, per_tick: int = 1):
         super().__init__()
         self.setWindowTitle("Dynamic Test UI")
         self.resize(800, 600)
+        self.max_widgets = max_widgets
+        self.per_tick = per_tick
+        self.counter = 0
 
         # Layout
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
+        # Pool per widget type; reset() runs with signals blocked
+        self.pool = WidgetPool(limit=max_widgets)
+        self.pool.register('button', make_button, lambda w: w.setDown(False))
+        self.pool.register('label', QLabel)
+        self.pool.register('lineedit', make_lineedit, lambda w: w.clear())
+        self.pool.register('checkbox', make_checkbox, lambda w: w.setChecked(False))
+        self.pool.register('radiobutton', make_radiobutton, lambda w: w.setChecked(False))
+        self.pool.register('combobox', make_combobox, lambda w: w.setCurrentIndex(0))
+        self.pool.register('textedit', make_textedit, lambda w: w.clear())
+        self.batch = LayoutBatcher(self.layout, self.pool)
+
+        # Keep track of widgets
+        self.widgets = deque()
+
         # Timer to add widgets slowly
         self.widget_timer = QTimer()
-        self.widget_timer.timeout.connect(self.add_random_widget)
-        self.widget_timer.start(500)  # add widget every 0.5 seconds
+        self.widget_timer.timeout.connect(self.add_random_widgets)
+        self.widget_timer.start(interval_ms)  # add widget every 0.5 seconds
 
-        # Keep track of widgets
-        self.widgets = []
+    def add_random_widgets(self):
+        for _ in range(self.per_tick):
+            self.add_random_widget()
 
     def add_random_widget(self):
         # Randomly choose widget type
-        widget_type = random.choice(['button', 'label', 'lineedit', 'checkbox', 'radiobutton', 'combobox', 'textedit'])
-        widget = None
+        widget_type = random.choice(WIDGET_TYPES)
+        widget = self.pool.acquire(widget_type)
+        self.counter += 1
+        n = self.counter
 
         if widget_type == 'button':
-            widget = QPushButton(f"Button {len(self.widgets)+1}")
-            widget.clicked.connect(lambda _, w=widget: print(f"{w.text()} clicked"))
-
+            widget.setText(f"Button {n}")
         elif widget_type == 'label':
-            widget = QLabel(f"Label {len(self.widgets)+1}")
+            widget.setText(f"Label {n}")
             widget.setStyleSheet(f"color: rgb({random.randint(0,255)},{random.randint(0,255)},{random.randint(0,255)});")
-
         elif widget_type == 'lineedit':
-            widget = QLineEdit()
-            widget.setPlaceholderText(f"LineEdit {len(self.widgets)+1}")
-            widget.textChanged.connect(lambda text, w=widget: print(f"{w.placeholderText()} text: {text}"))
-
+            widget.setPlaceholderText(f"LineEdit {n}")
         elif widget_type == 'checkbox':
-            widget = QCheckBox(f"CheckBox {len(self.widgets)+1}")
-            widget.stateChanged.connect(lambda state, w=widget: print(f"{w.text()} state: {state}"))
-
+            widget.setText(f"CheckBox {n}")
         elif widget_type == 'radiobutton':
-            widget = QRadioButton(f"Radio {len(self.widgets)+1}")
-            widget.toggled.connect(lambda checked, w=widget: print(f"{w.text()} toggled: {checked}"))
+            widget.setText(f"Radio {n}")
+        elif widget_type == 'textedit':
+            widget.setPlaceholderText(f"TextEdit {n}")
 
-        elif widget_type == 'combobox':
-            widget = QComboBox()
-            items = [f"Item {i}" for i in range(1, 6)]
-            widget.addItems(items)
-            widget.currentIndexChanged.connect(lambda idx, w=widget: print(f"{w.currentText()} selected"))
+        self.batch.insert(widget)
+        self.widgets.append(widget)
 
-        elif widget_type == 'textedit':
-            widget = QTextEdit()
-            widget.setPlaceholderText(f"TextEdit {len(self.widgets)+1}")
-            widget.textChanged.connect(lambda w=widget: print(f"{w.placeholderText()} changed"))
-
-        if widget:
-            self.layout.addWidget(widget)
-            self.widgets.append(widget)
-
-        # Optional: remove old widgets to avoid overload
-        if len(self.widgets) > 50:
-            old_widget = self.widgets.pop(0)
-            self.layout.removeWidget(old_widget)
-            old_widget.deleteLater()
+        # Remove old widgets to avoid overload (back to the pool on the next batch)
+        if len(self.widgets) > self.max_widgets:
+            self.batch.remove(self.widgets.popleft())
 
 
 if __name__ == "__main__":
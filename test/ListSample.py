@@ -1,31 +1,35 @@
 import sys
+from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QWidget,
-    QVBoxLayout, QListWidget
+    QVBoxLayout
 )
 
+if __name__ == "__main__":   # run on its own: the studio has libs on the path when it hosts this file
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from libs.Lazylist import LazyListModel, LazyListView
+
+ROWS = 1_000_000   # generated on demand: only the visible rows are ever formatted
+
 
 class ListDoubleClickApp(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Double Click Print")
 
-        self.list_widget = QListWidget()
-        self.list_widget.addItems([
-            "Item A",
-            "Item B",
-            "Item C",
-            "Item D"
-        ])
+        self.list_view = LazyListView()
+        self.model = LazyListModel(range(ROWS), display=lambda i: f"Item {i}")
+        self.list_view.setModel(self.model)
 
         # signal emitted on double click
-        self.list_widget.itemDoubleClicked.connect(self.print_item)
+        self.list_view.doubleClicked.connect(self.print_item)
 
         layout = QVBoxLayout(self)
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.list_view)
 
-    def print_item(self, item):
-        print(item.text())
+    def print_item(self, index):
+        print(index.data())
 
 
 if __name__ == "__main__":
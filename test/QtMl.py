@@ -1,24 +1,19 @@
 # chart_app.py
 import sys
 import json
-import random
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, QUrl
+from pathlib import Path
+import numpy as np
+from PyQt6.QtCore import QTimer, QUrl, QElapsedTimer
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QHBoxLayout
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebChannel import QWebChannel
 
-# ---------------------------
-# Bridge: JS -> Python calls
-# ---------------------------
-class Bridge(QObject):
-    # signal emitted when JS sends a message
-    jsToPy = pyqtSignal(str)
+if __name__ == "__main__":   # run on its own: the studio has libs on the path when it hosts this file
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-    @pyqtSlot(str)
-    def sendToPy(self, msg: str):
-        """Called from JS: bridge.sendToPy('...')"""
-        print("[JS -> PY] got:", msg)
-        self.jsToPy.emit(msg)
+from libs.Webbridge import WebBridge
+
+FEED_HZ = 1000      # simulated live feed
+HISTORY = 5000      # points kept by the page
 
 
 # ---------------------------
@@ -27,7 +22,7 @@ class Bridge(QObject):
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.setWindowTitle("PyQt6 + Chart.js Example")
+        self.setWindowTitle("PyQt6 + Canvas Chart Example")
         self.resize(1000, 700)
 
         container = QWidget()
@@ -47,60 +42,112 @@ class MainWindow(QMainWindow):
         self.view = QWebEngineView()
         layout.addWidget(self.view, 1)
 
-        # WebChannel bridge
-        self.channel = QWebChannel()
-        self.bridge = Bridge()
-        self.channel.registerObject("bridge", self.bridge)
-        self.view.page().setWebChannel(self.channel)
+        # Batched bridge: one runJavaScript per frame, values as typed arrays,
+        # held back while the page is behind
+        self.bridge = WebBridge(self.view.page())
 
         # Connect signals
         btn_update.clicked.connect(self.push_random_data)
         btn_clear.clicked.connect(self.clear_chart)
-        self.bridge.jsToPy.connect(self.on_js_message)
+        self.bridge.received.connect(self.on_js_message)
 
-        # Load HTML (Chart.js from CDN + qwebchannel)
-        self.view.setHtml(self._html(), QUrl("http://local/"))  # base URL helps resolving relative resources if needed
+        # Load HTML (self-contained: the chart and qwebchannel.js are inlined, no CDN)
+        self.view.setHtml(self._html(self.bridge.client_script()), QUrl("http://local/"))
 
-        # Example: live update every 2s
+        # Live feed: the samples due since the last tick, every frame
+        self.rng = np.random.default_rng()
+        self.level = 50.0
+        self.fed = 0
+        self.clock = QElapsedTimer()
+        self.clock.start()
         self.timer = QTimer(self)
-        self.timer.setInterval(2000)
-        self.timer.timeout.connect(self.push_random_data)
+        self.timer.setInterval(16)
+        self.timer.timeout.connect(self.feed)
         self.timer.start()
 
-    def on_js_message(self, msg: str):
+    def on_js_message(self, msg: dict):
         # handle messages from JS (e.g., point clicked)
-        print("[PY] Received from JS:", msg)
+        print("[PY] Received from JS:", json.dumps(msg))
+
+    def feed(self):
+        due = int(self.clock.elapsed() * FEED_HZ / 1000)
+        if due <= self.fed:
+            return
+        steps = self.rng.normal(0, 1, due - self.fed)
+        values = np.clip(self.level + np.cumsum(steps), 0, 100)
+        self.level = float(values[-1])
+        self.fed = due
+        self.bridge.send_array("appendPoints", values, key="series")
 
     def push_random_data(self):
-        # Compose a small dataset update: append a point (x label, y value)
-        label = f"{len(getattr(self, '_labels', [])) + 1}"
-        value = random.randint(0, 100)
-
-        # Keep some client-side state for labels count (for demonstration)
-        if not hasattr(self, "_labels"):
-            self._labels = []
-        self._labels.append(label)
-
-        data = {
-            "action": "appendPoint",
-            "label": label,
-            "value": value
-        }
-        js = f"window.handlePythonMessage({json.dumps(data)});"
-        self.view.page().runJavaScript(js)
+        # A burst of random points, coalesced with the live feed into the next batch
+        self.bridge.send_array("appendPoints", self.rng.integers(0, 101, 100), key="series")
 
     def clear_chart(self):
-        data = {"action": "clear"}
-        self.view.page().runJavaScript(f"window.handlePythonMessage({json.dumps(data)});")
-        self._labels = []
+        self.bridge.send("clear")
 
     @staticmethod
-    def _html() -> str:
-        # Chart.js v4 CDN used; qwebchannel.js is loaded from qt resource
-        # The page exposes window.handlePythonMessage(data) to accept Python pushes
-        return """
-
-        """
+    def _html(bridge_script: str) -> str:
+        # Plain canvas line chart; the page exposes qtBridge handlers for Python pushes
+        return """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+  html, body { margin: 0; height: 100%; background: #1e1e1e; color: #ddd; font: 12px sans-serif; }
+  canvas { display: block; width: 100%; height: calc(100% - 24px); }
+  #status { height: 24px; line-height: 24px; padding: 0 8px; }
+</style>
+</head>
+<body>
+<div id="status">Waiting for data</div>
+<canvas id="chart"></canvas>
+<script>/*BRIDGE*/</script>
+<script>
+  "use strict";
+  var HISTORY = %HISTORY%;
+  var values = new Float32Array(HISTORY), count = 0, head = 0, total = 0;
+  var canvas = document.getElementById("chart"), ctx = canvas.getContext("2d");
+  var statusLine = document.getElementById("status");   // not `status`: that is window.status, a string
+
+  qtBridge.on("appendPoints", function (msg) {
+    var v = msg.values;
+    for (var i = Math.max(0, v.length - HISTORY); i < v.length; i++) {
+      values[head] = v[i];
+      head = (head + 1) % HISTORY;
+    }
+    count = Math.min(HISTORY, count + v.length);
+    total += v.length;
+  });
+  qtBridge.on("clear", function () { count = head = total = 0; });
+
+  qtBridge.onFrame(function () {
+    var w = canvas.clientWidth, h = canvas.clientHeight;
+    if (canvas.width !== w || canvas.height !== h) { canvas.width = w; canvas.height = h; }
+    ctx.clearRect(0, 0, w, h);
+    ctx.strokeStyle = "#4fc3f7";
+    ctx.lineWidth = 1;
+    ctx.beginPath();
+    var start = (head - count + HISTORY) % HISTORY;
+    for (var i = 0; i < count; i++) {
+      var x = i * w / HISTORY, y = h - values[(start + i) % HISTORY] * h / 100;
+      if (i) ctx.lineTo(x, y); else ctx.moveTo(x, y);
+    }
+    ctx.stroke();
+    statusLine.textContent = total + " points received";
+  });
+
+  canvas.addEventListener("click", function (event) {
+    var i = Math.floor(event.offsetX * HISTORY / canvas.clientWidth);
+    if (i < count) {
+      var value = values[(head - count + i + HISTORY) % HISTORY];
+      qtBridge.send({action: "pointClicked", index: i, value: value});
+    }
+  });
+</script>
+</body>
+</html>
+""".replace("/*BRIDGE*/", bridge_script).replace("%HISTORY%", str(HISTORY))
 
 # ----------
 # Run app
@@ -1,81 +1,58 @@
 from PyQt6.QtWidgets import QWidget, QApplication
-from PyQt6.QtGui import QPainter, QColor, QFont, QBrush, QLinearGradient
-from PyQt6.QtCore import Qt, QTimer, QPointF
+from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer
 import sys
-import random
-import math
+from pathlib import Path
+
+if __name__ == "__main__":   # run on its own: the studio has libs on the path when it hosts this file
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from libs.Particleengine import ParticleEngine
+from libs.Rendercache import BackgroundCache, vertical_gradient
+from libs.Damagetracker import DamageTracker
+
+TICK_MS = 16  # ~60 FPS
+
 
 class DynamicPaintWidget(QWidget):
-    def __init__(self):
+    def __init__(self, count: int = 100, sizes: tuple[float, float] = (15, 50)):
         super().__init__()
         self.setMinimumSize(800, 600)
         self.setWindowTitle("HD Dynamic Paint")
         self.showMaximized()  # start maximized
 
-        self.shapes = []
-        self.angle = 0
+        # aqua tones with alpha; positions, velocities, sizes and colours live in NumPy arrays
+        self.engine = ParticleEngine([QColor(0, green, 255, 180) for green in range(180, 256, 10)])
+        self.spawn(count, sizes)
+        # Background gradient (water-like), rendered once per size
+        self.background = BackgroundCache(vertical_gradient(QColor(0, 60, 100), QColor(0, 120, 180)))
+        # Repaint only the tiles the shapes left and entered (everything when they cover most of it)
+        self.damage = DamageTracker(self)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)  # the background covers it; parents need not paint
+
+        self.clock = QElapsedTimer()
+        self.clock.start()
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_animation)
-        self.timer.start(16)  # ~60 FPS
+        self.timer.start(TICK_MS)
 
-        # generate random shapes
-        for _ in range(100):  # more shapes for density
-            self.shapes.append({
-                'x': random.uniform(0, self.width()),
-                'y': random.uniform(0, self.height()),
-                'size': random.uniform(15, 50),
-                'color': QColor(0, random.randint(180,255), 255, 180),  # aqua tone with alpha
-                'speed': random.uniform(0.5, 3.0),
-                'dir': random.uniform(0, 360)
-            })
+    def spawn(self, count: int, sizes: tuple[float, float] = (15, 50)):
+        # 0.5-3 px per tick, as pixels per second
+        speeds = (0.5 * 1000 / TICK_MS, 3.0 * 1000 / TICK_MS)
+        self.engine.spawn(count, self.width(), self.height(), sizes=sizes, speeds=speeds)
 
     def update_animation(self):
-        self.angle += 1.5  # smooth rotation
-        for s in self.shapes:
-            rad = math.radians(s['dir'])
-            s['x'] += math.cos(rad) * s['speed']
-            s['y'] += math.sin(rad) * s['speed']
-
-            # bounce with smooth direction adjustment
-            if s['x'] < 0: 
-                s['x'] = 0
-                s['dir'] = 180 - s['dir']
-            elif s['x'] > self.width(): 
-                s['x'] = self.width()
-                s['dir'] = 180 - s['dir']
-
-            if s['y'] < 0: 
-                s['y'] = 0
-                s['dir'] = -s['dir']
-            elif s['y'] > self.height(): 
-                s['y'] = self.height()
-                s['dir'] = -s['dir']
-
-        self.update()
+        dt = min(self.clock.restart() / 1000, 0.1)  # a stalled frame must not teleport everything
+        self.engine.step(dt, self.width(), self.height())
+        self.damage.track("shapes", *self.engine.bounds())
+        self.damage.flush()
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Background gradient (water-like)
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(0, 60, 100))
-        gradient.setColorAt(1, QColor(0, 120, 180))
-        painter.fillRect(self.rect(), QBrush(gradient))
-
-        # Draw shapes
-        for s in self.shapes:
-            painter.setBrush(s['color'])
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QPointF(s['x'], s['y']), s['size']/2, s['size']/2)
+        self.background.paint(painter, self)
 
-        # Rotating text in center
-        painter.setPen(QColor(255, 255, 255, 200))
-        painter.setFont(QFont("Arial", 20, QFont.Weight.Bold))
-        painter.save()
-        painter.translate(self.width()/2, self.height()/2)
-        painter.rotate(self.angle)
-        painter.restore()
+        # Shapes: antialiased sprites, one batched call per colour and size
+        self.engine.paint(painter)
 
 
 if __name__ == "__main__":
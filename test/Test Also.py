@@ -5,9 +5,15 @@ from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer
 from PyQt6.QtCharts import QChart, QChartView, QLineSeries
 from PyQt6.QtGui import QPainter
+import numpy as np
+
+from libs.Streamchart import StreamSeries
+
+FEED_HZ = 1000      # simulated sensor rate
+WINDOW_S = 10.0     # seconds shown
 
 
 # =======================
@@ -29,13 +35,19 @@ class RendererWidget(QWidget):
 
         # --- chart ---
         self.series = QLineSeries()
-        self.series.append(0, 0)
+
+        pen = self.series.pen()
+        pen.setWidthF(1)  # dense live data: a thin line reads better and antialiases cheaper
+        self.series.setPen(pen)
 
         self.chart = QChart()
         self.chart.addSeries(self.series)
         self.chart.createDefaultAxes()
         self.chart.setTitle("Live Data (Renderer Test)")
 
+        # Fixed-size ring, decimated to the plot width, flushed once per frame
+        self.stream = StreamSeries(self.series, window=WINDOW_S, capacity=int(FEED_HZ * WINDOW_S * 2))
+
         self.chart_view = QChartView(self.chart)
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -56,7 +68,27 @@ class RendererWidget(QWidget):
         layout.addLayout(control_layout)
         layout.addWidget(self.chart_view)
 
-        self.x = 0
+        self.x = 0  # samples fed so far
+
+        # --- live feed ---
+        self.clock = QElapsedTimer()
+        self.clock.start()
+        self.rng = np.random.default_rng()
+        self.feed_timer = QTimer(self)
+        self.feed_timer.timeout.connect(self.feed)
+        self.feed_timer.start(16)
+
+    def feed(self):
+        """Append the samples a FEED_HZ source produced since the last tick."""
+        due = int(self.clock.elapsed() * FEED_HZ / 1000)
+        if due <= self.x:
+            return
+        t = np.arange(self.x, due) / FEED_HZ
+        values = np.sin(2 * np.pi * 0.5 * t) + 0.3 * np.sin(2 * np.pi * 7 * t) + self.rng.normal(0, 0.05, t.size)
+        self.stream.extend(t, values)
+        if due // (FEED_HZ // 2) != self.x // (FEED_HZ // 2):  # twice a second
+            self.status_label.setText(f"Streaming {FEED_HZ} Hz: {due} samples, {self.stream.plotted} points plotted")
+        self.x = due
 
     # Assuming you have a renderer widget
     def update_renderer(self, module):
@@ -1,13 +1,29 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QColor, QLinearGradient, QBrush
-from PyQt6.QtCore import Qt, QTimer, QPointF
+from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtCore import Qt, QTimer
+import numpy as np
+
+from libs.Rendercache import BackgroundCache, RingSprites, blit_batch, vertical_gradient
+from libs.Damagetracker import DamageTracker
+
+MAX_RADIUS = 150
+SPEED = 4
+
 
 class AquaRippleWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowFlag(Qt.WindowType.WindowCloseButtonHint, True)
         self.setMinimumSize(600, 600)
-        self.ripples = []  # list of dicts: x, y, radius, max_radius, speed
+        # Active ripples as arrays: centres (2, n) and radii
+        self.centres = np.empty((2, 0))
+        self.radii = np.empty(0)
+
+        # Water-like gradient background, dark aqua top to lighter aqua bottom
+        self.background = BackgroundCache(vertical_gradient(QColor(0, 100, 180), QColor(0, 200, 255)))
+        self.rings = RingSprites(QColor(0, 255, 255))  # aqua color
+        self.damage = DamageTracker(self)  # repaint around the ripples only
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)  # the background covers it; parents need not paint
 
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_ripples)
@@ -15,37 +31,26 @@ class AquaRippleWidget(QWidget):
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self.ripples.append({
-                'x': event.position().x(),
-                'y': event.position().y(),
-                'radius': 0,
-                'max_radius': 150,
-                'speed': 4
-            })
+            point = event.position()
+            self.centres = np.append(self.centres, [[point.x()], [point.y()]], axis=1)
+            self.radii = np.append(self.radii, 0.0)
 
     def update_ripples(self):
-        new_ripples = []
-        for r in self.ripples:
-            r['radius'] += r['speed']
-            if r['radius'] <= r['max_radius']:
-                new_ripples.append(r)
-        self.ripples = new_ripples
-        self.update()
+        if not len(self.radii):
+            return  # nothing moves; the last frame is still right
+        self.radii += SPEED
+        alive = self.radii <= MAX_RADIUS
+        if not alive.all():
+            self.centres, self.radii = self.centres[:, alive], self.radii[alive]
+        reach = self.radii + 2  # pen and antialiasing
+        x, y = self.centres
+        self.damage.track("ripples", x - reach, y - reach, x + reach, y + reach)
+        self.damage.flush()
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Water-like gradient background
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(0, 100, 180))   # dark aqua top
-        gradient.setColorAt(1, QColor(0, 200, 255))   # lighter aqua bottom
-        painter.fillRect(self.rect(), QBrush(gradient))
-
-        # Draw ripples
-        for r in self.ripples:
-            alpha = max(0, 180 - int((r['radius']/r['max_radius'])*180))  # fade out
-            color = QColor(0, 255, 255, alpha)  # aqua color
-            painter.setPen(color)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawEllipse(QPointF(r['x'], r['y']), r['radius'], r['radius'])
+        self.background.paint(painter, self)
+
+        # Draw ripples, fading out as they grow
+        alphas = np.maximum(0, 180 - (self.radii / MAX_RADIUS * 180).astype(int))
+        blit_batch(painter, self.rings, self.rings.keys(self.radii, alphas), self.centres[0], self.centres[1])
@@ -0,0 +1,44 @@
+"""
+The bundled samples as loadable sources, for the benchmarks.
+
+`stage_sample()` copies a sample into a scratch folder with a generated
+manifest, so benchmarks can load, edit and reload it without touching
+test/. (test/RandomBals.ini points at main.py, which has no
+DynamicPaintWidget; the generated manifest points at RandomBals.py.)
+"""
+import shutil
+from pathlib import Path
+
+TEST_DIR = Path(__file__).resolve().parents[1]
+
+# name: (file or folder under test/, module, entry point)
+SAMPLES = {
+    "ListSample": ("ListSample.py", "ListSample", "ListDoubleClickApp"),
+    "RandomBals": ("RandomBals.py", "RandomBals", "DynamicPaintWidget"),
+    "WaterFlow": ("WaterFlow.py", "WaterFlow", "AquaRippleWidget"),
+    "DinamicUITest": ("DinamicUITest.py", "DinamicUITest", "DynamicTestUI"),
+    "TestAlso": ("Test Also.py", "TestAlso", "RendererWidget"),
+    "Configmaker": ("configMaker", "Configmaker", "ConfigMaker"),
+}
+
+MANIFEST = """[source]
+module = {module}
+entry_point = {entry_point}
+description = {name} (benchmark copy)
+"""
+
+
+def stage_sample(name: str, folder: Path) -> Path:
+    """Copy sample `name` into `folder` (created) and return its manifest."""
+    source, module, entry_point = SAMPLES[name]
+    folder.mkdir(parents=True, exist_ok=True)
+    origin = TEST_DIR / source
+    if origin.is_dir():
+        for path in origin.glob("*"):
+            if path.is_file() and path.suffix != ".ini":
+                shutil.copy(path, folder / path.name)
+    else:
+        shutil.copy(origin, folder / f"{module}.py")
+    manifest = folder / f"{module}.ini"
+    manifest.write_text(MANIFEST.format(name=name, module=module, entry_point=entry_point), encoding="utf-8")
+    return manifest
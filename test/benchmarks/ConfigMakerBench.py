@@ -0,0 +1,173 @@
+"""
+ConfigMaker bulk benchmark: manifests for a generated tree of --files
+tool modules, written by `bulk_generate()` (test/configMaker/Configmaker.py)
+in a process pool, cold and again with nothing changed.
+
+Every tool module derives its widget from a shared base module through
+a mix of relative imports, package re-exports, aliases and
+`module.Class` attributes, and also defines decoys: a plain class, a
+widget helper that the entry point builds, and a base that the entry
+point derives from. The bench checks that the written entry point is
+the expected class in every file, and times the old approach for
+comparison: every `ClassDef` from `ast.walk()`, one file at a time.
+
+    python test/benchmarks/ConfigMakerBench.py
+    python test/benchmarks/ConfigMakerBench.py --files 5000 --jobs 1 4 8 --json configmaker.json
+"""
+import os
+import sys
+import ast
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import configparser
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "test" / "configMaker"))
+
+from Configmaker import bulk_generate, find_sources
+
+BASES = '''from PyQt6 import QtWidgets
+from PyQt6.QtWidgets import QMainWindow as Window
+
+Panel = QtWidgets.QFrame
+
+
+class ToolBase(Window):
+    pass
+
+
+class Plain:
+    pass
+'''
+
+PACKAGE_INIT = "from .bases import ToolBase, Panel\n"
+
+# {n}, {import_line}, {base}: four ways of reaching the shared base
+IMPORTS = [
+    ("from ..shared import ToolBase", "ToolBase"),
+    ("from shared.bases import ToolBase as Base", "Base"),
+    ("from .. import shared", "shared.ToolBase"),
+    ("import shared.bases as sb", "sb.Panel"),
+]
+
+TOOL = '''import sys
+{import_line}
+from PyQt6.QtWidgets import QApplication, QLabel
+
+
+class Settings{n}:
+    def __init__(self):
+        self.values = {{}}
+
+
+class Badge{n}(QLabel):
+    pass
+
+
+class Common{n}({base}):
+    pass
+
+
+class Tool{n}(Common{n}):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.badge = Badge{n}("tool {n}")
+        self.settings = Settings{n}()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = Tool{n}()
+    window.show()
+    sys.exit(app.exec())
+'''
+
+
+def make_tree(folder: Path, files: int):
+    (folder / "shared").mkdir(parents=True)
+    (folder / "shared" / "__init__.py").write_text(PACKAGE_INIT, encoding="utf-8")
+    (folder / "shared" / "bases.py").write_text(BASES, encoding="utf-8")
+    per_folder = 200
+    for n in range(files):
+        package = folder / f"tools{n // per_folder}"
+        if not package.exists():
+            package.mkdir()
+            (package / "__init__.py").write_text("", encoding="utf-8")
+        import_line, base = IMPORTS[n % len(IMPORTS)]
+        (package / f"tool_{n}.py").write_text(TOOL.format(n=n, import_line=import_line, base=base),
+                                              encoding="utf-8")
+
+
+def legacy_scan(folder: Path) -> float:
+    """What ConfigMaker did per file: every ClassDef, nothing resolved (no popup, no write)."""
+    t0 = time.perf_counter()
+    for path in find_sources(folder):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+    return time.perf_counter() - t0
+
+
+def check(folder: Path, files: int) -> int:
+    """Files whose manifest names Tool{n}."""
+    right = 0
+    for n in range(files):
+        ini = folder / f"tools{n // 200}" / f"tool_{n}.ini"
+        if ini.exists():
+            parser = configparser.ConfigParser()
+            parser.read(ini, encoding="utf-8")
+            right += parser.get("source", "entry_point", fallback="") == f"Tool{n}"
+    return right
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=sorted({1, os.cpu_count() or 1}))
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+
+    base = Path(tempfile.mkdtemp(prefix="configmaker_bench_"))
+    results = {"files": args.files, "runs": {}}
+    try:
+        template = base / "template"
+        make_tree(template, args.files)
+        results["legacy_s"] = round(legacy_scan(template), 3)
+        print(f"{args.files} tool modules; ast.walk class listing (before): {results['legacy_s']:.2f} s, "
+              f"entry points still to pick by hand")
+        print(f"  {'jobs':>4}{'cold s':>9}{'files/s':>9}{'warm s':>9}{'written':>9}{'correct':>9}")
+        for jobs in args.jobs:
+            tree = base / f"run{jobs}"
+            shutil.copytree(template, tree)
+            t0 = time.perf_counter()
+            cold = bulk_generate(tree, jobs)
+            cold_s = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            warm = bulk_generate(tree, jobs)
+            warm_s = time.perf_counter() - t0
+            written = sum(r.action == "written" for r in cold)
+            correct = check(tree, args.files)
+            rescanned = sum(r.action != "unchanged" for r in warm)
+            results["runs"][jobs] = {"cold_s": round(cold_s, 3), "warm_s": round(warm_s, 3), "written": written,
+                                     "correct": correct, "warm_rescanned": rescanned}
+            print(f"  {jobs:>4}{cold_s:>9.2f}{args.files / cold_s:>9.0f}{warm_s:>9.2f}{written:>9}{correct:>9}")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    correct = all(r["correct"] == args.files for r in results["runs"].values())
+    cached = all(r["warm_rescanned"] == 0 for r in results["runs"].values())
+    print(f"\nEntry points {'all correct' if correct else 'WRONG in some files'}; second run "
+          f"{'skipped every file' if cached else 'rescanned files that did not change'}")
+    ok = correct and cached
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Entry point check benchmark: how long validation takes to reject a
+manifest whose entry point is misspelt, with the static check before the
+import (libs/Widgetscan.py) and without it, where only `hasattr()` after
+importing the module notices. Each bundled sample is validated in a
+fresh process, so the import is as cold as on the studio's first load;
+the correct manifest is timed as well, for the cost of the check on
+sources that pass.
+
+    python test/benchmarks/EntryCheckBench.py
+    python test/benchmarks/EntryCheckBench.py --samples TestAlso --repeat 5 --json entry_check.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from BenchSamples import SAMPLES, stage_sample
+
+
+def child(mode: str, manifest: str) -> dict:
+    """Validate one manifest the way the studio does (`mode` before: no static entry point check)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication([sys.argv[0]])   # sources may build widgets at import time
+    from libs import Sourcevalidator
+    if mode == "before":
+        Sourcevalidator.stage_entry_point_static = lambda module_path, entry_point: None
+    from libs import Batchvalidator
+    Batchvalidator.stage_entry_point_static = Sourcevalidator.stage_entry_point_static
+    t0 = time.perf_counter()
+    result = Batchvalidator.validate_source(manifest)
+    elapsed = time.perf_counter() - t0
+    del app
+    return {"ok": result.ok, "failed_stage": result.failed_stage, "ms": elapsed * 1000,
+            "stages": {s.stage: s.seconds * 1000 for s in result.stages}}
+
+
+def run(mode: str, manifest: Path) -> dict:
+    output = subprocess.run([sys.executable, __file__, "--child", mode, str(manifest)], cwd=ROOT,
+                            capture_output=True, text=True)
+    lines = [line for line in output.stdout.splitlines() if line.startswith("{")]
+    if not lines:
+        print(f"[EntryCheckBench] {manifest.name} ({mode}) failed:\n{output.stderr[-2000:]}")
+        return {}
+    return json.loads(lines[-1])
+
+
+def median(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2] if ordered else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", nargs="+", choices=sorted(SAMPLES), default=sorted(SAMPLES))
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per case")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="For rejecting a misspelt entry point")
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "MANIFEST"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(child(*args.child)))
+        return 0
+
+    results = {}
+    print(f"{'sample':<15}{'typo before':>13}{'typo after':>12}{'stage':>14}{'valid after':>13}{'check ms':>10}")
+    with tempfile.TemporaryDirectory(prefix="entry_check_") as scratch:
+        for name in args.samples:
+            manifest = stage_sample(name, Path(scratch) / name)
+            # Same source under its own module name, entry point misspelt in the .ini
+            entry_point = SAMPLES[name][2]
+            typo = manifest.with_name(f"{manifest.stem}_typo.ini")
+            typo.with_suffix(".py").write_bytes(manifest.with_suffix(".py").read_bytes())
+            typo.write_text(manifest.read_text(encoding="utf-8")
+                            .replace(f"module = {manifest.stem}", f"module = {typo.stem}")
+                            .replace(f"entry_point = {entry_point}", f"entry_point = {entry_point}s"),
+                            encoding="utf-8")
+            cases = {"typo_before": ("before", typo), "typo_after": ("after", typo), "valid_after": ("after", manifest)}
+            runs = {key: [run(mode, path) for _ in range(args.repeat)] for key, (mode, path) in cases.items()}
+            if not all(all(r) for r in runs.values()):
+                return 1
+            result = {key: round(median([r["ms"] for r in value]), 1) for key, value in runs.items()}
+            result["typo_stage"] = runs["typo_after"][0]["failed_stage"]
+            result["check_ms"] = round(median([r["stages"].get("entry_static", 0.0) for r in runs["valid_after"]]), 2)
+            result["valid_ok"] = runs["valid_after"][0]["ok"]
+            results[name] = result
+            print(f"{name:<15}{result['typo_before']:>13.1f}{result['typo_after']:>12.1f}{result['typo_stage']:>14}"
+                  f"{result['valid_after']:>13.1f}{result['check_ms']:>10.2f}"
+                  f"{'' if result['valid_ok'] else '  (valid manifest failed)'}")
+
+    ok = all(r["typo_stage"] == "entry_static" and r["typo_after"] <= args.budget_ms for r in results.values())
+    print(f"\nMisspelt entry points rejected before import within {args.budget_ms} ms: {'OK' if ok else 'FAIL'}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Shared-memory frame transport benchmark.
+
+Starts SOURCE in a child process with the shm transport (ProcessHost),
+shows its FrameView at --size for --seconds and reports how many frames
+reached the host per second, the child's render time, the handoff
+(acquire + drawImage into the view) and the publish -> drawn latency.
+Fails (exit code 1) below --min-fps or above --max-handoff-ms at p95.
+
+Without SOURCE the RandomBals sample (`DynamicPaintWidget`) is used.
+
+    python test/benchmarks/FrameTransportBench.py
+    python test/benchmarks/FrameTransportBench.py test/ListSample.ini --size 1280x720
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from libs.Processhost import ProcessHost
+from libs.Sourcemanifest import SourceManifest
+from BenchSamples import stage_sample
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", type=Path, nargs="?", help="Source .ini (default: the RandomBals sample)")
+    parser.add_argument("--size", default="1920x1080")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--min-fps", type=float, default=55.0)
+    parser.add_argument("--max-handoff-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.size.lower().split("x"))
+
+    app = QApplication(sys.argv)
+    scratch = Path(tempfile.mkdtemp(prefix="qtforge-frames-"))
+    path = args.source.resolve() if args.source else stage_sample("RandomBals", scratch)
+
+    host = ProcessHost(transport="shm")
+    views = []
+    errors = []
+    host.ready.connect(lambda view, info: views.append(view))
+    host.failed.connect(errors.append)
+    host.crashed.connect(errors.append)
+    host.output.connect(lambda line: print(f"[Source] {line}"))
+    host.start(SourceManifest.load(path))
+
+    deadline = time.perf_counter() + 30
+    while not views and not errors and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    if not views:
+        print("Source did not start: " + ("; ".join(errors) or "timed out"))
+        host.stop()
+        return 1
+
+    view = views[0]
+    view.resize(width, height)
+    view.show()
+    # Let the child pick up the size before measuring
+    settle = time.perf_counter() + 1.0
+    while time.perf_counter() < settle:
+        app.processEvents()
+        time.sleep(0.001)
+
+    view.handoff_ns.clear()
+    view.latency_ns.clear()
+    view.render_ns.clear()
+    handoff, latency, render = [], [], []
+    first_seq = host.frames.sequence
+    start = time.perf_counter()
+    while time.perf_counter() - start < args.seconds:
+        app.processEvents()
+        handoff.extend(view.handoff_ns)
+        latency.extend(view.latency_ns)
+        render.extend(view.render_ns)
+        view.handoff_ns.clear()
+        view.latency_ns.clear()
+        view.render_ns.clear()
+        time.sleep(0.0005)
+    elapsed = time.perf_counter() - start
+    published = (host.frames.sequence - first_seq) // 2
+    frame_size = host.frames.capacity
+
+    host.stop()
+    shutil.rmtree(scratch, ignore_errors=True)
+
+    def ms(values, p):
+        return percentile(values, p) / 1e6
+
+    fps_published = published / elapsed
+    fps_drawn = len(handoff) / elapsed
+    print(f"{path.name} at {width}x{height} ({frame_size / 1024 / 1024:.1f} MB per buffer), {elapsed:.1f} s")
+    print(f"{'':<22}{'p50':>10}{'p95':>10}")
+    print(f"{'child render (ms)':<22}{ms(render, 0.5):>10.2f}{ms(render, 0.95):>10.2f}")
+    print(f"{'handoff (ms)':<22}{ms(handoff, 0.5):>10.3f}{ms(handoff, 0.95):>10.3f}")
+    print(f"{'publish->drawn (ms)':<22}{ms(latency, 0.5):>10.2f}{ms(latency, 0.95):>10.2f}")
+    print(f"Frames: {fps_published:.1f}/s published, {fps_drawn:.1f}/s drawn")
+    if (os.cpu_count() or 1) < 2:
+        print("Note: one CPU, so the child's rendering preempts the host's handoff")
+
+    failures = []
+    if fps_drawn < args.min_fps:
+        failures.append(f"{fps_drawn:.1f} FPS drawn < {args.min_fps}")
+    if ms(handoff, 0.95) > args.max_handoff_ms:
+        failures.append(f"handoff p95 {ms(handoff, 0.95):.3f} ms > {args.max_handoff_ms} ms")
+    if failures:
+        print("\nFAILED: " + "; ".join(failures))
+        return 1
+    print("\nWithin budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+Edit-to-pixels benchmark for auto-reload.
+
+Hosts a copy of a sample in the real MainWindow (offscreen) with
+auto-reload on, then saves edits to its module and times the real chain
+QFileSystemWatcher -> on_file_changed -> debounced_reload ->
+perform_auto_reload -> SourceValidator -> instantiate_widget up to the
+first paint of the new SafeWidgetWrapper. Save modes:
+
+    write     rewrite the file in place
+    atomic    write a temporary file and os.replace() it over the module
+              (what most editors do)
+    burst     --burst in-place saves --burst-gap-ms apart; timed from the last
+
+Latency is measured from the (last) save; the event loop runs between
+burst saves, as it would while an editor writes. Also reported: where
+the time went (detect, debounce, delay, validate, instantiate, paint),
+how many changes the watcher saw and how many reloads each save caused
+(1 is right). A save the watcher never reported counts as a failure.
+
+    python test/benchmarks/HotReloadBench.py --sample ListSample --iterations 10 --json hot_reload.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QObject, QEvent
+from PyQt6.QtWidgets import QApplication
+
+from BenchSamples import SAMPLES, stage_sample
+
+MODES = ("write", "atomic", "burst")
+STAGES = ("detect", "debounce", "delay", "validate", "instantiate", "paint", "total")
+
+
+def load_studio():
+    spec = importlib.util.spec_from_file_location("qtforge_studio", ROOT / "QtForge _Studio.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def wait_until(app: QApplication, condition, timeout: float = 30.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.001)
+    return True
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+class ReloadProbe(QObject):
+    """Stamps each step of the reload chain and the first paint of a newly hosted widget."""
+
+    def __init__(self, win):
+        super().__init__()
+        self.win = win
+        self.stamps: dict[str, float] = {}
+        self.reloads = 0
+        self.changes = 0
+        self.previous = None
+
+        on_file_changed = win.on_file_changed
+        perform_auto_reload = win.perform_auto_reload
+        instantiate_widget = win.instantiate_widget
+
+        def stamped_file_changed(path):
+            if "debounce" not in self.stamps:
+                self.stamps["detect"] = time.perf_counter()   # the last change before the debounce fires
+            on_file_changed(path)
+
+        def stamped_reload():
+            self.reloads += 1
+            self.stamps.setdefault("delay", time.perf_counter())
+            perform_auto_reload()
+
+        def stamped_instantiate(module):
+            self.stamps.setdefault("validate", time.perf_counter())
+            instantiate_widget(module)
+            self.stamps.setdefault("instantiate", time.perf_counter())
+
+        # Instance attributes: the window looks these up when it connects or schedules them
+        win.on_file_changed = stamped_file_changed
+        win.perform_auto_reload = stamped_reload
+        win.instantiate_widget = stamped_instantiate
+        win.reload_timer.timeout.connect(lambda: self.stamps.setdefault("debounce", time.perf_counter()))
+        QApplication.instance().installEventFilter(self)
+
+    def arm(self):
+        self.stamps.clear()
+        self.reloads = 0
+        self.changes = 0
+        self.previous = self.win.hosted_widget
+        # Counted on the watcher itself: the window may hold several connections to its handler,
+        # and disabling the watch disconnects them all
+        try:
+            self.win.file_watcher.fileChanged.disconnect(self.count_change)
+        except TypeError:
+            pass
+        self.win.file_watcher.fileChanged.connect(self.count_change)
+
+    def count_change(self, path: str):
+        self.changes += 1
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and "paint" not in self.stamps:
+            hosted = self.win.hosted_widget
+            if hosted is not None and hosted is not self.previous and obj.isWidgetType() \
+                    and (obj is hosted or hosted.isAncestorOf(obj)):
+                self.stamps["paint"] = time.perf_counter()
+        return False
+
+
+def save(app: QApplication, path: Path, text: str, mode: str, burst: int, gap: float) -> float:
+    """Save `text` to `path`; returns the time of the (last) save."""
+    if mode == "atomic":
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+        return time.perf_counter()
+    for i in range(burst if mode == "burst" else 1):
+        if i:
+            wait_until(app, lambda: False, gap)   # the watcher gets to see each save
+        path.write_text(text + f"# burst {i}\n", encoding="utf-8")
+    return time.perf_counter()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sample", choices=sorted(SAMPLES), default="ListSample")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--iterations", type=int, default=10, help="Saves per mode")
+    parser.add_argument("--burst", type=int, default=5)
+    parser.add_argument("--burst-gap-ms", type=float, default=30.0)
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+
+    output = Path(args.json).resolve() if args.json else None
+    app = QApplication(sys.argv)
+    scratch = Path(tempfile.mkdtemp(prefix="qtforge-hotreload-"))
+    manifest = stage_sample(args.sample, scratch)
+    module_path = scratch / f"{SAMPLES[args.sample][1]}.py"
+    original = module_path.read_text(encoding="utf-8")
+
+    os.chdir(ROOT)  # the window loads src/styles.qss relative to the repo
+    studio = load_studio()
+    win = studio.MainWindow("off")
+    win.show()
+    probe = ReloadProbe(win)
+    win.load_source(manifest)
+    if not wait_until(app, lambda: win.hosted_widget is not None):
+        print("The sample was not hosted (see the error log)")
+        return 1
+    win.auto_reload_check.setChecked(True)
+
+    def watching() -> bool:
+        return (str(module_path) in win.file_watcher.files() and not win.is_reloading
+                and not win.reload_timer.isActive() and not win.validator_thread.isRunning())
+
+    results = {"sample": args.sample, "iterations": args.iterations, "modes": {}}
+    failures = 0
+    counter = 0
+    for mode in args.modes:
+        runs = []
+        for _ in range(args.iterations):
+            # The watcher is re-armed 1 s after each load; atomic saves need it re-added
+            if not wait_until(app, watching, 10):
+                print(f"{mode}: file watching was not re-enabled")
+                failures += 1
+                break
+            wait_until(app, lambda: False, 0.15)  # keep the next mtime clearly newer
+            counter += 1
+            probe.arm()
+            saved = save(app, module_path, original + f"\n# edit {counter}\n", mode, args.burst,
+                         args.burst_gap_ms / 1000)
+            if not wait_until(app, lambda: "paint" in probe.stamps, 15):
+                print(f"{mode}: no reload within 15 s of the save")
+                failures += 1
+                continue
+            wait_until(app, lambda: False, 0.2)  # catch duplicate reloads
+            s = probe.stamps
+            if "detect" not in s:
+                print(f"{mode}: reloaded without the watcher reporting the save")
+                failures += 1
+                continue
+            runs.append({
+                "detect": s["detect"] - saved,
+                "debounce": s["debounce"] - s["detect"],
+                "delay": s["delay"] - s["debounce"],
+                "validate": s["validate"] - s["delay"],
+                "instantiate": s["instantiate"] - s["validate"],
+                "paint": s["paint"] - s["instantiate"],
+                "total": s["paint"] - saved,
+                "reloads": probe.reloads,
+                "changes": probe.changes,
+            })
+
+        summary = {stage: {"p50_ms": round(percentile([r[stage] for r in runs], 0.5) * 1000, 1),
+                           "p95_ms": round(percentile([r[stage] for r in runs], 0.95) * 1000, 1),
+                           "max_ms": round(max((r[stage] for r in runs), default=0.0) * 1000, 1)}
+                   for stage in STAGES}
+        summary["reloads_per_save"] = max((r["reloads"] for r in runs), default=0)
+        summary["changes_per_save"] = min((r["changes"] for r in runs), default=0)
+        summary["n"] = len(runs)
+        results["modes"][mode] = summary
+
+        print(f"\n{mode} ({len(runs)} saves, at least {summary['changes_per_save']} change(s) seen and "
+              f"up to {summary['reloads_per_save']} reload(s) per save)")
+        print(f"  {'stage':<13}{'p50':>9}{'p95':>9}{'max':>9}  ms")
+        for stage in STAGES:
+            row = summary[stage]
+            print(f"  {stage:<13}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['max_ms']:>9.1f}")
+        if summary["reloads_per_save"] > 1:
+            failures += 1
+
+    win.close()
+    shutil.rmtree(scratch, ignore_errors=True)
+    if output:
+        output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nSaved {output}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Image canvas benchmark: frames pushed through libs/Imagecanvas.py at
+--size (3840x2160 by default), offscreen, against a heatmap painted cell
+by cell with `QPainter.fillRect()` the way hosted tools do it now.
+
+Each case times --frames frames of writing the pixels and painting the
+widget (`update()` then one event-loop pass):
+
+    in place    the tool writes `canvas.array` itself (one pass, no copy)
+    rgb32       a pre-rendered uint32 frame copied in with set_frame()
+    uint8       8-bit values through the colormap
+    float32     float values scaled, clipped and colormapped
+    region      one --region square per frame with set_region()
+
+The per-cell painter is timed on a --legacy-size grid (it takes seconds
+per 4K frame) and its cost per pixel projected to --size.
+
+    python test/benchmarks/ImageCanvasBench.py
+    python test/benchmarks/ImageCanvasBench.py --size 1920 1080 --frames 30 --json canvas.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from libs.Imagecanvas import ImageCanvas, Colormap
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+class CellHeatmap(QWidget):
+    """A heatmap as hosted tools paint it: one fillRect() per cell."""
+
+    def __init__(self, values: np.ndarray, colormap: Colormap):
+        super().__init__()
+        self.values = values
+        self.colormap = colormap
+        self.resize(values.shape[1], values.shape[0])
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        lut = self.colormap.lut
+        for y, row in enumerate(self.values):
+            for x, value in enumerate(row):
+                painter.fillRect(x, y, 1, 1, QColor(int(lut[min(255, max(0, int(value * 256)))])))
+        painter.end()
+
+
+def timed(app: QApplication, frames: int, step) -> dict:
+    step(0)   # warm-up: first paint, scratch allocation
+    app.processEvents()
+    times = []
+    for i in range(frames):
+        t0 = time.perf_counter()
+        step(i + 1)
+        app.processEvents()
+        times.append(time.perf_counter() - t0)
+    return {"p50_ms": round(percentile(times, 0.5) * 1000, 2), "p95_ms": round(percentile(times, 0.95) * 1000, 2)}
+
+
+def canvas_runs(app: QApplication, args) -> dict:
+    width, height = args.size
+    rng = np.random.default_rng(0)
+    floats = [rng.random((height, width), dtype=np.float32) for _ in range(2)]
+    bytes_ = [rng.integers(0, 256, (height, width), dtype=np.uint8) for _ in range(2)]
+    canvas = ImageCanvas(width, height, colormap="heat")
+    pixels = [canvas.colormap.apply(v) for v in floats]
+    patch = rng.random((args.region, args.region), dtype=np.float32)
+    canvas.resize(width, height)
+    canvas.show()
+    app.processEvents()
+
+    def in_place(i):
+        # Stands in for a tool rendering straight into the canvas: one pass over every pixel
+        np.bitwise_xor(canvas.array, 0x00FFFFFF, out=canvas.array)
+        canvas.mark_dirty(0, 0, width, height)
+
+    def region(i):
+        x = (i * 97) % (width - args.region)
+        y = (i * 61) % (height - args.region)
+        canvas.set_region(x, y, patch)
+
+    cases = {
+        "in place": in_place,
+        "rgb32": lambda i: canvas.set_frame(pixels[i % 2]),
+        "uint8": lambda i: canvas.set_frame(bytes_[i % 2]),
+        "float32": lambda i: canvas.set_frame(floats[i % 2]),
+        "region": region,
+    }
+    results = {}
+    for name, step in cases.items():
+        results[name] = timed(app, args.frames, step)
+        print(f"  {name:<10}{results[name]['p50_ms']:>9.2f}{results[name]['p95_ms']:>9.2f}")
+    canvas.close()
+    return results
+
+
+def legacy_run(app: QApplication, args) -> dict:
+    width, height = args.legacy_size
+    values = np.random.default_rng(0).random((height, width), dtype=np.float32)
+    widget = CellHeatmap(values, Colormap.named("heat"))
+    widget.show()
+    result = timed(app, args.legacy_frames, lambda i: widget.update())
+    widget.close()
+    per_pixel = result["p50_ms"] / (width * height)
+    result["projected_ms"] = round(per_pixel * args.size[0] * args.size[1], 1)
+    print(f"  {'per cell':<10}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}   at {width}x{height}, "
+          f"~{result['projected_ms']:.0f} ms at {args.size[0]}x{args.size[1]}")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, nargs=2, default=[3840, 2160], metavar=("W", "H"))
+    parser.add_argument("--frames", type=int, default=30, help="Timed frames per case")
+    parser.add_argument("--region", type=int, default=256, help="Side of the set_region() square")
+    parser.add_argument("--legacy-size", type=int, nargs=2, default=[320, 180], metavar=("W", "H"),
+                        help="Grid of the per-cell painter (0 0 to skip)")
+    parser.add_argument("--legacy-frames", type=int, default=3)
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    print(f"{args.size[0]}x{args.size[1]}, {args.frames} frames per case")
+    print(f"  {'case':<10}{'p50 ms':>9}{'p95 ms':>9}")
+    results = {"size": args.size, "canvas": canvas_runs(app, args)}
+    if all(args.legacy_size):
+        results["per_cell"] = legacy_run(app, args)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Lazy list benchmark: open and scroll time of libs/Lazylist.py over a
+memory-mapped row file, from ten thousand to ten million rows, against
+`QListWidget.addItems()` as ListSample.py used it.
+
+Open is the time from the row file (or the Python list, for the item
+widget) to the first painted frame: store, model, view, show. Scrolling
+is timed over --jumps jumps to random scroll bar positions and --steps
+three-row steps, each with its repaint. With the lazy list both must
+stay flat as the row count grows.
+
+    python test/benchmarks/LazyListBench.py
+    python test/benchmarks/LazyListBench.py --rows 1000000 10000000 --legacy-rows 0 --json lazy_list.json
+
+Row files are written once to the temp directory and reused.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QListWidget
+
+from libs.Lazylist import LazyListModel, LazyListView, MmapRows
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+def row_file(rows: int) -> Path:
+    path = Path(tempfile.gettempdir()) / f"qtforge_rows_{rows}.bin"
+    if not path.exists():
+        print(f"  writing {rows} rows to {path}")
+        MmapRows.write(path.with_suffix(".tmp"), (f"Item {i}" for i in range(rows)))
+        os.replace(path.with_suffix(".tmp"), path)
+    return path
+
+
+def scroll_times(app: QApplication, view, args) -> dict:
+    bar = view.verticalScrollBar()
+    rng = random.Random(1)
+    jumps, steps = [], []
+    for _ in range(args.jumps):
+        t0 = time.perf_counter()
+        bar.setValue(rng.randint(0, bar.maximum()))
+        app.processEvents()
+        jumps.append(time.perf_counter() - t0)
+    for _ in range(args.steps):
+        t0 = time.perf_counter()
+        bar.setValue(min(bar.maximum(), bar.value() + 3))
+        app.processEvents()
+        steps.append(time.perf_counter() - t0)
+    return {"jump_p50_ms": round(percentile(jumps, 0.5) * 1000, 2), "jump_p95_ms": round(percentile(jumps, 0.95) * 1000, 2),
+            "step_p50_ms": round(percentile(steps, 0.5) * 1000, 2), "step_p95_ms": round(percentile(steps, 0.95) * 1000, 2)}
+
+
+def lazy_run(app: QApplication, rows: int, args) -> dict:
+    path = row_file(rows)
+    t0 = time.perf_counter()
+    store = MmapRows(path)
+    view = LazyListView()
+    view.setModel(LazyListModel(store))
+    view.resize(300, 600)
+    view.show()
+    app.processEvents()
+    result = {"open_ms": round((time.perf_counter() - t0) * 1000, 2), **scroll_times(app, view, args)}
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+    return result
+
+
+def widget_run(app: QApplication, rows: int, args) -> dict:
+    items = [f"Item {i}" for i in range(rows)]
+    t0 = time.perf_counter()
+    widget = QListWidget()
+    widget.addItems(items)
+    widget.resize(300, 600)
+    widget.show()
+    app.processEvents()
+    result = {"open_ms": round((time.perf_counter() - t0) * 1000, 2), **scroll_times(app, widget, args)}
+    widget.close()
+    widget.deleteLater()
+    app.processEvents()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--legacy-rows", type=int, nargs="*", default=[10_000, 100_000, 1_000_000],
+                        help="Row counts for QListWidget.addItems() (0 or none to skip)")
+    parser.add_argument("--jumps", type=int, default=50)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--open-budget-ms", type=float, default=100.0, help="For the largest --rows")
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    results = {"lazy": {}, "widget": {}}
+    header = f"  {'rows':>10}{'open ms':>10}{'jump p50':>10}{'jump p95':>10}{'step p50':>10}{'step p95':>10}"
+
+    def report(rows: int, r: dict):
+        print(f"  {rows:>10}{r['open_ms']:>10.1f}{r['jump_p50_ms']:>10.2f}{r['jump_p95_ms']:>10.2f}"
+              f"{r['step_p50_ms']:>10.2f}{r['step_p95_ms']:>10.2f}")
+
+    print("LazyListView over MmapRows")
+    print(header)
+    for rows in args.rows:
+        results["lazy"][rows] = lazy_run(app, rows, args)
+        report(rows, results["lazy"][rows])
+    legacy = [rows for rows in args.legacy_rows if rows > 0]
+    if legacy:
+        print("QListWidget.addItems (before)")
+        print(header)
+        for rows in legacy:
+            results["widget"][rows] = widget_run(app, rows, args)
+            report(rows, results["widget"][rows])
+
+    largest = results["lazy"][max(args.rows)]
+    ok = largest["open_ms"] <= args.open_budget_ms
+    print(f"\n{max(args.rows)} rows open in {largest['open_ms']} ms (budget {args.open_budget_ms} ms) "
+          f"-> {'OK' if ok else 'FAIL'}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
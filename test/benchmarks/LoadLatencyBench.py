@@ -0,0 +1,211 @@
+"""
+End-to-end load latency over the bundled samples.
+
+For every sample, a fresh offscreen studio process calls
+`MainWindow.load_source()` once (cold: nothing imported or cached yet)
+and then --warm more times, timing each stage up to the first paint of the
+hosted widget:
+
+    manifest      load_source() -> validator started (manifest, recent DB)
+    validate      SourceValidator thread: config ... import, entry point
+    dispatch      validation_complete queued back to the GUI thread
+    instantiate   instantiate_widget(): entry point, wrapper, renderer
+    first_paint   hosted -> first Paint event of the hosted widget
+    total         load_source() -> first paint
+
+Each sample is run in --repeat processes; cold and warm p50/p95 per stage
+are printed and, with --json, saved so runs can be compared across commits
+(--compare OLD.json prints the change in total p50).
+
+    python test/benchmarks/LoadLatencyBench.py --repeat 5 --json load_latency.json
+    python test/benchmarks/LoadLatencyBench.py --compare load_latency.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+from BenchSamples import SAMPLES, stage_sample
+
+PREFIX = "QTFORGE_LOADLAT "
+STAGES = ("manifest", "validate", "dispatch", "instantiate", "first_paint", "total")
+
+
+# ----------------- Worker (one studio process) -----------------
+def worker(manifest: Path, loads: int) -> int:
+    import importlib.util
+    from PyQt6.QtCore import QObject, QEvent, QCoreApplication, Qt
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+    os.chdir(ROOT)  # the window loads src/styles.qss relative to the repo
+    spec = importlib.util.spec_from_file_location("qtforge_studio", ROOT / "QtForge _Studio.py")
+    studio = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(studio)
+    win = studio.MainWindow("off")
+    win.show()
+    app.processEvents()
+
+    stamps: dict[str, float] = {}
+
+    class PaintWatch(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and "painted" not in stamps and "hosted" in stamps:
+                hosted = win.hosted_widget
+                if hosted is not None and (obj is hosted or (obj.isWidgetType() and hosted.isAncestorOf(obj))):
+                    stamps["painted"] = time.perf_counter()
+            return False
+
+    watch = PaintWatch()
+    app.installEventFilter(watch)
+
+    start_validator = win.start_validator
+    instantiate_widget = win.instantiate_widget
+
+    def timed_start_validator(path):
+        stamps["validator"] = time.perf_counter()
+        start_validator(path)
+        # Direct: stamped in the validator thread at emit time, not when the GUI gets to it
+        win.validator_thread.validation_complete.connect(on_validated, Qt.ConnectionType.DirectConnection)
+
+    def on_validated(success: bool, message: str, _module):
+        stamps.setdefault("validated", time.perf_counter())
+        if not success:
+            stamps["failed"] = message
+
+    def timed_instantiate(module):
+        stamps["instantiate"] = time.perf_counter()
+        instantiate_widget(module)
+        stamps["hosted"] = time.perf_counter()
+
+    win.start_validator = timed_start_validator
+    win.instantiate_widget = timed_instantiate
+
+    runs = []
+    for _ in range(loads):
+        stamps.clear()
+        stamps["start"] = time.perf_counter()
+        win.load_source(manifest)
+        deadline = time.perf_counter() + 30
+        while "painted" not in stamps:
+            if "failed" in stamps:
+                print(PREFIX + json.dumps({"error": "validation failed: " + stamps["failed"]}))
+                return 1
+            if time.perf_counter() > deadline:
+                print(PREFIX + json.dumps({"error": "not painted within 30 s (see the error log)"}))
+                return 1
+            app.processEvents()
+        s = stamps
+        runs.append({
+            "manifest": s["validator"] - s["start"],
+            "validate": s["validated"] - s["validator"],
+            "dispatch": s["instantiate"] - s["validated"],
+            "instantiate": s["hosted"] - s["instantiate"],
+            "first_paint": s["painted"] - s["hosted"],
+            "total": s["painted"] - s["start"],
+        })
+        win.validator_thread.wait()
+        app.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+    print(PREFIX + json.dumps({"runs": runs}))
+    win.close()
+    return 0
+
+
+# ----------------- Driver -----------------
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+def summarize(runs: list[dict]) -> dict:
+    return {stage: {"p50_ms": round(percentile([r[stage] for r in runs], 0.5) * 1000, 2),
+                    "p95_ms": round(percentile([r[stage] for r in runs], 0.95) * 1000, 2),
+                    "n": len(runs)}
+            for stage in STAGES}
+
+
+def run_sample(manifest: Path, repeat: int, warm: int) -> tuple[list[dict], list[dict], str]:
+    cold, warm_runs = [], []
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, __file__, "--worker", str(manifest), "--loads", str(1 + warm)],
+                              cwd=ROOT, env=env, capture_output=True, text=True, timeout=300)
+        report = next((json.loads(line[len(PREFIX):]) for line in proc.stdout.splitlines()
+                       if line.startswith(PREFIX)), None)
+        if report is None or "error" in report:
+            reason = report["error"] if report else f"exit code {proc.returncode}\n{proc.stderr[-1500:]}"
+            return cold, warm_runs, reason
+        cold.append(report["runs"][0])
+        warm_runs.extend(report["runs"][1:])
+    return cold, warm_runs, ""
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", nargs="+", choices=sorted(SAMPLES), default=list(SAMPLES))
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh processes per sample (cold loads)")
+    parser.add_argument("--warm", type=int, default=5, help="Further loads per process")
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    parser.add_argument("--compare", metavar="PATH", help="Earlier results to compare total p50 against")
+    parser.add_argument("--worker", metavar="MANIFEST", help=argparse.SUPPRESS)
+    parser.add_argument("--loads", type=int, default=1, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        return worker(Path(args.worker), args.loads)
+
+    previous = json.loads(Path(args.compare).read_text()) if args.compare else None
+    results = {"commit": git_commit(), "python": platform.python_version(), "platform": sys.platform,
+               "repeat": args.repeat, "warm": args.warm, "samples": {}}
+    failed = False
+    with tempfile.TemporaryDirectory(prefix="qtforge-loadlat-") as scratch:
+        for name in args.samples:
+            manifest = stage_sample(name, Path(scratch) / name)
+            cold, warm, error = run_sample(manifest, args.repeat, args.warm)
+            entry = {"cold": summarize(cold), "warm": summarize(warm)}
+            if error:
+                entry["error"] = error
+                failed = True
+            results["samples"][name] = entry
+
+            print(f"\n{name}" + ("  FAILED" if error else ""))
+            for line in error.splitlines()[:3]:
+                print(f"  {line}")
+            if not cold:
+                continue
+            print(f"  {'stage':<13}{'cold p50':>10}{'cold p95':>10}{'warm p50':>10}{'warm p95':>10}  ms")
+            for stage in STAGES:
+                c, w = entry["cold"][stage], entry["warm"][stage]
+                print(f"  {stage:<13}{c['p50_ms']:>10.1f}{c['p95_ms']:>10.1f}{w['p50_ms']:>10.1f}{w['p95_ms']:>10.1f}")
+            old = previous and previous.get("samples", {}).get(name)
+            if old and "total" in old["cold"] and old["cold"]["total"]["n"]:
+                for kind in ("cold", "warm"):
+                    before, now = old[kind]["total"]["p50_ms"], entry[kind]["total"]["p50_ms"]
+                    change = (now - before) / before * 100 if before else 0.0
+                    print(f"  {kind} total p50 vs {previous.get('commit') or args.compare}: "
+                          f"{before:.1f} -> {now:.1f} ms ({change:+.0f}%)")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nSaved {args.json}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
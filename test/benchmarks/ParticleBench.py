@@ -0,0 +1,191 @@
+"""
+Particle engine benchmark.
+
+Builds the RandomBals sample (`DynamicPaintWidget`, on libs/Particleengine.py)
+offscreen at --size for each --counts and times whole frames: the
+vectorised step plus `QWidget.render()` of paintEvent (gradient background
+and the batched sprites). With --legacy the dict-per-shape loop the sample
+used before (a Python update and a `drawEllipse()` per shape) runs on the
+same counts for comparison, for at most --legacy-frames frames.
+
+Fails (exit code 1) when the largest count stays below --target-fps at p50.
+
+    python test/benchmarks/ParticleBench.py
+    python test/benchmarks/ParticleBench.py --counts 100 10000 100000 --legacy --json particles.json
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QImage, QPainter, QColor, QBrush, QLinearGradient
+from PyQt6.QtWidgets import QApplication
+
+
+def load_sample():
+    spec = importlib.util.spec_from_file_location("RandomBals", ROOT / "test" / "RandomBals.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+# ----------------- The sample before the engine -----------------
+class LegacyShapes:
+    """The original update_animation/paintEvent of DynamicPaintWidget, on a plain image."""
+
+    def __init__(self, count: int, sizes: tuple[float, float], width: int, height: int):
+        self.width, self.height = width, height
+        self.shapes = [{
+            'x': random.uniform(0, width),
+            'y': random.uniform(0, height),
+            'size': random.uniform(*sizes),
+            'color': QColor(0, random.randint(180, 255), 255, 180),
+            'speed': random.uniform(0.5, 3.0),
+            'dir': random.uniform(0, 360),
+        } for _ in range(count)]
+
+    def step(self):
+        for s in self.shapes:
+            rad = math.radians(s['dir'])
+            s['x'] += math.cos(rad) * s['speed']
+            s['y'] += math.sin(rad) * s['speed']
+            if s['x'] < 0:
+                s['x'] = 0
+                s['dir'] = 180 - s['dir']
+            elif s['x'] > self.width:
+                s['x'] = self.width
+                s['dir'] = 180 - s['dir']
+            if s['y'] < 0:
+                s['y'] = 0
+                s['dir'] = -s['dir']
+            elif s['y'] > self.height:
+                s['y'] = self.height
+                s['dir'] = -s['dir']
+
+    def paint(self, image: QImage):
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        gradient = QLinearGradient(0, 0, 0, self.height)
+        gradient.setColorAt(0, QColor(0, 60, 100))
+        gradient.setColorAt(1, QColor(0, 120, 180))
+        painter.fillRect(0, 0, self.width, self.height, QBrush(gradient))
+        for s in self.shapes:
+            painter.setBrush(s['color'])
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(QPointF(s['x'], s['y']), s['size'] / 2, s['size'] / 2)
+        painter.end()
+
+
+# ----------------- Runs -----------------
+def summarize(steps: list[float], paints: list[float]) -> dict:
+    frames = [a + b for a, b in zip(steps, paints)]
+    p50 = percentile(frames, 0.5)
+    return {
+        "frames": len(frames),
+        "step_p50_ms": round(percentile(steps, 0.5) * 1000, 2),
+        "paint_p50_ms": round(percentile(paints, 0.5) * 1000, 2),
+        "frame_p50_ms": round(p50 * 1000, 2),
+        "frame_p95_ms": round(percentile(frames, 0.95) * 1000, 2),
+        "fps_p50": round(1 / p50, 1) if p50 else 0.0,
+    }
+
+
+def run_engine(sample, count: int, sizes, width: int, height: int, frames: int) -> dict:
+    widget = sample.DynamicPaintWidget(0)
+    widget.timer.stop()
+    widget.setWindowState(Qt.WindowState.WindowNoState)
+    widget.resize(width, height)
+    widget.spawn(count, sizes)
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    dt = sample.TICK_MS / 1000
+    steps, paints = [], []
+    for _ in range(frames + 5):
+        t0 = time.perf_counter()
+        widget.engine.step(dt, width, height)
+        t1 = time.perf_counter()
+        widget.render(image)
+        t2 = time.perf_counter()
+        steps.append(t1 - t0)
+        paints.append(t2 - t1)
+    result = summarize(steps[5:], paints[5:])   # the first frames build the sprites
+    result["groups"] = len(widget.engine.groups)
+    widget.close()
+    widget.deleteLater()
+    return result
+
+
+def run_legacy(count: int, sizes, width: int, height: int, frames: int) -> dict:
+    shapes = LegacyShapes(count, sizes, width, height)
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    steps, paints = [], []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        shapes.step()
+        t1 = time.perf_counter()
+        shapes.paint(image)
+        t2 = time.perf_counter()
+        steps.append(t1 - t0)
+        paints.append(t2 - t1)
+    return summarize(steps, paints)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--sizes", type=float, nargs=2, default=[2, 6], metavar=("MIN", "MAX"),
+                        help="Particle diameters in pixels (the sample's own 100 shapes are 15-50)")
+    parser.add_argument("--size", default="1920x1080")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--legacy", action="store_true", help="Also time the dict-per-shape original")
+    parser.add_argument("--legacy-frames", type=int, default=10)
+    parser.add_argument("--target-fps", type=float, default=60.0)
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    sizes = tuple(args.sizes)
+
+    app = QApplication(sys.argv)
+    sample = load_sample()
+    results = {"size": args.size, "sizes": sizes, "cpus": os.cpu_count(), "engine": {}, "legacy": {}}
+
+    print(f"{'':<8}{'count':>8}{'step':>9}{'paint':>9}{'frame':>9}{'p95':>9}{'fps':>8}   ms at p50, {args.size}")
+    for count in args.counts:
+        runs = [("engine", run_engine(sample, count, sizes, width, height, args.frames))]
+        if args.legacy:
+            runs.append(("legacy", run_legacy(count, sizes, width, height, args.legacy_frames)))
+        for kind, r in runs:
+            results[kind][count] = r
+            print(f"{kind:<8}{count:>8}{r['step_p50_ms']:>9.2f}{r['paint_p50_ms']:>9.2f}"
+                  f"{r['frame_p50_ms']:>9.2f}{r['frame_p95_ms']:>9.2f}{r['fps_p50']:>8.1f}")
+        app.processEvents()
+
+    largest = results["engine"][max(args.counts)]
+    ok = largest["fps_p50"] >= args.target_fps
+    print(f"\n{max(args.counts)} particles: {largest['fps_p50']:.1f} FPS at p50 "
+          f"({'meets' if ok else 'below'} the {args.target_fps:g} FPS target, {largest['groups']} draw calls)")
+    if (os.cpu_count() or 1) == 1:
+        print("Note: 1 CPU; the raster engine shares it with the timing loop and the OS")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
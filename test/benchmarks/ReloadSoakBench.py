@@ -0,0 +1,119 @@
+"""
+Reload soak test: reload a source N times and check the host stays flat.
+
+Hosts SOURCE in the real MainWindow (offscreen), presses Reload N times
+and samples RSS after each swap once deferred deletes and gc have run.
+Fails (exit code 1) when RSS grows more than --max-growth-mb after the
+warm-up, or when the leak detector finds a previous source still alive.
+
+    python test/benchmarks/ReloadSoakBench.py test/ListSample.ini --reloads 200
+    python test/benchmarks/ReloadSoakBench.py test/ListSample.ini --leak   # detector self-check
+"""
+import os
+import gc
+import sys
+import time
+import argparse
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import psutil
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtWidgets import QApplication
+
+# Filled only with --leak, to check the detector reports the chain
+_kept = []
+
+
+def load_studio():
+    spec = importlib.util.spec_from_file_location("qtforge_studio", ROOT / "QtForge _Studio.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def wait_until(app: QApplication, condition, timeout: float = 30.0):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("source was not hosted in time (see the error log)")
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def settle(app: QApplication):
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    gc.collect()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", type=Path, help="Source folder or .ini")
+    parser.add_argument("--reloads", type=int, default=100)
+    parser.add_argument("--warmup", type=float, default=0.2, help="Fraction of reloads ignored for growth")
+    parser.add_argument("--max-growth-mb", type=float, default=2.0)
+    parser.add_argument("--leak", action="store_true", help="Deliberately keep every hosted widget")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    os.chdir(ROOT)  # the window loads src/styles.qss relative to the repo
+    studio = load_studio()
+    studio.MainWindow.LEAK_CHECK_DELAY_MS = 0
+    win = studio.MainWindow("off")
+    win.show()
+
+    process = psutil.Process()
+    win.load_source(args.source.resolve())
+    wait_until(app, lambda: win.leak_detector.current is not None)
+
+    rss = []
+    start = time.perf_counter()
+    for _ in range(args.reloads):
+        generation = win.leak_detector.current
+        if args.leak:
+            _kept.append(win.raw_widget)
+        win.reload_source()
+        wait_until(app, lambda: win.leak_detector.current is not generation
+                   and not win.validator_thread.isRunning())
+        settle(app)
+        rss.append(process.memory_info().rss / 1024 / 1024)
+    elapsed = time.perf_counter() - start
+    settle(app)
+
+    leaks = [r for r in win.leak_detector.reports if r.leaked]
+    skip = int(len(rss) * args.warmup)
+    steady = rss[skip:]
+    growth = steady[-1] - steady[0] if steady else 0.0
+    slope = 0.0
+    if len(steady) > 1:
+        n = len(steady)
+        mean_x, mean_y = (n - 1) / 2, sum(steady) / n
+        slope = (sum((i - mean_x) * (y - mean_y) for i, y in enumerate(steady))
+                 / sum((i - mean_x) ** 2 for i in range(n)))
+
+    print(f"{args.reloads} reloads in {elapsed:.1f} s ({elapsed / args.reloads * 1000:.1f} ms each)")
+    print(f"RSS {rss[0]:.1f} -> {rss[-1]:.1f} MB; after warm-up {growth:+.2f} MB ({slope * 1024:+.1f} KiB/reload)")
+    print(f"Leak reports: {len(leaks)} of {len(win.leak_detector.reports)} checks")
+    for report in leaks[:3]:
+        print(report.format())
+
+    win.close()
+    failures = []
+    if growth > args.max_growth_mb:
+        failures.append(f"RSS grew {growth:.2f} MB > {args.max_growth_mb} MB")
+    if leaks:
+        failures.append(f"{len(leaks)} reload(s) left objects alive")
+    if failures:
+        print("\nFAILED: " + "; ".join(failures))
+        return 1
+    print("\nFlat")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
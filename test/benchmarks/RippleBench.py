@@ -0,0 +1,121 @@
+"""
+Ripple paint benchmark for the render caches (libs/Rendercache.py).
+
+Fills the WaterFlow sample (`AquaRippleWidget`) with N ripples at
+random places and radii, as clicking would after a while, and times
+`QWidget.render()` of paintEvent (cached background plus batched ring
+sprites) against the paintEvent the sample had before (gradient fill and
+a `QColor`, pen and `drawEllipse()` per ripple) for each --counts.
+Also reported: draw calls and the sprite cache size and hit rate.
+
+    python test/benchmarks/RippleBench.py
+    python test/benchmarks/RippleBench.py --counts 0 10 100 1000 --size 1280x900 --json ripples.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QImage, QPainter, QColor, QBrush, QLinearGradient
+from PyQt6.QtWidgets import QApplication
+
+
+def load_sample():
+    spec = importlib.util.spec_from_file_location("WaterFlow", ROOT / "test" / "WaterFlow.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+def legacy_paint(image: QImage, ripples: list[dict]):
+    """The paintEvent of AquaRippleWidget before the render caches."""
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    gradient = QLinearGradient(0, 0, 0, image.height())
+    gradient.setColorAt(0, QColor(0, 100, 180))
+    gradient.setColorAt(1, QColor(0, 200, 255))
+    painter.fillRect(image.rect(), QBrush(gradient))
+    for r in ripples:
+        alpha = max(0, 180 - int((r['radius'] / r['max_radius']) * 180))
+        color = QColor(0, 255, 255, alpha)
+        painter.setPen(color)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(QPointF(r['x'], r['y']), r['radius'], r['radius'])
+    painter.end()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[0, 10, 50, 200, 1000])
+    parser.add_argument("--size", default="1280x900")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.size.lower().split("x"))
+
+    app = QApplication(sys.argv)
+    sample = load_sample()
+    widget = sample.AquaRippleWidget()
+    widget.timer.stop()
+    widget.resize(width, height)
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    rng = np.random.default_rng(1)
+    results = {"size": args.size, "counts": {}}
+
+    print(f"{'ripples':>8}{'cached':>10}{'before':>10}{'calls':>7}{'sprites':>9}{'hits':>7}   paint p50 ms, {args.size}")
+    for count in args.counts:
+        widget.centres = rng.uniform(0, 1, (2, count)) * [[width], [height]]
+        # Ripples grow SPEED px per tick, so radii are multiples of it
+        widget.radii = rng.integers(1, sample.MAX_RADIUS // sample.SPEED + 1, count) * float(sample.SPEED)
+        legacy = [{'x': x, 'y': y, 'radius': r, 'max_radius': sample.MAX_RADIUS}
+                  for x, y, r in zip(widget.centres[0], widget.centres[1], widget.radii)]
+
+        widget.render(image)   # fill the caches
+        hits, misses = widget.rings.hits, widget.rings.misses
+        cached, before = [], []
+        for _ in range(args.frames):
+            t0 = time.perf_counter()
+            widget.render(image)
+            t1 = time.perf_counter()
+            legacy_paint(image, legacy)
+            t2 = time.perf_counter()
+            cached.append(t1 - t0)
+            before.append(t2 - t1)
+        lookups = (widget.rings.hits - hits) + (widget.rings.misses - misses)
+        hit_rate = (widget.rings.hits - hits) / lookups if lookups else 1.0
+        calls = len(np.unique(widget.rings.keys(widget.radii, 180 - widget.radii / sample.MAX_RADIUS * 180)))
+        row = {"cached_p50_ms": round(percentile(cached, 0.5) * 1000, 2),
+               "cached_p95_ms": round(percentile(cached, 0.95) * 1000, 2),
+               "before_p50_ms": round(percentile(before, 0.5) * 1000, 2),
+               "before_p95_ms": round(percentile(before, 0.95) * 1000, 2),
+               "draw_calls": calls, "sprites": len(widget.rings), "hit_rate": round(hit_rate, 3)}
+        results["counts"][count] = row
+        print(f"{count:>8}{row['cached_p50_ms']:>10.2f}{row['before_p50_ms']:>10.2f}{calls:>7}"
+              f"{len(widget.rings):>9}{hit_rate:>7.0%}")
+
+    print(f"\nBackground renders: {widget.background.renders} (one per size)")
+    widget.close()
+    widget.deleteLater()
+    app.processEvents()
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
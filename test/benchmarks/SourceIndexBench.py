@@ -0,0 +1,90 @@
+"""
+Quick-open latency benchmark.
+
+Builds a synthetic index of N sources and times fuzzy queries against it.
+With --root, also times a cold and an incremental SourceIndexer pass over a
+real tree using a throwaway database.
+
+    python test/benchmarks/SourceIndexBench.py --sources 10000
+    python test/benchmarks/SourceIndexBench.py --root D:/tools
+"""
+import sys
+import time
+import random
+import string
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from libs.Sourceindex import SourceIndex, SourceIndexer, SourceEntry
+from libs.Databasconnector import DatabaseConnector
+
+BUDGET_MS = 10.0
+WORDS = ["chart", "list", "water", "flow", "config", "maker", "dynamic", "paint", "alarm",
+         "clock", "viewer", "editor", "table", "tree", "plot", "stream", "signal", "panel"]
+
+
+def synthetic_entries(count: int) -> list[SourceEntry]:
+    rng = random.Random(1234)
+    entries = []
+    for i in range(count):
+        name = "".join(w.title() for w in rng.sample(WORDS, 2)) + str(i)
+        folder = f"/workspace/{rng.choice(WORDS)}/{name.lower()}"
+        entries.append(SourceEntry(f"{folder}/{name}.ini", folder, name, f"{name}Widget", ""))
+    return entries
+
+
+def percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def bench_search(count: int, queries: int) -> bool:
+    index = SourceIndex()
+    index.set_entries(synthetic_entries(count))
+    rng = random.Random(42)
+    samples = []
+    for _ in range(queries):
+        word = rng.choice(WORDS)
+        query = word[: rng.randint(1, len(word))] + rng.choice(["", rng.choice(string.ascii_lowercase)])
+        start = time.perf_counter()
+        index.search(query)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    p50, p95, worst = percentile(samples, 50), percentile(samples, 95), max(samples)
+    print(f"search over {count} sources: p50={p50:.2f} ms  p95={p95:.2f} ms  max={worst:.2f} ms")
+    ok = p95 <= BUDGET_MS
+    print(f"budget {BUDGET_MS:.1f} ms (p95): {'OK' if ok else 'FAILED'}")
+    return ok
+
+
+def bench_indexer(root: str):
+    db = DatabaseConnector.__new__(DatabaseConnector)
+    db.base_path = tempfile.mkdtemp(prefix="qtforge_index_")
+    db.db_path = str(Path(db.base_path) / "bench.db")
+    db._recent_cache = {}
+    db.create_tables_if_not_exist()
+
+    for label in ("cold", "incremental"):
+        indexer = SourceIndexer(db, [root])
+        result = {}
+        indexer.index_updated.connect(lambda total, parsed: result.update(total=total, parsed=parsed))
+        start = time.perf_counter()
+        indexer.run()  # synchronous on purpose
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"indexer {label}: {elapsed:.1f} ms, {result.get('total', 0)} sources, "
+              f"{result.get('parsed', 0)} parsed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sources", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--root", help="optional tree to index")
+    args = parser.parse_args()
+
+    if args.root:
+        bench_indexer(args.root)
+    sys.exit(0 if bench_search(args.sources, args.queries) else 1)
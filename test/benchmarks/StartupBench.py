@@ -0,0 +1,147 @@
+"""
+Startup benchmark: process start to first painted frame of the host.
+
+Launches `QtForge _Studio.py` with QTFORGE_STARTUP_PROBE=exit and
+`-X importtime`, so each run reports the first-frame time, quits, and
+leaves an import breakdown on stderr. Fails (exit code 1) when the median
+exceeds the budget in startup_budget.json or when a module meant to be
+imported on demand was already loaded at first frame.
+
+    python test/benchmarks/StartupBench.py --runs 5 --offscreen
+
+With --session SOURCE it instead measures launch to a usable tool (the
+source hosted in the renderer), restoring SOURCE sequentially (after the
+window is shown) and with the background pre-warm. --sample NAME does the
+same for a bundled sample staged by BenchSamples.py.
+
+    python test/benchmarks/StartupBench.py --sample TestAlso --offscreen
+    python test/benchmarks/StartupBench.py --session test/ListSample.ini
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from BenchSamples import SAMPLES, stage_sample
+
+BUDGET = Path(__file__).with_name("startup_budget.json")
+PREFIX = "QTFORGE_STARTUP"
+
+
+def run_once(offscreen: bool, probe: str = "exit", args: tuple[str, ...] = ("--no-restore",)
+             ) -> tuple[float, dict, dict[str, int]]:
+    env = dict(os.environ, QTFORGE_STARTUP_PROBE=probe)
+    if offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "QtForge _Studio.py", *args],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    wall = (time.perf_counter() - start) * 1000
+
+    report = None
+    for line in proc.stdout.splitlines():
+        if line.startswith(PREFIX):
+            report = json.loads(line[len(PREFIX):])
+    if report is None:
+        raise RuntimeError(f"No startup report (exit code {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+    # "import time: self [us] | cumulative | imported package"; top-level imports are unindented
+    imports: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return wall, report, imports
+
+
+def median(values: list[float]) -> float:
+    return sorted(values)[len(values) // 2]
+
+
+def session_bench(source: Path, runs: int, offscreen: bool) -> int:
+    sys.path.insert(0, str(ROOT))
+    from libs.Databasconnector import DatabaseConnector
+    # Make SOURCE the most recent entry, as after a previous session
+    db = DatabaseConnector()
+    db.create_tables_if_not_exist()
+    time.sleep(1 - time.time() % 1)   # LAST_OPENED has 1 s resolution: do not tie with the previous run's source
+    db.insert_path(source.resolve())
+
+    results = {}
+    for mode in ("sequential", "prewarm"):
+        usable = []
+        for _ in range(runs):
+            _, report, _ = run_once(offscreen, "usable", (f"--restore-last={mode}",))
+            if report.get("usable_ms") is None:
+                print(f"{mode}: source was not hosted (check the error log)")
+                return 1
+            usable.append(report["usable_ms"])
+        results[mode] = median(usable)
+        print(f"{mode:>10}: launch -> usable {results[mode]:8.1f} ms (median of {runs})")
+    print(f"\nprewarm / sequential: {results['prewarm'] / results['sequential']:.2f}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest top-level imports to list")
+    parser.add_argument("--offscreen", action="store_true", help="Use the offscreen Qt platform")
+    parser.add_argument("--budget", type=Path, default=BUDGET)
+    parser.add_argument("--session", type=Path, help="Source folder or .ini to restore")
+    parser.add_argument("--sample", choices=sorted(SAMPLES), help="Bundled sample to restore (staged copy)")
+    args = parser.parse_args()
+
+    if args.sample:
+        with tempfile.TemporaryDirectory(prefix="startup_session_") as scratch:
+            return session_bench(stage_sample(args.sample, Path(scratch)), args.runs, args.offscreen)
+    if args.session:
+        return session_bench(args.session, args.runs, args.offscreen)
+
+    budget = json.loads(args.budget.read_text(encoding="utf-8"))
+    walls, frames, loaded = [], [], set()
+    imports: dict[str, list[int]] = {}
+    for _ in range(args.runs):
+        wall, report, run_imports = run_once(args.offscreen)
+        walls.append(wall)
+        frames.append(report["first_frame_ms"])
+        loaded.update(report["modules"])
+        for name, us in run_imports.items():
+            imports.setdefault(name, []).append(us)
+
+    print(f"process start -> first frame : {median(walls):8.1f} ms (median of {args.runs})")
+    print(f"script start  -> first frame : {median(frames):8.1f} ms")
+    print("\nSlowest top-level imports (cumulative, median):")
+    slowest = sorted(((median(v) / 1000, k) for k, v in imports.items()), reverse=True)[:args.top]
+    for ms, name in slowest:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    failures = []
+    if median(walls) > budget.get("process_ms", float("inf")):
+        failures.append(f"process start to first frame {median(walls):.0f} ms > {budget['process_ms']} ms")
+    if median(frames) > budget.get("first_frame_ms", float("inf")):
+        failures.append(f"script start to first frame {median(frames):.0f} ms > {budget['first_frame_ms']} ms")
+    for name in budget.get("deferred_modules", []):
+        if name in loaded:
+            failures.append(f"'{name}' is imported before the first frame")
+
+    if failures:
+        print("\nOVER BUDGET:\n  " + "\n  ".join(failures))
+        return 1
+    print("\nWithin budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Streaming chart benchmark: a 1 kHz feed into the Test Also sample's chart
+(`RendererWidget`, on libs/Streamchart.py) for hours of simulated time,
+offscreen.
+
+Every simulated minute, --frames real frames are timed: the frame's
+samples appended one by one, the stream flushed and the chart painted.
+The rest of the minute is fast-forwarded in one bulk append. RSS is
+sampled at every checkpoint; with the ring buffer it must stay flat.
+For comparison, the chart as it was before (`QLineSeries.append()` per
+sample, axes refitted over every point) is timed at --legacy-at seconds.
+
+    python test/benchmarks/StreamChartBench.py
+    python test/benchmarks/StreamChartBench.py --hours 4 --mode lttb --json stream.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import psutil
+from PyQt6.QtCore import QPointF
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCharts import QChart, QChartView, QLineSeries
+
+FEED_HZ = 1000
+FRAME_S = 1 / 60
+
+
+def load_sample():
+    spec = importlib.util.spec_from_file_location("TestAlso", ROOT / "test" / "Test Also.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+def signal(t: np.ndarray) -> np.ndarray:
+    return np.sin(2 * np.pi * 0.5 * t) + 0.3 * np.sin(2 * np.pi * 7 * t) + 0.05 * np.sin(2 * np.pi * 113 * t)
+
+
+class Feed:
+    """Sample clock of a FEED_HZ source, in simulated time."""
+
+    def __init__(self):
+        self.n = 0
+
+    def until(self, seconds: float) -> tuple[np.ndarray, np.ndarray]:
+        due = int(round(seconds * FEED_HZ))
+        t = np.arange(self.n, max(due, self.n)) / FEED_HZ
+        self.n = max(due, self.n)
+        return t, signal(t)
+
+
+# ----------------- Runs -----------------
+def stream_run(app: QApplication, sample, args) -> dict:
+    widget = sample.RendererWidget()
+    widget.feed_timer.stop()   # the bench is the source
+    stream = widget.stream
+    stream.mode = args.mode if args.mode != "none" else None
+    widget.resize(1000, 600)
+    widget.show()
+    app.processEvents()
+
+    process = psutil.Process()
+    feed = Feed()
+    now = 0.0
+    checkpoints = []
+    all_times = []
+    minutes = int(args.hours * 60)
+    for minute in range(minutes + 1):
+        # Fast-forward to this minute in one bulk append, then time real frames
+        t, y = feed.until(minute * 60.0)
+        if len(t):
+            stream.extend(t, y)
+            stream.flush()
+        now = minute * 60.0
+        times = []
+        for _ in range(args.frames):
+            now += FRAME_S
+            t0 = time.perf_counter()
+            t, y = feed.until(now)
+            for x, v in zip(t.tolist(), y.tolist()):
+                stream.append(x, v)
+            stream.flush()
+            app.processEvents()   # chart update and paint
+            times.append(time.perf_counter() - t0)
+        all_times += times
+        rss = process.memory_info().rss / 1024 / 1024
+        checkpoints.append({"minute": minute, "p50_ms": round(percentile(times, 0.5) * 1000, 2),
+                            "p95_ms": round(percentile(times, 0.95) * 1000, 2), "rss_mb": round(rss, 1),
+                            "plotted": stream.plotted})
+        if minute % max(1, minutes // 8) == 0 or minute == minutes:
+            print(f"  {minute / 60:5.2f} h  frame p50 {checkpoints[-1]['p50_ms']:6.2f} ms  "
+                  f"p95 {checkpoints[-1]['p95_ms']:6.2f} ms  {stream.plotted:5d} points  RSS {rss:6.1f} MB")
+    widget.close()
+    skip = max(1, len(checkpoints) // 10)   # allocator warm-up
+    steady = [c["rss_mb"] for c in checkpoints[skip:]] or [checkpoints[-1]["rss_mb"]]
+    return {"mode": args.mode, "samples": feed.n, "checkpoints": checkpoints,
+            "p50_ms": round(percentile(all_times, 0.5) * 1000, 2),
+            "p95_ms": round(percentile(all_times, 0.95) * 1000, 2),
+            "rss_growth_mb": round(max(steady) - steady[0], 2), "flushes": stream.flushes,
+            "y_rescales": stream.rescales}
+
+
+def legacy_run(app: QApplication, args) -> dict:
+    """The chart before: every sample appended to the series, axes refitted over all of them."""
+    series = QLineSeries()
+    chart = QChart()
+    chart.addSeries(series)
+    chart.createDefaultAxes()
+    x_axis, y_axis = chart.axes()
+    view = QChartView(chart)
+    view.resize(1000, 600)
+    view.show()
+    app.processEvents()
+    feed = Feed()
+    low = high = 0.0
+    results = {}
+
+    def add(t, y):
+        nonlocal low, high
+        for x, v in zip(t.tolist(), y.tolist()):
+            series.append(x, v)
+        if len(y):
+            low, high = min(low, float(y.min())), max(high, float(y.max()))
+            x_axis.setRange(0, float(t[-1]))
+            y_axis.setRange(low, high)
+
+    points = []
+    for mark in args.legacy_at:
+        # Fast-forward: the series as appending would have left it, set in one go
+        t, y = feed.until(mark)
+        points += [QPointF(a, b) for a, b in zip(t.tolist(), y.tolist())]
+        series.replace(points)
+        now = float(mark)
+        times = []
+        for _ in range(args.legacy_frames):
+            now += FRAME_S
+            t0 = time.perf_counter()
+            add(*feed.until(now))
+            app.processEvents()
+            times.append(time.perf_counter() - t0)
+        results[mark] = {"points": series.count(), "p50_ms": round(percentile(times, 0.5) * 1000, 2),
+                         "p95_ms": round(percentile(times, 0.95) * 1000, 2)}
+        print(f"  {mark:>6} s  frame p50 {results[mark]['p50_ms']:7.2f} ms  p95 {results[mark]['p95_ms']:7.2f} ms  "
+              f"{series.count()} points")
+    view.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=2.0, help="Simulated feed duration")
+    parser.add_argument("--frames", type=int, default=60, help="Timed frames per checkpoint")
+    parser.add_argument("--mode", choices=["minmax", "lttb", "none"], default="minmax")
+    parser.add_argument("--legacy-at", type=int, nargs="*", default=[10, 60],
+                        help="Seconds of feed at which to time the append-per-sample chart (none to skip)")
+    parser.add_argument("--legacy-frames", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=16.7)
+    parser.add_argument("--max-growth-mb", type=float, default=5.0)
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    sample = load_sample()
+
+    print(f"Streaming ({args.mode}), {FEED_HZ} Hz for {args.hours:g} h")
+    results = {"feed_hz": FEED_HZ, "budget_ms": args.budget_ms, "stream": stream_run(app, sample, args)}
+    stream = results["stream"]
+    if args.legacy_at:
+        print("Append per sample (before)")
+        results["legacy"] = legacy_run(app, args)
+
+    ok = stream["p95_ms"] <= args.budget_ms and stream["rss_growth_mb"] <= args.max_growth_mb
+    print(f"\n{stream['samples']} samples: frame p50 {stream['p50_ms']} ms, p95 {stream['p95_ms']} ms "
+          f"(budget {args.budget_ms} ms); RSS growth after warm-up {stream['rss_growth_mb']:+.2f} MB; "
+          f"{stream['y_rescales']} y-axis rescales in {stream['flushes']} flushes -> {'OK' if ok else 'FAIL'}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Theme toggle benchmark: restyle time against widget-tree size.
+
+Compares the old path (read styles.qss from disk and setStyleSheet on the
+window) with the theme engine toggling themes: precompiled sheet applied
+once on the QApplication, and in scopes under the window as the studio
+does after `attach()`. Also times hot-reloads of a single #objectName
+rule and of a class rule (`QTextEdit`), and counts the widgets each one
+restyled: only the host's, never the hosted source's. Runs offscreen.
+
+    python test/benchmarks/ThemeBench.py --sizes 100 500 2000 5000
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                             QLabel, QFrame, QTextEdit, QCheckBox)
+
+from libs.stylesheetModefier import StylesheetModifier, HOSTED_PROPERTY
+
+
+def build_tree(count: int) -> QWidget:
+    """
+    A small host (a #StatusLabel and a log QTextEdit) around a hosted
+    source of roughly `count` widgets in rows of five, nested two frames deep.
+    """
+    root = QWidget()
+    root.setObjectName("CentralWidget")
+    host_layout = QVBoxLayout(root)
+    status = QLabel("ready")
+    status.setObjectName("StatusLabel")
+    host_layout.addWidget(status)
+    host_layout.addWidget(QTextEdit())
+    hosted = QWidget()
+    hosted.setProperty(HOSTED_PROPERTY, True)
+    host_layout.addWidget(hosted, 1)
+
+    layout = QVBoxLayout(hosted)
+    kinds = (QPushButton, QLabel, QCheckBox, QTextEdit, QLabel)
+    made = 0
+    while made < count:
+        frame = QFrame()
+        row = QHBoxLayout(frame)
+        for kind in kinds:
+            row.addWidget(kind(f"w{made}") if kind is not QTextEdit else kind())
+            made += 1
+        layout.addWidget(frame)
+        made += 1
+    return root
+
+
+def timed(action, app: QApplication) -> float:
+    start = time.perf_counter()
+    action()
+    app.processEvents()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    qss = ROOT / "src" / "styles.qss"
+    engine = StylesheetModifier(qss, themes_path=ROOT / "src" / "themes.ini")
+    engine.compile("dark")
+    engine.compile("light")  # warm the compiled cache, as after the first toggle
+
+    # Scoped reload edits a copy of the template
+    scratch = Path(tempfile.mkdtemp(prefix="qtforge_theme_"))
+    shutil.copy(qss, scratch / "styles.qss")
+    shutil.copy(ROOT / "src" / "themes.ini", scratch / "themes.ini")
+    scoped = StylesheetModifier(scratch / "styles.qss")
+    template = (scratch / "styles.qss").read_text(encoding="utf-8")
+
+    attached = StylesheetModifier(qss, themes_path=ROOT / "src" / "themes.ini")
+    attached.compile("dark")
+    attached.compile("light")
+
+    print(f"{'widgets':>8} | {'reload+window (ms)':>19} | {'toggle app-level (ms)':>22} | "
+          f"{'toggle scoped (ms)':>19} | {'#id edit (ms)':>14} | {'class edit (ms)':>16} | {'restyled':>8}")
+    for size in args.sizes:
+        window = build_tree(size)
+        window.resize(1200, 800)
+        window.show()
+        app.processEvents()
+
+        def old_path():
+            # What apply_stylesheet() used to do on every call: read, then restyle the window
+            StylesheetModifier(qss, window, themes_path=ROOT / "src" / "themes.ini").apply_stylesheet()
+
+        old = [timed(old_path, app) for _ in range(args.repeat)]
+        window.setStyleSheet("")
+        toggles = [timed(engine.toggle_theme, app) for _ in range(args.repeat)]
+
+        app.setStyleSheet("")
+        app.processEvents()
+        attached.attach(window)
+        app.processEvents()
+        scoped_toggles = [timed(attached.toggle_theme, app) for _ in range(args.repeat)]
+        attached.root = None
+        window.setStyleSheet("")
+
+        scoped.attach(window)
+        app.processEvents()
+        edits = {"QLabel#StatusLabel {": [], "QTextEdit {": []}
+        restyled = set()
+        for rule, times in edits.items():
+            for i in range(args.repeat):
+                # One declaration of the rule changes per edit
+                (scratch / "styles.qss").write_text(
+                    template.replace(rule, f"{rule}\n    color: #{i + 1:02x}{i + 1:02x}ff;", 1), encoding="utf-8")
+                changed = []
+                times.append(timed(lambda: changed.extend(scoped.reload()), app))
+                restyled.update(changed)
+        scoped.root = None
+        id_edits, class_edits = edits.values()
+
+        print(f"{size:>8} | {sorted(old)[len(old) // 2]:>19.1f} | {sorted(toggles)[len(toggles) // 2]:>22.1f}"
+              f" | {sorted(scoped_toggles)[len(scoped_toggles) // 2]:>19.1f} | {sorted(id_edits)[len(id_edits) // 2]:>14.1f}"
+              f" | {sorted(class_edits)[len(class_edits) // 2]:>16.1f} | {', '.join(sorted(restyled)):>8}")
+        window.close()
+        window.deleteLater()
+        app.setStyleSheet("")
+        app.processEvents()
+    shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
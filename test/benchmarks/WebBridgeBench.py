@@ -0,0 +1,206 @@
+"""
+Web bridge benchmark: a live feed pushed from Python into a local web
+page (inline HTML and qwebchannel.js, no network), per point the way
+QtMl.py used to (`runJavaScript(f"window.handlePythonMessage({json})")`
+for every point) and through libs/Webbridge.py (one batch per frame,
+typed-array blocks, backpressure).
+
+For each feed rate the page counts the points it received and its
+animation frames; the bench samples the page's backlog (points fed but
+not yet received) and the Python time spent sending.
+
+    python test/benchmarks/WebBridgeBench.py
+    python test/benchmarks/WebBridgeBench.py --rates 1000 10000 100000 --seconds 5 --json bridge.json
+
+Needs PyQt6-WebEngine.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+if hasattr(os, "geteuid") and os.geteuid() == 0:
+    os.environ.setdefault("QTWEBENGINE_DISABLE_SANDBOX", "1")   # Chromium refuses to sandbox as root
+
+import numpy as np
+from PyQt6.QtCore import QTimer, QUrl
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWebEngineCore import QWebEnginePage
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+from libs.Webbridge import WebBridge
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body>
+<script>/*BRIDGE*/</script>
+<script>
+  "use strict";
+  var total = 0, frames = 0, last = 0;
+  function take(v) { total += v.length; for (var i = 0; i < v.length; i++) last = v[i]; }
+  window.handlePythonMessage = function (data) { if (data.action === "appendPoint") take([data.value]); };
+  if (window.qtBridge) qtBridge.on("appendPoints", function (msg) { take(msg.values); });
+  window.stats = function () { return {total: total, frames: frames}; };
+  (function loop() { frames++; requestAnimationFrame(loop); })();
+</script>
+</body></html>
+"""
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+def wait(app: QApplication, condition, timeout: float = 30.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.002)
+    return True
+
+
+def page_stats(app: QApplication, page) -> dict:
+    result = {}
+    page.runJavaScript("stats()", lambda value: result.update(value or {}))
+    wait(app, lambda: bool(result), 5.0)
+    return result
+
+
+class RecordingPage(QWebEnginePage):
+    """A page that keeps the scripts it is given instead of running them."""
+
+    def __init__(self):
+        super().__init__()
+        self.scripts = []
+
+    def runJavaScript(self, script, *args):
+        self.scripts.append(script)
+
+
+def check_shedding() -> list[str]:
+    """A keyed block shed down to nothing leaves the queue instead of going out without values."""
+    page = RecordingPage()
+    bridge = WebBridge(page, max_pending=1000)
+    bridge.send_array("appendPoints", np.arange(100), key="a")
+    bridge.send("clear")
+    bridge.send_array("appendPoints", np.arange(1000), key="a")
+    bridge._page_ready()   # flushes what was queued before the hello
+    problems = []
+    if len(page.scripts) != 1:
+        problems.append(f"{len(page.scripts)} batches sent, expected 1")
+    else:
+        script = page.scripts[0]
+        messages = json.loads(script[script.index("receive(") + 8:script.rindex(");")])["messages"]
+        actions = [message["action"] for message in messages]
+        if actions != ["clear", "appendPoints"]:
+            problems.append(f"sent {actions}, expected ['clear', 'appendPoints']")
+        if any(message["action"] == "appendPoints" and message.get("block", {}).get("shape") != [1000]
+               for message in messages):
+            problems.append("appendPoints sent without its 1000 values")
+    if bridge.pending() or bridge.dropped_values != 100:
+        problems.append(f"{bridge.pending()} messages left, {bridge.dropped_values} values dropped (expected 0, 100)")
+    bridge.deleteLater()
+    page.deleteLater()
+    return problems
+
+
+def run(app: QApplication, mode: str, rate: int, seconds: float) -> dict:
+    view = QWebEngineView()
+    view.resize(800, 400)
+    page = view.page()
+    bridge = WebBridge(page) if mode == "bridge" else None
+    html = PAGE.replace("/*BRIDGE*/", bridge.client_script() if bridge else "")
+    loaded = []
+    page.loadFinished.connect(loaded.append)
+    view.setHtml(html, QUrl("http://local/"))
+    view.show()
+    if not wait(app, lambda: loaded and (bridge is None or bridge.ready)):
+        print(f"[WebBridgeBench] The page did not load ({mode})")
+        return {}
+
+    rng = np.random.default_rng(1)
+    fed = 0
+    busy = 0.0
+    start = time.perf_counter()
+
+    def feed():
+        nonlocal fed, busy
+        t0 = time.perf_counter()
+        due = int((t0 - start) * rate)
+        if due > fed:
+            values = rng.normal(50, 10, due - fed)
+            if bridge is not None:
+                bridge.send_array("appendPoints", values, key="series")
+                bridge.flush()   # here rather than on the bridge's timer, so `busy` includes encoding
+            else:
+                for value in values.tolist():
+                    page.runJavaScript(f"window.handlePythonMessage({json.dumps({'action': 'appendPoint', 'value': value})});")
+            fed = due
+        busy += time.perf_counter() - t0
+
+    timer = QTimer()
+    timer.setInterval(16)
+    timer.timeout.connect(feed)
+    timer.start()
+    lags = []
+    first = page_stats(app, page)
+    while time.perf_counter() - start < seconds:
+        wait(app, lambda: False, 0.25)
+        stats = page_stats(app, page)
+        shed = bridge.dropped_values if bridge is not None else 0   # never coming: not backlog
+        lags.append(max(0, fed - shed - stats.get("total", 0)) / rate * 1000)
+    timer.stop()
+    elapsed = time.perf_counter() - start
+    stats = page_stats(app, page)
+    result = {"fed": fed, "received": stats.get("total", 0),
+              "delivered_per_s": round(stats.get("total", 0) / elapsed),
+              "page_fps": round((stats.get("frames", 0) - first.get("frames", 0)) / elapsed, 1),
+              "lag_p50_ms": round(percentile(lags, 0.5), 1), "lag_p95_ms": round(percentile(lags, 0.95), 1),
+              "python_ms_per_s": round(busy * 1000 / elapsed, 1)}
+    if bridge is not None:
+        result.update({"batches": bridge.batches, "kb_per_s": round(bridge.bytes_sent / 1024 / elapsed, 1),
+                       "held_frames": bridge.held_frames, "dropped_values": bridge.dropped_values})
+    view.close()
+    view.deleteLater()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rates", type=int, nargs="+", default=[100, 1000, 10000], help="Points per second")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Feed duration per rate")
+    parser.add_argument("--modes", nargs="+", choices=["per-point", "bridge"], default=["per-point", "bridge"])
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    problems = check_shedding()
+    print(f"Shedding check: {'OK' if not problems else '; '.join(problems)}")
+    if problems:
+        return 1
+    results = {}
+    print(f"{'mode':<10}{'rate/s':>8}{'delivered/s':>13}{'lag p50':>9}{'lag p95':>9}{'page fps':>10}{'py ms/s':>9}")
+    for rate in args.rates:
+        for mode in args.modes:
+            result = run(app, mode, rate, args.seconds)
+            if not result:
+                return 1
+            results.setdefault(mode, {})[rate] = result
+            print(f"{mode:<10}{rate:>8}{result['delivered_per_s']:>13}{result['lag_p50_ms']:>9}"
+                  f"{result['lag_p95_ms']:>9}{result['page_fps']:>10}{result['python_ms_per_s']:>9}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
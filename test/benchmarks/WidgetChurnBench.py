@@ -0,0 +1,173 @@
+"""
+Widget churn benchmark: how many widgets per second a dynamic UI can add
+(and drop, keeping --keep alive) while every frame fits --budget-ms.
+
+Runs the DinamicUITest sample (`DynamicTestUI`, on libs/Widgetpool.py)
+and, for comparison, the sample as it was before the pool (a new widget
+per add, `deleteLater()` per drop, the layout touched each time) offscreen.
+For each churn rate (widgets per frame) a frame is: the adds, then one
+event-loop pass that applies the batch, lays out and paints, plus the
+deferred deletes. The highest rate whose p95 frame stays within the
+budget is the sustained rate.
+
+    python test/benchmarks/WidgetChurnBench.py
+    python test/benchmarks/WidgetChurnBench.py --rates 1 4 16 64 --frames 60 --json churn.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import importlib.util
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, QEvent, qInstallMessageHandler
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QLineEdit,
+                             QCheckBox, QRadioButton, QComboBox, QTextEdit)
+
+
+def load_sample():
+    spec = importlib.util.spec_from_file_location("DinamicUITest", ROOT / "test" / "DinamicUITest.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def quiet_size_hints(mode, context, message):
+    # The offscreen platform warns on every top-level size hint change, i.e. every layout pass
+    if "propagateSizeHints" not in message:
+        sys.stderr.write(message + "\n")
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+
+# ----------------- The sample before the pool -----------------
+class LegacyDynamicUI(QWidget):
+    """add_random_widget() of DynamicTestUI before the pool (without the timer)."""
+
+    def __init__(self, max_widgets: int):
+        super().__init__()
+        self.resize(800, 600)
+        self.max_widgets = max_widgets
+        self.layout = QVBoxLayout()
+        self.setLayout(self.layout)
+        self.widgets = []
+
+    def add_random_widget(self):
+        widget_type = random.choice(['button', 'label', 'lineedit', 'checkbox', 'radiobutton', 'combobox', 'textedit'])
+        n = len(self.widgets) + 1
+        if widget_type == 'button':
+            widget = QPushButton(f"Button {n}")
+            widget.clicked.connect(lambda _, w=widget: print(f"{w.text()} clicked"))
+        elif widget_type == 'label':
+            widget = QLabel(f"Label {n}")
+            widget.setStyleSheet(f"color: rgb({random.randint(0,255)},{random.randint(0,255)},{random.randint(0,255)});")
+        elif widget_type == 'lineedit':
+            widget = QLineEdit()
+            widget.setPlaceholderText(f"LineEdit {n}")
+            widget.textChanged.connect(lambda text, w=widget: print(f"{w.placeholderText()} text: {text}"))
+        elif widget_type == 'checkbox':
+            widget = QCheckBox(f"CheckBox {n}")
+            widget.stateChanged.connect(lambda state, w=widget: print(f"{w.text()} state: {state}"))
+        elif widget_type == 'radiobutton':
+            widget = QRadioButton(f"Radio {n}")
+            widget.toggled.connect(lambda checked, w=widget: print(f"{w.text()} toggled: {checked}"))
+        elif widget_type == 'combobox':
+            widget = QComboBox()
+            widget.addItems([f"Item {i}" for i in range(1, 6)])
+            widget.currentIndexChanged.connect(lambda idx, w=widget: print(f"{w.currentText()} selected"))
+        else:
+            widget = QTextEdit()
+            widget.setPlaceholderText(f"TextEdit {n}")
+            widget.textChanged.connect(lambda w=widget: print(f"{w.placeholderText()} changed"))
+        self.layout.addWidget(widget)
+        self.widgets.append(widget)
+        if len(self.widgets) > self.max_widgets:
+            old_widget = self.widgets.pop(0)
+            self.layout.removeWidget(old_widget)
+            old_widget.deleteLater()
+
+
+# ----------------- Runs -----------------
+def run(app: QApplication, ui: QWidget, rate: int, frames: int) -> list[float]:
+    times = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        for _ in range(rate):
+            ui.add_random_widget()
+        app.processEvents()   # batch, layout, paint
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rates", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64, 128, 256],
+                        help="Widgets added (and dropped) per frame")
+    parser.add_argument("--keep", type=int, default=50, help="Widgets alive at a time (the sample keeps 50)")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--budget-ms", type=float, default=16.7)
+    parser.add_argument("--json", metavar="PATH", help="Save the results")
+    args = parser.parse_args()
+
+    qInstallMessageHandler(quiet_size_hints)
+    app = QApplication(sys.argv)
+    sample = load_sample()
+    random.seed(1)
+    results = {"keep": args.keep, "budget_ms": args.budget_ms, "pool": {}, "legacy": {}}
+    sustained = {}
+
+    print(f"{'':<8}{'rate':>6}{'p50':>9}{'p95':>9}{'widgets/s':>11}   frame ms, {args.keep} alive")
+    for kind in ("pool", "legacy"):
+        if kind == "pool":
+            ui = sample.DynamicTestUI(interval_ms=60_000, max_widgets=args.keep)
+            ui.widget_timer.stop()
+        else:
+            ui = LegacyDynamicUI(args.keep)
+        ui.show()
+        for _ in range(args.keep * 2):   # fill up and warm the pool
+            ui.add_random_widget()
+        run(app, ui, 1, 5)
+
+        sustained[kind] = 0.0
+        for rate in args.rates:
+            times = run(app, ui, rate, args.frames)
+            p50, p95 = percentile(times, 0.5), percentile(times, 0.95)
+            fits = p95 * 1000 <= args.budget_ms
+            per_second = rate * 1000 / args.budget_ms if fits else 0.0
+            if fits:
+                sustained[kind] = max(sustained[kind], per_second)
+            results[kind][rate] = {"p50_ms": round(p50 * 1000, 2), "p95_ms": round(p95 * 1000, 2),
+                                   "within_budget": fits}
+            print(f"{kind:<8}{rate:>6}{p50 * 1000:>9.2f}{p95 * 1000:>9.2f}"
+                  f"{(f'{per_second:.0f}' if fits else 'over'):>11}")
+        if kind == "pool":
+            pool = ui.pool
+            results["pool"]["stats"] = {"created": pool.created, "reused": pool.reused, "deleted": pool.deleted,
+                                        "batches": ui.batch.batches}
+            print(f"{'':<8}pool: {pool.created} created, {pool.reused} reused, {pool.deleted} deleted, "
+                  f"{ui.batch.batches} batches")
+        ui.close()
+        ui.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+    results["sustained_widgets_per_s"] = sustained
+    print(f"\nSustained within {args.budget_ms} ms frames: pool {sustained['pool']:.0f} widgets/s, "
+          f"before {sustained['legacy']:.0f} widgets/s")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Saved {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
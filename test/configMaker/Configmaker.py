@@ -8,15 +8,182 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QInputDialog, QFrame, QHBoxLayout
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QThread, pyqtSignal
+import os
 import sys
+import json
+import hashlib
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import ast
+from typing import Callable, NamedTuple, Optional
 
 # TEMP only – fix your project structure later
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 from libs.stylesheetModefier import StylesheetModifier
+from libs.Sourceindex import SKIP_DIRS
+from libs.Widgetscan import Candidate, scan_file
+
+CACHE_FILE = ".configmaker_cache.json"   # per root: what the last bulk run saw and wrote
+
+
+class BulkResult(NamedTuple):
+    source: str
+    action: str          # written, unchanged, kept, no widget, no entry point, error
+    entry_point: str
+    detail: str
+
+
+def manifest_text(module_name: str, entry_point: str, others: list[str] = ()) -> str:
+    ini_name = f"{module_name}.ini"
+    text = (
+        f"# {ini_name} (must be same name as Python file)\n"
+        f"# RendererWidget {entry_point}\n"
+    )
+    if others:
+        text += f"# Other widget classes: {', '.join(others)}\n"
+    return text + (
+        f"\n"
+        f"[source]\n"
+        f"module = {module_name}\n"
+        f"entry_point = {entry_point}\n"
+        f"description = \n"
+    )
+
+
+# ---------- Bulk mode ----------
+
+def find_sources(root: Path) -> list[Path]:
+    """Python files under `root`, without package markers and the folders the source index skips."""
+    found = []
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith("."))
+        found += [Path(folder) / f for f in sorted(files) if f.endswith(".py") and not f.startswith("__")]
+    return found
+
+
+def _digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def bulk_generate(root: Path, jobs: Optional[int] = None, force: bool = False,
+                  progress: Optional[Callable[[int, int], None]] = None) -> list[BulkResult]:
+    """
+    Scan every Python file under `root` in a process pool and write a
+    manifest next to each one defining a widget, for its best-ranked
+    class. Files whose content is unchanged since the last run (by
+    hash; size and mtime first) are skipped unless `force`. Manifests
+    this tool did not write are never overwritten.
+    """
+    root = Path(root).resolve()
+    cache_path = root / CACHE_FILE
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+
+    results: list[BulkResult] = []
+    todo: list[Path] = []
+    seen = set()
+    for path in find_sources(root):
+        key = path.relative_to(root).as_posix()
+        seen.add(key)
+        entry = cache.get(key)
+        if entry and not force and (not entry["entry_point"] or path.with_suffix(".ini").exists()):
+            stat = path.stat()
+            if (entry["size"], entry["mtime"]) == (stat.st_size, stat.st_mtime) or entry["source"] == _digest(path):
+                entry["size"], entry["mtime"] = stat.st_size, stat.st_mtime
+                results.append(BulkResult(str(path), "unchanged", entry["entry_point"], ""))
+                continue
+        todo.append(path)
+
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    names = [str(p) for p in todo]
+    if jobs == 1 or len(todo) < 2:
+        scans = map(scan_file, names)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn"))
+        scans = pool.map(scan_file, names, chunksize=max(1, len(names) // (jobs * 8)))
+    try:
+        for done, (path, scan) in enumerate(zip(todo, scans), 1):
+            results.append(_apply_scan(root, path, scan, cache))
+            if progress:
+                progress(done, len(todo))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    for key in set(cache) - seen:
+        del cache[key]
+    try:
+        cache_path.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+    except OSError as e:
+        print(f"[ConfigMaker] Cannot save {cache_path}: {e}")
+    return sorted(results, key=lambda r: r.source)
+
+
+def _apply_scan(root: Path, path: Path, scan, cache: dict) -> BulkResult:
+    key = path.relative_to(root).as_posix()
+    previous = cache.pop(key, None)
+    if scan.error:
+        return BulkResult(str(path), "error", "", scan.error)
+    stat = path.stat()
+    entry = {"source": scan.digest, "size": stat.st_size, "mtime": stat.st_mtime, "manifest": "", "entry_point": ""}
+    if not scan.candidates:
+        cache[key] = entry
+        return BulkResult(str(path), "no widget", "", "")
+    # The studio builds the entry point without arguments
+    usable = [c for c in scan.candidates if not c.required]
+    if not usable:
+        cache[key] = entry
+        first = scan.candidates[0]
+        return BulkResult(str(path), "no entry point", "", f"{first.name} needs {', '.join(first.required)}")
+    best = usable[0]
+    ini_path = path.with_suffix(".ini")
+    if ini_path.exists() and (previous is None or previous["manifest"] != _digest(ini_path)):
+        cache[key] = dict(entry, entry_point=best.name)   # skipped while unchanged, manifest left alone
+        return BulkResult(str(path), "kept", best.name, f"{ini_path.name} was not written by ConfigMaker")
+    text = manifest_text(path.stem, best.name, [c.name for c in scan.candidates if c is not best])
+    ini_path.write_text(text, encoding="utf-8")
+    entry.update(manifest=hashlib.sha1(text.encode("utf-8")).hexdigest(), entry_point=best.name)
+    cache[key] = entry
+    return BulkResult(str(path), "written", best.name, "; ".join(best.reasons))
+
+
+def bulk_report(results: list[BulkResult]) -> str:
+    counts: dict[str, int] = {}
+    lines = []
+    for result in results:
+        counts[result.action] = counts.get(result.action, 0) + 1
+        if result.action in ("written", "kept", "no entry point", "error"):
+            detail = f"  ({result.detail})" if result.detail else ""
+            lines.append(f"{result.action:<14} {result.source} -> {result.entry_point or '-'}{detail}")
+    summary = ", ".join(f"{n} {action}" for action, n in sorted(counts.items()))
+    return "\n".join([summary or "No Python files found", ""] + lines)
+
+
+class BulkWorker(QThread):
+    """Runs bulk_generate() off the GUI thread."""
+
+    progress_update = pyqtSignal(int, int)   # files scanned, files to scan
+    results_ready = pyqtSignal(object)       # list[BulkResult]
+
+    def __init__(self, root: Path, jobs: Optional[int] = None, force: bool = False):
+        super().__init__()
+        self.root = root
+        self.jobs = jobs
+        self.force = force
+
+    def run(self):
+        try:
+            results = bulk_generate(self.root, self.jobs, self.force, self.progress_update.emit)
+        except OSError as e:
+            print(f"[ConfigMaker] Bulk generation failed: {e}")
+            results = [BulkResult(str(self.root), "error", "", str(e))]
+        self.results_ready.emit(results)
 
 
 class ConfigMaker(QWidget):
@@ -29,6 +196,7 @@ class ConfigMaker(QWidget):
 
         self.current_source: Path | None = None
         self.entry_point: str | None = None
+        self.bulk_worker: BulkWorker | None = None
 
         self._build_ui()
         self._connect_signals()
@@ -53,11 +221,15 @@ class ConfigMaker(QWidget):
         self.select_file_btn = QPushButton("📎 Select Python File")
         self.select_file_btn.setObjectName("SelectFileButton")
 
+        self.bulk_btn = QPushButton("🗂 Bulk Generate Folder")
+        self.bulk_btn.setObjectName("BulkButton")
+
         self.save_btn = QPushButton("💾 Save Config")
         self.save_btn.setObjectName("SaveConfigButton")
         self.save_btn.setEnabled(False)
 
         action_layout.addWidget(self.select_file_btn)
+        action_layout.addWidget(self.bulk_btn)
         action_layout.addStretch()              # pushes Save to the right
         action_layout.addWidget(self.save_btn)
 
@@ -73,6 +245,7 @@ class ConfigMaker(QWidget):
 
     def _connect_signals(self):
         self.select_file_btn.clicked.connect(self.select_source_file)
+        self.bulk_btn.clicked.connect(self.select_bulk_folder)
         self.save_btn.clicked.connect(self.save_config)
 
     def _apply_styles(self):
@@ -97,62 +270,78 @@ class ConfigMaker(QWidget):
 
         self.current_source = Path(file_path)
 
-        class_names = self._extract_class_names(self.current_source)
+        candidates = self._extract_candidates(self.current_source)
 
-        if not class_names:
+        if not candidates:
             QMessageBox.critical(
                 self,
                 "Error",
-                "No class definitions found in the selected file."
+                "No QWidget classes found in the selected file."
             )
             return
 
-        if len(class_names) == 1:
-            self.entry_point = class_names[0]
+        if len(candidates) == 1:
+            self.entry_point = candidates[0].name
         else:
-            self.entry_point = self._select_class_popup(class_names)
+            self.entry_point = self._select_class_popup(candidates)
             if not self.entry_point:
                 return
 
         self.config_text.setPlainText(self._build_ini_preview())
         self.save_btn.setEnabled(True)
 
-    def _extract_class_names(self, file_path: Path) -> list[str]:
-        try:
-            tree = ast.parse(file_path.read_text(encoding="utf-8"))
-            return [
-                node.name
-                for node in ast.walk(tree)
-                if isinstance(node, ast.ClassDef)
-            ]
-        except Exception as e:
-            print(e)
-            return []
-
-    def _select_class_popup(self, class_names: list[str]) -> str | None:
+    def _extract_candidates(self, file_path: Path) -> list[Candidate]:
+        """Widget classes of the file (bases resolved through local imports), best entry point first."""
+        scan = scan_file(str(file_path))
+        if scan.error:
+            print(f"[ConfigMaker] {file_path.name}: {scan.error}")
+        return scan.candidates
+
+    def _select_class_popup(self, candidates: list[Candidate]) -> str | None:
+        labels = [f"{c.name}  ({', '.join(c.reasons)})" for c in candidates]
         selected, ok = QInputDialog.getItem(
             self,
             "Select Entry Point",
-            "Multiple classes found.\nSelect entry-point class:",
-            class_names,
+            "Multiple widget classes found (most likely first).\nSelect entry-point class:",
+            labels,
             0,
             False
         )
-        return selected if ok else None
+        return candidates[labels.index(selected)].name if ok else None
 
     def _build_ini_preview(self) -> str:
-        module_name = self.current_source.stem
-        ini_name = f"{module_name}.ini"
-
-        return (
-            f"# {ini_name} (must be same name as Python file)\n"
-            f"# RendererWidget {self.entry_point}\n\n"
-            f"[source]\n"
-            f"module = {module_name}\n"
-            f"entry_point = {self.entry_point}\n"
-            f"description = \n"
+        return manifest_text(self.current_source.stem, self.entry_point)
+
+    def select_bulk_folder(self):
+        folder = QFileDialog.getExistingDirectory(
+            self,
+            "Select Folder to Generate Configs For",
+            str(Path.cwd())
         )
 
+        if not folder:
+            return
+
+        self.current_source = None
+        self.save_btn.setEnabled(False)
+        self.bulk_btn.setEnabled(False)
+        self.select_file_btn.setEnabled(False)
+        self.config_text.setPlainText(f"Scanning {folder}…")
+
+        self.bulk_worker = BulkWorker(Path(folder))
+        self.bulk_worker.progress_update.connect(
+            lambda done, total: self.config_text.setPlainText(f"Scanning {folder}… {done}/{total}")
+        )
+        self.bulk_worker.results_ready.connect(self._bulk_finished)
+        self.bulk_worker.start()
+
+    def _bulk_finished(self, results: list[BulkResult]):
+        self.config_text.setPlainText(bulk_report(results))
+        self.bulk_btn.setEnabled(True)
+        self.select_file_btn.setEnabled(True)
+        self.bulk_worker.wait()
+        self.bulk_worker = None
+
     def save_config(self):
         if not self.current_source:
             return
@@ -170,8 +359,23 @@ class ConfigMaker(QWidget):
         )
 
 
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Config Maker: write source .ini manifests")
+    parser.add_argument("--bulk", metavar="ROOT", type=Path, help="Generate manifests for a whole tree, headless")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="Rescan files unchanged since the last run")
+    args, qt_args = parser.parse_known_args()
+
+    if args.bulk:
+        results = bulk_generate(args.bulk, args.jobs, args.force)
+        print(bulk_report(results))
+        return 1 if any(r.action == "error" for r in results) else 0
+
+    app = QApplication(sys.argv[:1] + qt_args)
     window = ConfigMaker()
     window.show()
-    sys.exit(app.exec())
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())